@@ -0,0 +1 @@
+# Módulo comum - Componentes compartilhados entre os módulos (cache, concorrência)
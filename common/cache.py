@@ -0,0 +1,282 @@
+"""
+Cache de resultados de busca
+LRU limitado em memória com TTL por entrada e stale-while-revalidate: entradas levemente
+vencidas são servidas na hora enquanto uma atualização roda em segundo plano.
+Opcionalmente apoiado por um backend compartilhado entre workers (Redis/SQLite)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import get_config
+from .cache_backends import CacheBackend
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(value: Any) -> Any:
+    """Normaliza strings (caixa e espaços) para que buscas equivalentes tenham a mesma chave"""
+    if isinstance(value, str):
+        return ' '.join(value.lower().split())
+    return value
+
+
+def make_cache_key(namespace: str, fields: Dict[str, Any]) -> str:
+    """
+    Gera a chave de cache de uma busca
+
+    Args:
+        namespace: Tipo de busca (courses, jobs)
+        fields: Campos da requisição que influenciam o resultado
+
+    Returns:
+        Chave estável para os campos normalizados
+    """
+    normalized = {name: _normalize(value) for name, value in fields.items()}
+    digest = hashlib.sha1(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def content_etag(value: Any) -> str:
+    """
+    ETag do conteúdo de um resultado (hash do JSON canônico)
+
+    Calculado uma vez quando o resultado é gerado e guardado junto com ele no cache,
+    para que respostas condicionais (If-None-Match) não precisem serializá-lo de novo.
+    O instante de geração (`timestamp`) não entra no hash: uma busca refeita com o
+    mesmo conteúdo mantém o ETag.
+
+    Args:
+        value: Resultado serializável em JSON
+
+    Returns:
+        Hash hexadecimal do conteúdo
+    """
+    if isinstance(value, dict):
+        value = {key: item for key, item in value.items() if key not in ('timestamp', 'etag')}
+    body = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()[:32]
+
+
+class CacheEntry:
+    """Valor armazenado com o instante de gravação e o TTL"""
+
+    __slots__ = ('value', 'stored_at', 'ttl')
+
+    def __init__(self, value: Any, stored_at: float, ttl: float):
+        self.value = value
+        self.stored_at = stored_at
+        self.ttl = ttl
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.time()) - self.stored_at
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return self.age(now) < self.ttl
+
+    def dumps(self) -> str:
+        return json.dumps({'value': self.value, 'stored_at': self.stored_at, 'ttl': self.ttl})
+
+    @classmethod
+    def loads(cls, raw: str) -> 'CacheEntry':
+        data = json.loads(raw)
+        return cls(data['value'], data['stored_at'], data['ttl'])
+
+
+class SearchCache:
+    """Cache LRU thread-safe com TTL por entrada e atualização em segundo plano"""
+
+    def __init__(self, name: str, max_entries: int, stale_ttl: float,
+                 backend: Optional[Callable[[], Optional[CacheBackend]]] = None):
+        self.name = name
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        # Função que retorna o backend compartilhado do processo (resolvido a cada uso, após o fork)
+        self.backend = backend
+        # Buscas idênticas simultâneas (no processo ou entre workers) compartilham uma execução
+        self.flight = SingleFlight(name, backend=backend)
+
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Retorna a entrada (fresca ou dentro da janela de stale) ou None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.age(now) >= entry.ttl + self.stale_ttl:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None or not entry.is_fresh(now):
+            # Outro worker pode já ter gravado uma versão mais nova no backend compartilhado
+            shared = self._get_shared(key)
+            if shared is not None and (entry is None or shared.stored_at > entry.stored_at):
+                if shared.age(now) < shared.ttl + self.stale_ttl:
+                    self._store_local(key, shared)
+                    entry = shared
+        return entry
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Grava o valor em memória e no backend compartilhado"""
+        entry = CacheEntry(value, time.time(), ttl)
+        self._store_local(key, entry)
+
+        backend = self.backend() if self.backend else None
+        if backend is not None:
+            try:
+                backend.set(self._shared_key(key), entry.dumps(), ttl + self.stale_ttl)
+            except Exception as e:
+                logger.warning(f"Erro ao gravar cache {self.name} no backend compartilhado: {str(e)}")
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: Callable[[Any], float]) -> Any:
+        """
+        Retorna o valor em cache ou carrega da origem
+
+        Entradas vencidas há menos de `stale_ttl` segundos são retornadas imediatamente
+        e atualizadas em segundo plano. Em caso de ausência, chamadas concorrentes com a
+        mesma chave aguardam uma única carga da origem.
+
+        Args:
+            key: Chave gerada por make_cache_key
+            loader: Função que busca o valor na origem
+            ttl: Função que define o TTL (segundos) do valor carregado
+
+        Returns:
+            Valor em cache ou recém-carregado
+        """
+        entry = self.get(key)
+        if entry is not None:
+            if not entry.is_fresh():
+                self._schedule_refresh(key, loader, ttl)
+            return entry.value
+
+        return self.flight.do(key, lambda: self._load(key, loader, ttl), lookup=lambda: self._get_fresh(key))
+
+    def refresh(self, key: str, loader: Callable[[], Any], ttl: Callable[[Any], float]) -> Any:
+        """
+        Recarrega o valor da origem agora, mesmo que a entrada ainda esteja fresca
+
+        Cargas simultâneas da mesma chave (no processo ou entre workers) são coalescidas.
+
+        Args:
+            key: Chave gerada por make_cache_key
+            loader: Função que busca o valor na origem
+            ttl: Função que define o TTL (segundos) do valor carregado
+
+        Returns:
+            Valor recarregado
+        """
+        return self.flight.do(key, lambda: self._load(key, loader, ttl), lookup=lambda: self._get_fresh(key))
+
+    def remaining_ttl(self, key: str) -> Optional[float]:
+        """Segundos até a entrada vencer (negativo se já vencida), considerando o backend compartilhado, ou None se ausente"""
+        now = time.time()
+        with self._lock:
+            local = self._entries.get(key)
+        remaining = [entry.ttl - entry.age(now) for entry in (local, self._get_shared(key)) if entry is not None]
+        return max(remaining) if remaining else None
+
+    def clear(self):
+        """Remove todas as entradas em memória"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store_local(self, key: str, entry: CacheEntry):
+        """Grava a entrada em memória, descartando as menos usadas acima do limite"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, key: str, loader: Callable[[], Any], ttl: Callable[[Any], float]) -> Any:
+        """Carrega da origem e grava no cache"""
+        value = loader()
+        self.set(key, value, ttl(value))
+        return value
+
+    def _get_fresh(self, key: str) -> Any:
+        """Valor ainda fresco (gravado por outro worker), ou None"""
+        entry = self.get(key)
+        return entry.value if entry is not None and entry.is_fresh() else None
+
+    def _get_shared(self, key: str) -> Optional[CacheEntry]:
+        """Lê a entrada do backend compartilhado, ignorando falhas do backend"""
+        backend = self.backend() if self.backend else None
+        if backend is None:
+            return None
+        try:
+            raw = backend.get(self._shared_key(key))
+            return CacheEntry.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Erro ao ler cache {self.name} do backend compartilhado: {str(e)}")
+            return None
+
+    def _shared_key(self, key: str) -> str:
+        return f"cache:{key}"
+
+    def _schedule_refresh(self, key: str, loader: Callable[[], Any], ttl: Callable[[Any], float]):
+        """Agenda uma única atualização em segundo plano por chave"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                # Evita que vários workers atualizem a mesma entrada ao mesmo tempo
+                self.flight.do(key, lambda: self._load(key, loader, ttl), lookup=lambda: self._get_fresh(key))
+                logger.debug(f"Cache {self.name}: entrada {key} atualizada em segundo plano")
+            except Exception as e:
+                logger.error(f"Erro ao atualizar cache {self.name} ({key}): {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        try:
+            _get_refresh_executor().submit(refresh)
+        except RuntimeError as e:
+            # Executor encerrado (worker saindo): manter a entrada antiga
+            with self._lock:
+                self._refreshing.discard(key)
+            logger.warning(f"Atualização do cache {self.name} não agendada: {str(e)}")
+
+
+_refresh_executor = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Executor compartilhado pelas atualizações em segundo plano"""
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _refresh_executor_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=get_config().CACHE_REFRESH_WORKERS,
+                    thread_name_prefix='cache-refresh'
+                )
+    return _refresh_executor
+
+
+def shutdown_refresh_executor():
+    """Encerra o executor de atualizações do processo (chamado no encerramento do worker)"""
+    global _refresh_executor
+    with _refresh_executor_lock:
+        executor, _refresh_executor = _refresh_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
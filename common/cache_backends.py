@@ -0,0 +1,318 @@
+"""
+Backends de cache compartilhados entre workers
+Permitem que um resultado obtido por um worker do gunicorn sirva todos os outros
+e sobreviva à reciclagem dos workers (max_requests)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+from config.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """Interface de armazenamento chave/valor com expiração"""
+
+    def get(self, key: str) -> Optional[str]:
+        """Retorna o valor ou None se ausente/expirado"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, ttl: float):
+        """Grava o valor com expiração em `ttl` segundos"""
+        raise NotImplementedError
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        """Grava o valor apenas se a chave não existir; retorna True se gravou"""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """Remove a chave"""
+        raise NotImplementedError
+
+    def take_tokens(self, key: str, rate: float, capacity: float, tokens: float) -> float:
+        """
+        Consome tokens de um token bucket de forma atômica entre workers
+
+        Args:
+            key: Chave do bucket
+            rate: Tokens repostos por segundo
+            capacity: Máximo de tokens acumulados
+            tokens: Tokens a consumir
+
+        Returns:
+            0 se os tokens foram consumidos, senão os segundos até haver tokens suficientes
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Libera conexões"""
+
+
+class RedisBackend(CacheBackend):
+    """Backend Redis, compartilhado entre workers e nós"""
+
+    # Token bucket atômico; o relógio é o do Redis para que todos os nós concordem
+    TAKE_TOKENS_SCRIPT = """
+    local rate = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local tokens = tonumber(ARGV[3])
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local available = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    available = math.min(capacity, available + math.max(0, now - ts) * rate)
+    local wait = 0
+    if available >= tokens then
+        available = available - tokens
+    else
+        wait = (tokens - available) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(available), 'ts', tostring(now))
+    redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str, prefix: str):
+        import redis
+
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+        self._take_tokens = self.client.register_script(self.TAKE_TOKENS_SCRIPT)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.prefix + key)
+        return value.decode() if value is not None else None
+
+    def set(self, key: str, value: str, ttl: float):
+        self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        return bool(self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)), nx=True))
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def take_tokens(self, key: str, rate: float, capacity: float, tokens: float) -> float:
+        return float(self._take_tokens(keys=[self.prefix + key], args=[rate, capacity, tokens]))
+
+    def close(self):
+        self.client.close()
+
+
+class SQLiteBackend(CacheBackend):
+    """Backend em arquivo SQLite local, compartilhado pelos workers do mesmo nó"""
+
+    # Remover entradas expiradas a cada N gravações
+    PURGE_EVERY = 100
+
+    def __init__(self, path: str, prefix: str):
+        self.path = path
+        self.prefix = prefix
+        self._local = threading.local()
+        self._writes = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' expires_at REAL NOT NULL'
+            ')'
+        )
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS buckets ('
+            ' key TEXT PRIMARY KEY,'
+            ' tokens REAL NOT NULL,'
+            ' updated_at REAL NOT NULL'
+            ')'
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Conexão da thread atual (conexões SQLite não devem ser compartilhadas entre threads)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('PRAGMA mmap_size=67108864')
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._connection().execute(
+            'SELECT value FROM cache WHERE key = ? AND expires_at > ?',
+            (self.prefix + key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: float):
+        connection = self._connection()
+        connection.execute(
+            'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+            (self.prefix + key, value, time.time() + ttl)
+        )
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            connection.execute('DELETE FROM cache WHERE expires_at <= ?', (time.time(),))
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        now = time.time()
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute('DELETE FROM cache WHERE key = ? AND expires_at <= ?', (self.prefix + key, now))
+            cursor = connection.execute(
+                'INSERT OR IGNORE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                (self.prefix + key, value, now + ttl)
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        return cursor.rowcount == 1
+
+    def delete(self, key: str):
+        self._connection().execute('DELETE FROM cache WHERE key = ?', (self.prefix + key,))
+
+    def take_tokens(self, key: str, rate: float, capacity: float, tokens: float) -> float:
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            row = connection.execute(
+                'SELECT tokens, updated_at FROM buckets WHERE key = ?', (self.prefix + key,)
+            ).fetchone()
+            available = capacity if row is None else min(capacity, row[0] + max(0.0, now - row[1]) * rate)
+            wait = 0.0
+            if available >= tokens:
+                available -= tokens
+            else:
+                wait = (tokens - available) / rate
+            connection.execute(
+                'INSERT OR REPLACE INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?)',
+                (self.prefix + key, available, now)
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        return wait
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def create_backend(url: str, prefix: str = '') -> Optional[CacheBackend]:
+    """
+    Cria o backend a partir da URL de configuração
+
+    Args:
+        url: redis://host:porta/db, sqlite:///caminho/relativo.db ou sqlite:////caminho/absoluto.db
+        prefix: Prefixo aplicado a todas as chaves
+
+    Returns:
+        Backend configurado ou None se a URL estiver vazia
+    """
+    if not url:
+        return None
+
+    scheme = urlparse(url).scheme
+    if scheme in ('redis', 'rediss', 'unix'):
+        return RedisBackend(url, prefix)
+    if scheme == 'sqlite':
+        return SQLiteBackend(url[len('sqlite:///'):], prefix)
+
+    raise ValueError(f"Backend de cache não suportado: {url}")
+
+
+_backend: Optional[CacheBackend] = None
+_backend_pid = None
+_backend_lock = threading.Lock()
+
+
+def get_shared_backend() -> Optional[CacheBackend]:
+    """Retorna o backend compartilhado configurado em CACHE_BACKEND_URL (um por processo)"""
+    global _backend, _backend_pid
+    if _backend_pid != os.getpid():
+        with _backend_lock:
+            if _backend_pid != os.getpid():
+                config = get_config()
+                try:
+                    _backend = create_backend(config.CACHE_BACKEND_URL, config.CACHE_KEY_PREFIX)
+                except Exception as e:
+                    logger.error(f"Erro ao configurar backend de cache compartilhado: {str(e)}")
+                    _backend = None
+                _backend_pid = os.getpid()
+    return _backend
+
+
+def close_shared_backend():
+    """Fecha o backend compartilhado do processo"""
+    global _backend, _backend_pid
+    with _backend_lock:
+        if _backend is not None and _backend_pid == os.getpid():
+            try:
+                _backend.close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar backend de cache: {str(e)}")
+        _backend = None
+        _backend_pid = None
+
+
+_coordination: Optional[CacheBackend] = None
+_coordination_pid = None
+
+
+def get_coordination_backend() -> Optional[CacheBackend]:
+    """
+    Retorna o backend usado para coordenar os workers (ex: rate limit de saída)
+
+    Sem CACHE_BACKEND_URL o cache continua só em memória, mas a coordenação usa um
+    SQLite local em COORDINATION_DB_PATH para que os limites valham para o nó inteiro,
+    e não para cada worker.
+
+    Returns:
+        Backend compartilhado, o SQLite local ou None se nenhum puder ser aberto
+    """
+    global _coordination, _coordination_pid
+    backend = get_shared_backend()
+    if backend is not None:
+        return backend
+
+    if _coordination_pid != os.getpid():
+        with _backend_lock:
+            if _coordination_pid != os.getpid():
+                config = get_config()
+                try:
+                    _coordination = SQLiteBackend(config.COORDINATION_DB_PATH, config.CACHE_KEY_PREFIX)
+                except Exception as e:
+                    logger.warning(f"Backend de coordenação indisponível, limites valem por worker: {str(e)}")
+                    _coordination = None
+                _coordination_pid = os.getpid()
+    return _coordination
+
+
+def close_coordination_backend():
+    """Fecha o SQLite local de coordenação do processo"""
+    global _coordination, _coordination_pid
+    with _backend_lock:
+        if _coordination is not None and _coordination_pid == os.getpid():
+            try:
+                _coordination.close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar backend de coordenação: {str(e)}")
+        _coordination = None
+        _coordination_pid = None
@@ -0,0 +1,179 @@
+"""
+Cursores de paginação opacos
+A posição de uma busca em cada plataforma vai para o cliente em um token assinado com
+HMAC (next_cursor); a página seguinte parte dessa posição, sem estado no servidor e sem
+refazer as páginas anteriores a ela. Cursores adulterados ou de outra busca são recusados.
+Dados grandes demais para o token (ex.: cursos já buscados e ainda não entregues) ficam
+no backend de coordenação, referenciados no cursor por um ID aleatório.
+Sem CURSOR_SECRET próprio (vazio ou com valor de exemplo) a paginação fica desligada:
+com um segredo público qualquer cliente forjaria cursores.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+from config.settings import get_config, is_placeholder_secret
+
+from .cache_backends import get_coordination_backend
+
+logger = logging.getLogger(__name__)
+
+_warned = False
+
+
+class InvalidCursor(ValueError):
+    """Cursor malformado, com assinatura inválida ou emitido para outra busca"""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def cursors_enabled() -> bool:
+    """Indica se há um CURSOR_SECRET real para assinar os cursores"""
+    global _warned
+    if not is_placeholder_secret(get_config().CURSOR_SECRET):
+        return True
+    if not _warned:
+        _warned = True
+        logger.warning("CURSOR_SECRET ausente ou com valor de exemplo; paginação por cursor desabilitada")
+    return False
+
+
+def _signature(body: str) -> str:
+    key = get_config().CURSOR_SECRET.encode()
+    return _b64encode(hmac.new(key, body.encode(), hashlib.sha256).digest()[:16])
+
+
+def encode_cursor(search_key: str, state: Dict[str, Any]) -> Optional[str]:
+    """
+    Gera o cursor da próxima página
+
+    Args:
+        search_key: Chave da busca (ex.: chave de cache); o cursor só vale para ela
+        state: Posição da busca (serializável em JSON)
+
+    Returns:
+        Token opaco, seguro para URLs, ou None se a paginação estiver desabilitada
+    """
+    if not cursors_enabled():
+        return None
+    body = _b64encode(json.dumps({'k': search_key, 's': state}, separators=(',', ':')).encode())
+    return f"{body}.{_signature(body)}"
+
+
+def decode_cursor(cursor: str, search_key: str) -> Dict[str, Any]:
+    """
+    Valida o cursor e retorna a posição da busca
+
+    Args:
+        cursor: Token recebido do cliente
+        search_key: Chave da busca atual
+
+    Returns:
+        Posição gravada por encode_cursor
+
+    Raises:
+        InvalidCursor: Se o cursor estiver malformado, adulterado, for de outra busca ou
+            se a paginação estiver desabilitada
+    """
+    if not cursors_enabled():
+        raise InvalidCursor('Paginação por cursor desabilitada')
+    body, _, signature = (cursor or '').partition('.')
+    if not body or not hmac.compare_digest(signature.encode(), _signature(body).encode()):
+        raise InvalidCursor('Cursor inválido')
+
+    try:
+        payload = json.loads(_b64decode(body))
+    except ValueError:
+        raise InvalidCursor('Cursor inválido')
+
+    if payload.get('k') != search_key:
+        raise InvalidCursor('Cursor não pertence a esta busca')
+    return payload['s']
+
+
+def pack_positions(positions: Iterable[int]) -> str:
+    """
+    Representação compacta de um conjunto de posições para gravar no cursor
+
+    Args:
+        positions: Posições (inteiros não negativos)
+
+    Returns:
+        "<menor posição>:<máscara de bits em hexadecimal>", ou "" se o conjunto é vazio
+    """
+    positions = set(positions)
+    if not positions:
+        return ''
+    base = min(positions)
+    mask = sum(1 << (position - base) for position in positions)
+    return f"{base}:{mask:x}"
+
+
+def unpack_positions(packed: str) -> List[int]:
+    """
+    Posições gravadas por pack_positions, em ordem crescente
+
+    Raises:
+        InvalidCursor: Se o texto estiver malformado
+    """
+    if not packed:
+        return []
+    try:
+        base, mask = packed.split(':')
+        base, mask = int(base), int(mask, 16)
+    except (AttributeError, ValueError):
+        raise InvalidCursor('Cursor inválido')
+    return [base + offset for offset in range(mask.bit_length()) if mask >> offset & 1]
+
+def save_cursor_payload(payload: Any) -> Optional[str]:
+    """
+    Guarda dados da próxima página no backend de coordenação
+
+    Args:
+        payload: Dados serializáveis em JSON
+
+    Returns:
+        ID a gravar no cursor, ou None se não há backend ou a gravação falhou
+    """
+    backend = get_coordination_backend()
+    if backend is None:
+        return None
+    payload_id = uuid.uuid4().hex[:16]
+    try:
+        backend.set(f"cursor:{payload_id}", json.dumps(payload, default=str), get_config().CURSOR_PAYLOAD_TTL)
+    except Exception as e:
+        logger.warning(f"Erro ao gravar dados do cursor: {str(e)}")
+        return None
+    return payload_id
+
+
+def load_cursor_payload(payload_id: str) -> Optional[Any]:
+    """
+    Recupera os dados gravados por save_cursor_payload
+
+    Args:
+        payload_id: ID gravado no cursor
+
+    Returns:
+        Dados da próxima página, ou None se expiraram ou não estão neste nó
+    """
+    backend = get_coordination_backend()
+    if backend is None:
+        return None
+    try:
+        raw = backend.get(f"cursor:{payload_id}")
+        return json.loads(raw) if raw is not None else None
+    except Exception as e:
+        logger.warning(f"Erro ao ler dados do cursor: {str(e)}")
+        return None
@@ -0,0 +1,100 @@
+"""
+Ciclo de vida dos serviços da aplicação
+Os serviços (e os scrapers, sessões e drivers que eles usam) são criados uma vez por
+processo e reutilizados entre requisições. O encerramento é explícito: o servidor
+chama shutdown() ao sair do worker, em vez de depender de __del__.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceRegistry:
+    """Serviços do processo, criados sob demanda e encerrados em ordem"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._services: Dict[str, Any] = {}
+        self._shutdown_hooks: List[Callable[[], None]] = []
+        self._pid: Optional[int] = None
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """
+        Registra a fábrica de um serviço
+
+        Args:
+            name: Nome usado em get()
+            factory: Função sem argumentos que cria o serviço
+        """
+        self._factories[name] = factory
+
+    def on_shutdown(self, hook: Callable[[], None]):
+        """Registra um recurso do processo a liberar no shutdown, após os serviços"""
+        self._shutdown_hooks.append(hook)
+
+    def get(self, name: str) -> Any:
+        """
+        Retorna o serviço do processo, criando-o no primeiro uso
+
+        Serviços criados antes do fork (gunicorn com preload_app) não são reutilizados
+        pelos workers: cada processo cria os seus.
+
+        Raises:
+            KeyError: Se o serviço não foi registrado
+        """
+        service = self._services.get(name)
+        if service is not None and self._pid == os.getpid():
+            return service
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # Processo filho: descartar as referências herdadas sem encerrá-las
+                self._services.clear()
+                self._pid = os.getpid()
+
+            service = self._services.get(name)
+            if service is None:
+                service = self._factories[name]()
+                self._services[name] = service
+                logger.info(f"Serviço '{name}' criado no processo {self._pid}")
+            return service
+
+    def startup(self):
+        """Cria todos os serviços registrados (aquecimento do worker antes da primeira requisição)"""
+        for name in self._factories:
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.error(f"Erro ao iniciar serviço '{name}': {str(e)}")
+
+    def shutdown(self):
+        """Encerra os serviços e os recursos do processo, na ordem inversa de criação"""
+        with self._lock:
+            if self._pid == os.getpid():
+                services = list(self._services.items())
+            else:
+                services = []
+            self._services.clear()
+            self._pid = None
+
+        for name, service in reversed(services):
+            close = getattr(service, 'close', None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.error(f"Erro ao encerrar serviço '{name}': {str(e)}")
+
+        for hook in reversed(self._shutdown_hooks):
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"Erro ao liberar recurso no shutdown: {str(e)}")
+
+        logger.info(f"Serviços do processo {os.getpid()} encerrados")
@@ -0,0 +1,145 @@
+"""
+Pré-aquecimento do cache de buscas
+Uma thread por worker consulta periodicamente o registro de buscas (common/query_log.py)
+e atualiza as mais frequentes antes que vençam, dentro de um orçamento de buscas nas
+plataformas compartilhado entre workers. Buscas populares deixam de pagar a latência
+do scraping na requisição.
+"""
+
+import logging
+import random
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import get_config
+from scrapers.rate_limiter import HostRateLimiter
+from .cache import SearchCache
+from .cache_backends import get_shared_backend
+from .query_log import QueryLog
+
+logger = logging.getLogger(__name__)
+
+
+class PrewarmSource:
+    """Buscas de um serviço candidatas ao pré-aquecimento"""
+
+    def __init__(self, name: str, log: QueryLog, cache: SearchCache,
+                 loader: Callable[[Dict[str, Any]], Any],
+                 ttl: Callable[[Dict[str, Any], Any], float]):
+        self.name = name
+        self.log = log
+        self.cache = cache
+        # Refaz a busca nas plataformas a partir dos parâmetros registrados
+        self.loader = loader
+        # TTL do resultado recarregado
+        self.ttl = ttl
+
+
+class PrewarmCrawler:
+    """Atualiza em segundo plano as buscas mais frequentes que estão para vencer"""
+
+    def __init__(self, sources: List[PrewarmSource], top_n: int, interval: float, lead_time: float,
+                 budget: Callable[[], bool]):
+        self.sources = sources
+        self.top_n = top_n
+        self.interval = interval
+        # Atualizar entradas que vencem em menos de `lead_time` segundos
+        self.lead_time = lead_time
+        # Retorna True se ainda há orçamento para uma busca nas plataformas
+        self.budget = budget
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        """
+        Executa uma rodada de pré-aquecimento
+
+        Returns:
+            Número de buscas atualizadas
+        """
+        candidates = [
+            (score, source, key, params)
+            for source in self.sources
+            for key, params, score in source.log.top(self.top_n)
+        ]
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        refreshed = 0
+        for _, source, key, params in candidates[:self.top_n]:
+            if self._stop.is_set():
+                break
+
+            remaining = source.cache.remaining_ttl(key)
+            if remaining is not None and remaining > self.lead_time:
+                continue
+
+            if not self.budget():
+                logger.info(f"Pré-aquecimento: orçamento de buscas esgotado após {refreshed} atualização(ões)")
+                break
+
+            try:
+                source.cache.refresh(key, lambda: source.loader(params), lambda value: source.ttl(params, value))
+                refreshed += 1
+            except Exception as e:
+                logger.warning(f"Pré-aquecimento de {source.name} ({key}) falhou: {str(e)}")
+
+        if refreshed:
+            logger.info(f"Pré-aquecimento: {refreshed} busca(s) atualizada(s)")
+        return refreshed
+
+    def start(self):
+        """Inicia a thread de pré-aquecimento do processo"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='prewarm', daemon=True)
+        self._thread.start()
+
+    def close(self, timeout: float = 5):
+        """Interrompe a thread (chamado no encerramento do worker)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        # Atraso inicial aleatório: workers iniciados juntos não fazem as rodadas ao mesmo tempo
+        delay = random.uniform(0, self.interval)
+        while not self._stop.wait(delay):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Erro no pré-aquecimento: {str(e)}")
+            delay = self.interval
+
+
+def create_prewarm_crawler(sources: List[PrewarmSource]) -> PrewarmCrawler:
+    """
+    Cria o pré-aquecimento a partir das configurações, iniciando a thread se habilitado
+
+    Args:
+        sources: Buscas dos serviços (ex.: CourseService.prewarm_source())
+
+    Returns:
+        Crawler do processo
+    """
+    config = get_config()
+    # Orçamento compartilhado entre workers pelo backend (ou por worker, sem backend)
+    budget = HostRateLimiter(
+        'prewarm',
+        rate=config.PREWARM_BUDGET_PER_HOUR / 3600,
+        capacity=config.PREWARM_BUDGET_BURST,
+        max_waiters=0,
+        backend=get_shared_backend
+    )
+    crawler = PrewarmCrawler(
+        sources,
+        top_n=config.PREWARM_TOP_N,
+        interval=config.PREWARM_INTERVAL,
+        lead_time=config.PREWARM_LEAD_TIME,
+        budget=lambda: budget.try_acquire() == 0
+    )
+    if config.PREWARM_ENABLED and config.CACHE_ENABLED:
+        crawler.start()
+    return crawler
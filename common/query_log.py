@@ -0,0 +1,73 @@
+"""
+Registro das buscas recentes
+Cada serviço anota as buscas que recebe; a frequência decai exponencialmente com o
+tempo, de modo que o topo da lista reflete o que está sendo buscado agora. Usado pelo
+pré-aquecimento (common/prewarm.py) para escolher o que atualizar antes de vencer.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+
+class QueryLog:
+    """Frequência recente das buscas do processo, com decaimento exponencial"""
+
+    def __init__(self, name: str, max_queries: int, half_life: float):
+        self.name = name
+        self.max_queries = max_queries
+        self.half_life = half_life
+
+        # Chave de cache -> [pontuação, instante da pontuação, parâmetros da busca]
+        self._queries: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, params: Dict[str, Any]):
+        """
+        Anota uma busca
+
+        Args:
+            key: Chave de cache da busca
+            params: Parâmetros suficientes para repetir a busca
+        """
+        now = time.time()
+        with self._lock:
+            item = self._queries.get(key)
+            if item is None:
+                self._queries[key] = [1.0, now, params]
+            else:
+                item[0] = self._decayed(item, now) + 1
+                item[1] = now
+                item[2] = params
+
+            # Folga de 25% para não podar a cada busca nova
+            if len(self._queries) > self.max_queries * 1.25:
+                self._prune(now)
+
+    def top(self, n: int) -> List[Tuple[str, Dict[str, Any], float]]:
+        """
+        Buscas mais frequentes
+
+        Args:
+            n: Número de buscas
+
+        Returns:
+            Tuplas (chave, parâmetros, pontuação), da mais para a menos frequente
+        """
+        now = time.time()
+        with self._lock:
+            scored = [(key, item[2], self._decayed(item, now)) for key, item in self._queries.items()]
+        scored.sort(key=lambda entry: entry[2], reverse=True)
+        return scored[:n]
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def _decayed(self, item: List[Any], now: float) -> float:
+        return item[0] * 0.5 ** ((now - item[1]) / self.half_life)
+
+    def _prune(self, now: float):
+        """Mantém as `max_queries` buscas mais frequentes (chamado com o lock adquirido)"""
+        ranked = sorted(self._queries, key=lambda key: self._decayed(self._queries[key], now), reverse=True)
+        for key in ranked[self.max_queries:]:
+            del self._queries[key]
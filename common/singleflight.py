@@ -0,0 +1,141 @@
+"""
+Coalescência de chamadas idênticas em andamento (single-flight)
+Chamadas concorrentes com a mesma chave esperam uma única execução e compartilham
+o resultado. Entre workers, a coordenação usa um lock no backend compartilhado.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import get_config
+from .cache_backends import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """Execução em andamento aguardada pelas demais chamadas do processo"""
+
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Garante uma única execução por chave em andamento, no processo e entre workers"""
+
+    def __init__(self, name: str, backend: Optional[Callable[[], Optional[CacheBackend]]] = None):
+        config = get_config()
+        self.name = name
+        # Função que retorna o backend compartilhado do processo (resolvido a cada uso, após o fork)
+        self.backend = backend if config.SINGLE_FLIGHT_CROSS_WORKER else None
+        self.lock_ttl = config.SINGLE_FLIGHT_LOCK_TTL
+        self.wait_timeout = config.SINGLE_FLIGHT_WAIT_TIMEOUT
+        self.poll_interval = config.SINGLE_FLIGHT_POLL_INTERVAL
+
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any], lookup: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Executa `fn` uma única vez para chamadas concorrentes com a mesma chave
+
+        Args:
+            key: Chave da chamada (ex.: chave de cache da busca)
+            fn: Função que busca o valor na origem
+            lookup: Função que retorna o valor publicado por outro worker (ou None).
+                Sem ela, a coordenação fica restrita ao processo.
+
+        Returns:
+            Valor retornado por `fn` (desta ou de outra chamada)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            logger.debug(f"Single-flight {self.name}: aguardando execução em andamento de {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._run(key, fn, lookup)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.waiters:
+                logger.info(f"Single-flight {self.name}: {call.waiters} chamadas compartilharam {key}")
+
+    def in_flight(self) -> int:
+        """Número de chaves em execução no processo"""
+        with self._lock:
+            return len(self._calls)
+
+    def _run(self, key: str, fn: Callable[[], Any], lookup: Optional[Callable[[], Any]]) -> Any:
+        """Executa `fn` ou, se outro worker já estiver executando, aguarda o valor publicado"""
+        backend = self.backend() if self.backend and lookup else None
+        if backend is None:
+            return fn()
+
+        lock_key = f"flight:{key}"
+        token = f"{os.getpid()}:{uuid.uuid4().hex}"
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            try:
+                acquired = backend.add(lock_key, token, self.lock_ttl)
+            except Exception as e:
+                logger.warning(f"Single-flight {self.name}: backend indisponível, executando localmente: {str(e)}")
+                return fn()
+
+            if acquired:
+                try:
+                    return fn()
+                finally:
+                    self._release(backend, lock_key, token)
+
+            # Outro worker está buscando: aguardar o resultado dele no cache compartilhado
+            while time.monotonic() < deadline:
+                time.sleep(self.poll_interval)
+                value = lookup()
+                if value is not None:
+                    return value
+                if not self._is_locked(backend, lock_key):
+                    # Lock liberado sem resultado (erro ou worker encerrado): tentar assumir
+                    break
+            else:
+                logger.warning(f"Single-flight {self.name}: tempo de espera esgotado para {key}, executando localmente")
+                return fn()
+
+    def _is_locked(self, backend: CacheBackend, lock_key: str) -> bool:
+        try:
+            return backend.get(lock_key) is not None
+        except Exception:
+            return False
+
+    def _release(self, backend: CacheBackend, lock_key: str, token: str):
+        """Libera o lock se ainda pertencer a esta execução"""
+        try:
+            if backend.get(lock_key) == token:
+                backend.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"Single-flight {self.name}: erro ao liberar lock {lock_key}: {str(e)}")
@@ -0,0 +1,215 @@
+"""
+Execução de tarefas em segundo plano
+Operações longas (ex.: busca de vagas com o Chrome) rodam em um executor limitado
+enquanto o cliente consulta o andamento pelo ID da tarefa. O estado é gravado no
+backend compartilhado para que qualquer worker responda a consulta.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .cache_backends import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+FINISHED = (SUCCEEDED, FAILED)
+
+
+class TaskQueueFull(Exception):
+    """Limite de tarefas em andamento atingido no worker"""
+
+
+class TaskManager:
+    """Executor limitado de tarefas com estado consultável por ID"""
+
+    def __init__(self, name: str, max_workers: int, max_pending: int, result_ttl: float,
+                 poll_interval: float = 0.25,
+                 backend: Optional[Callable[[], Optional[CacheBackend]]] = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        # Função que retorna o backend compartilhado do processo (resolvido a cada uso, após o fork)
+        self.backend = backend
+
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[[], Any]) -> Dict[str, Any]:
+        """
+        Agenda uma tarefa
+
+        Args:
+            fn: Função sem argumentos cujo retorno (serializável em JSON) é o resultado
+
+        Returns:
+            Estado inicial da tarefa
+
+        Raises:
+            TaskQueueFull: Se o worker já tem `max_pending` tarefas em andamento
+        """
+        task_id = uuid.uuid4().hex
+        task = {
+            'task_id': task_id,
+            'status': PENDING,
+            'created_at': time.time(),
+            'finished_at': None,
+            'result': None,
+            'error': None
+        }
+
+        with self._lock:
+            executor = self._get_executor()
+            self._purge_expired()
+            active = sum(1 for future in self._futures.values() if not future.done())
+            if active >= self.max_pending:
+                raise TaskQueueFull(f"{active} tarefas {self.name} em andamento")
+            self._tasks[task_id] = task
+            self._save(task)
+            self._futures[task_id] = executor.submit(self._run, task_id, fn)
+
+        logger.info(f"Tarefa {self.name} {task_id} agendada")
+        return dict(task)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Estado atual da tarefa (deste ou de outro worker), ou None se desconhecida/expirada"""
+        with self._lock:
+            self._purge_expired()
+            task = self._tasks.get(task_id)
+            if task is not None:
+                return dict(task)
+        return self._load(task_id)
+
+    def wait(self, task_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Aguarda a conclusão da tarefa por até `timeout` segundos (long-poll)
+
+        Args:
+            task_id: ID retornado por submit
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            Estado da tarefa ao concluir ou ao fim da espera, ou None se desconhecida
+        """
+        with self._lock:
+            future = self._futures.get(task_id)
+
+        if future is not None:
+            # Tarefa deste worker: aguardar o próprio future
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+            return self.get(task_id)
+
+        # Tarefa de outro worker: consultar o backend até concluir
+        deadline = time.monotonic() + timeout
+        task = self.get(task_id)
+        while task is not None and task['status'] not in FINISHED and time.monotonic() < deadline:
+            time.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+            task = self.get(task_id)
+        return task
+
+    def shared(self) -> bool:
+        """Indica se o estado das tarefas é publicado para os outros workers"""
+        return (self.backend() if self.backend else None) is not None
+
+    def stats(self) -> Dict[str, int]:
+        """Contagem das tarefas conhecidas pelo worker, por status"""
+        with self._lock:
+            counts = {PENDING: 0, RUNNING: 0, SUCCEEDED: 0, FAILED: 0}
+            for task in self._tasks.values():
+                counts[task['status']] += 1
+            return counts
+
+    def shutdown(self, wait: bool = False):
+        """Encerra o executor do processo"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            owned = self._executor_pid == os.getpid()
+        if executor is not None and owned:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, task_id: str, fn: Callable[[], Any]):
+        self._update(task_id, status=RUNNING)
+        try:
+            result = fn()
+        except Exception as e:
+            logger.error(f"Tarefa {self.name} {task_id} falhou: {str(e)}")
+            self._update(task_id, status=FAILED, error=str(e), finished_at=time.time())
+            return
+        self._update(task_id, status=SUCCEEDED, result=result, finished_at=time.time())
+        logger.info(f"Tarefa {self.name} {task_id} concluída")
+
+    def _update(self, task_id: str, **fields):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return
+            task.update(fields)
+            self._save(task)
+
+    def _save(self, task: Dict[str, Any]):
+        """Publica o estado no backend compartilhado (chamado com o lock adquirido)"""
+        backend = self.backend() if self.backend else None
+        if backend is None:
+            return
+        try:
+            backend.set(self._key(task['task_id']), json.dumps(task), self.result_ttl)
+        except Exception as e:
+            logger.warning(f"Erro ao gravar tarefa {self.name} no backend compartilhado: {str(e)}")
+
+    def _load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        backend = self.backend() if self.backend else None
+        if backend is None:
+            return None
+        try:
+            raw = backend.get(self._key(task_id))
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Erro ao ler tarefa {self.name} do backend compartilhado: {str(e)}")
+            return None
+
+    def _key(self, task_id: str) -> str:
+        return f"task:{self.name}:{task_id}"
+
+    def _purge_expired(self):
+        """Remove da memória tarefas concluídas há mais de `result_ttl` (chamado com o lock adquirido)"""
+        now = time.time()
+        expired = [
+            task_id for task_id, task in self._tasks.items()
+            if task['finished_at'] is not None and now - task['finished_at'] >= self.result_ttl
+        ]
+        for task_id in expired:
+            del self._tasks[task_id]
+            self._futures.pop(task_id, None)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Executor do processo, recriado após o fork (chamado com o lock adquirido)"""
+        if self._executor_pid != os.getpid():
+            # Tarefas herdadas do processo pai não rodam neste processo
+            self._tasks.clear()
+            self._futures.clear()
+            self._executor = None
+            self._executor_pid = os.getpid()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"task-{self.name}"
+            )
+        return self._executor
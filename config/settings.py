@@ -5,6 +5,25 @@ Configurações centralizadas da aplicação
 import os
 from typing import List
 
+# Segredos de exemplo (padrão do código e de config/env.example): não protegem nada
+PLACEHOLDER_SECRETS = frozenset({
+    '',
+    'your-super-secret-key-change-this-in-production',
+    'troque-esta-chave'
+})
+
+def is_placeholder_secret(secret: str) -> bool:
+    """
+    Indica se o segredo está vazio ou é um dos valores de exemplo públicos
+    
+    Args:
+        secret: Valor configurado
+        
+    Returns:
+        True se o segredo não pode ser usado para criptografar ou assinar dados
+    """
+    return (secret or '').strip() in PLACEHOLDER_SECRETS
+
 class Config:
     """Configuração base"""
     
@@ -28,10 +47,120 @@ class Config:
     SCRAPER_RETRY_ATTEMPTS = 3
     SCRAPER_DELAY_BETWEEN_REQUESTS = 1  # segundos
     
+    # Busca concorrente de cursos: prazo máximo (segundos) de cada plataforma
+    COURSE_PLATFORM_TIMEOUTS = {
+        'udemy': float(os.getenv('UDEMY_SEARCH_TIMEOUT', 15)),
+        'coursera': float(os.getenv('COURSERA_SEARCH_TIMEOUT', 10)),
+        'edx': float(os.getenv('EDX_SEARCH_TIMEOUT', 10))
+    }
+    # Requisições simultâneas por worker do gunicorn (threads do gthread); cada busca usa uma thread por plataforma
+    WORKER_THREADS = int(os.getenv('GUNICORN_THREADS', 8))
+    COURSE_SEARCH_MAX_WORKERS = int(os.getenv('COURSE_SEARCH_MAX_WORKERS', max(8, 3 * WORKER_THREADS)))
+    # Busca de cursos em lote (POST /api/v1/courses/batch)
+    COURSE_BATCH_MAX_ITEMS = int(os.getenv('COURSE_BATCH_MAX_ITEMS', 20))
+    COURSE_BATCH_MAX_WORKERS = int(os.getenv('COURSE_BATCH_MAX_WORKERS', 8))
+    COURSE_BATCH_TIMEOUT = float(os.getenv('COURSE_BATCH_TIMEOUT', 30))
+    # Ranqueamento global: plataformas cujo melhor escore recente não alcança o top-k são canceladas.
+    # Heurística com perda (o escore recente não limita o da busca atual), por isso desligada por padrão
+    COURSE_RANK_EARLY_STOP = os.getenv('COURSE_RANK_EARLY_STOP', 'false').lower() == 'true'
+    COURSE_RANK_CEILING_WINDOW = int(os.getenv('COURSE_RANK_CEILING_WINDOW', 50))  # buscas observadas por plataforma
+    COURSE_RANK_CEILING_MIN_SAMPLES = int(os.getenv('COURSE_RANK_CEILING_MIN_SAMPLES', 5))
+    COURSE_RANK_CEILING_TTL = int(os.getenv('COURSE_RANK_CEILING_TTL', 3600))  # segundos
+    
+    # Rate limiting de saída por host: (requisições por segundo, burst)
+    HOST_RATE_LIMITS = {
+        'www.udemy.com': (
+            float(os.getenv('UDEMY_RATE_LIMIT', 1)),
+            float(os.getenv('UDEMY_RATE_BURST', 3))
+        ),
+        'www.linkedin.com': (
+            float(os.getenv('LINKEDIN_RATE_LIMIT', 1)),
+            float(os.getenv('LINKEDIN_RATE_BURST', 3))
+        )
+    }
+    HOST_RATE_LIMIT_DEFAULT = (2.0, 5.0)
+    # Chamadas aguardando tokens por host e worker; acima disso a resposta é 429 imediato
+    HOST_RATE_LIMIT_MAX_WAITERS = int(os.getenv('HOST_RATE_LIMIT_MAX_WAITERS', 8))
+    
+    # Pool de conexões HTTP compartilhado por worker
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 10))  # hosts mantidos em cache
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10))  # conexões por host
+    HTTP_POOL_BLOCK = os.getenv('HTTP_POOL_BLOCK', 'true').lower() == 'true'
+    HTTP_HOST_MAX_CONNECTIONS = {
+        'www.udemy.com': int(os.getenv('UDEMY_MAX_CONNECTIONS', 4)),
+        'www.coursera.org': int(os.getenv('COURSERA_MAX_CONNECTIONS', 4)),
+        'api.coursera.org': int(os.getenv('COURSERA_API_MAX_CONNECTIONS', 4)),
+        'www.edx.org': int(os.getenv('EDX_MAX_CONNECTIONS', 4)),
+        'www.linkedin.com': int(os.getenv('LINKEDIN_MAX_CONNECTIONS', 4))
+    }
+    
+    # Cache de resultados de busca (LRU por worker, com stale-while-revalidate)
+    CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 512))
+    CACHE_STALE_TTL = int(os.getenv('CACHE_STALE_TTL', 600))  # segundos servindo valor vencido
+    CACHE_EMPTY_TTL = int(os.getenv('CACHE_EMPTY_TTL', 60))  # buscas sem resultado
+    # Resultados parciais (plataforma com prazo esgotado, rate limit ou erro): logo refeitos
+    CACHE_PARTIAL_TTL = int(os.getenv('CACHE_PARTIAL_TTL', 60))
+    CACHE_REFRESH_WORKERS = int(os.getenv('CACHE_REFRESH_WORKERS', 2))
+    # Backend compartilhado entre workers: redis://host:6379/0 ou sqlite:////tmp/impulse-cache.db (vazio = só memória)
+    CACHE_BACKEND_URL = os.getenv('CACHE_BACKEND_URL', '')
+    CACHE_KEY_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'impulse:')
+    # Sem CACHE_BACKEND_URL, os rate limits de saída são divididos pelos workers do nó neste SQLite
+    COORDINATION_DB_PATH = os.getenv('COORDINATION_DB_PATH', '/tmp/impulse-coordination.db')
+    CACHE_TTLS = {
+        'udemy': int(os.getenv('CACHE_TTL_UDEMY', 3600)),
+        'coursera': int(os.getenv('CACHE_TTL_COURSERA', 6 * 3600)),
+        'edx': int(os.getenv('CACHE_TTL_EDX', 6 * 3600)),
+        'linkedin': int(os.getenv('CACHE_TTL_LINKEDIN', 900))
+    }
+    
+    # Catálogo local de cursos (SQLite + FTS5, compartilhado pelos workers do nó); usa CACHE_TTLS como prazo de validade
+    COURSE_CATALOG_ENABLED = os.getenv('COURSE_CATALOG_ENABLED', 'true').lower() == 'true'
+    COURSE_CATALOG_PATH = os.getenv('COURSE_CATALOG_PATH', 'data/course_catalog.db')
+    
+    # Registro das buscas recentes (por worker) e pré-aquecimento das mais frequentes
+    QUERY_LOG_MAX_QUERIES = int(os.getenv('QUERY_LOG_MAX_QUERIES', 1000))
+    QUERY_LOG_HALF_LIFE = float(os.getenv('QUERY_LOG_HALF_LIFE', 3600))  # segundos para a frequência cair pela metade
+    PREWARM_ENABLED = os.getenv('PREWARM_ENABLED', 'true').lower() == 'true'
+    PREWARM_INTERVAL = float(os.getenv('PREWARM_INTERVAL', 60))  # segundos entre rodadas
+    PREWARM_TOP_N = int(os.getenv('PREWARM_TOP_N', 20))
+    PREWARM_LEAD_TIME = float(os.getenv('PREWARM_LEAD_TIME', 300))  # atualizar o que vence em menos de N segundos
+    PREWARM_BUDGET_PER_HOUR = float(os.getenv('PREWARM_BUDGET_PER_HOUR', 120))  # buscas nas plataformas, somando os workers
+    PREWARM_BUDGET_BURST = float(os.getenv('PREWARM_BUDGET_BURST', 10))
+    
+    # Coalescência de buscas idênticas em andamento (single-flight)
+    SINGLE_FLIGHT_CROSS_WORKER = os.getenv('SINGLE_FLIGHT_CROSS_WORKER', 'true').lower() == 'true'
+    SINGLE_FLIGHT_LOCK_TTL = float(os.getenv('SINGLE_FLIGHT_LOCK_TTL', 90))  # expira lock de worker que morreu
+    SINGLE_FLIGHT_WAIT_TIMEOUT = float(os.getenv('SINGLE_FLIGHT_WAIT_TIMEOUT', 45))
+    SINGLE_FLIGHT_POLL_INTERVAL = float(os.getenv('SINGLE_FLIGHT_POLL_INTERVAL', 0.1))
+    
+    # Pool de WebDrivers do Selenium (por worker)
+    DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', 2))
+    DRIVER_MAX_USES = int(os.getenv('DRIVER_MAX_USES', 50))  # reciclar após N usos
+    DRIVER_CHECKOUT_TIMEOUT = float(os.getenv('DRIVER_CHECKOUT_TIMEOUT', 30))
+    
     # Configurações do LinkedIn
     LINKEDIN_EMAIL = os.getenv('LINKEDIN_EMAIL', '')
     LINKEDIN_PASSWORD = os.getenv('LINKEDIN_PASSWORD', '')
     
+    # Sessão do LinkedIn persistida (cookies criptografados em disco)
+    LINKEDIN_COOKIE_FILE = os.getenv('LINKEDIN_COOKIE_FILE', '.sessions/linkedin_cookies.enc')
+    # Sem LINKEDIN_COOKIE_SECRET próprio (ou com um valor de exemplo) a sessão não é salva em disco
+    LINKEDIN_COOKIE_SECRET = os.getenv('LINKEDIN_COOKIE_SECRET', '')
+    LINKEDIN_COOKIE_TTL = int(os.getenv('LINKEDIN_COOKIE_TTL', 7 * 24 * 3600))  # segundos
+    
+    # Busca de vagas via HTTP (listagem pública) antes de recorrer ao Selenium
+    LINKEDIN_HTTP_FAST_PATH = os.getenv('LINKEDIN_HTTP_FAST_PATH', 'true').lower() == 'true'
+    JOB_DETAIL_MAX_WORKERS = int(os.getenv('JOB_DETAIL_MAX_WORKERS', 4))
+    
+    # Busca de vagas assíncrona (202 + consulta em /api/v1/jobs/tasks/<id>); o estado fica no backend
+    # de coordenação e, se ele não puder ser aberto, a busca é respondida de forma síncrona
+    JOB_TASK_WORKERS = int(os.getenv('JOB_TASK_WORKERS', 2))  # buscas simultâneas por worker
+    JOB_TASK_MAX_PENDING = int(os.getenv('JOB_TASK_MAX_PENDING', 20))
+    JOB_TASK_RESULT_TTL = int(os.getenv('JOB_TASK_RESULT_TTL', 600))  # segundos
+    JOB_TASK_MAX_WAIT = float(os.getenv('JOB_TASK_MAX_WAIT', 25))  # long-poll, abaixo do timeout do gunicorn
+    JOB_TASK_POLL_INTERVAL = float(os.getenv('JOB_TASK_POLL_INTERVAL', 0.25))
+    
     # API Keys válidas
     VALID_API_KEYS = [
         os.getenv('API_KEY_CLIENT', 'api-key-1-change-in-production')
@@ -41,10 +170,19 @@ class Config:
     COURSE_PLATFORMS = ['udemy', 'coursera', 'edx']
     COURSE_SEARCH_LIMIT_MAX = 50
     COURSE_SEARCH_LIMIT_DEFAULT = 10
+    COURSE_DETAILS_BATCH_MAX = 20
+    
+    # Cursores de paginação (next_cursor) assinados com HMAC; trocar o segredo invalida os emitidos.
+    # Sem CURSOR_SECRET próprio (ou com um valor de exemplo) next_cursor é sempre null
+    CURSOR_SECRET = os.getenv('CURSOR_SECRET', '')
+    # Cursos já buscados e ainda não entregues ficam no backend de coordenação por este prazo;
+    # depois dele a página seguinte busca de novo as páginas que os continham
+    CURSOR_PAYLOAD_TTL = int(os.getenv('CURSOR_PAYLOAD_TTL', 3600))
     
     # Configurações de vagas
     JOB_SEARCH_LIMIT_MAX = 50
     JOB_SEARCH_LIMIT_DEFAULT = 10
+    JOB_DETAILS_BATCH_MAX = 20
     
     # Configurações de CORS
     CORS_ORIGINS = [
@@ -0,0 +1,270 @@
+"""
+Catálogo local de cursos
+Cada curso obtido das plataformas é gravado em um SQLite com índice FTS5 (título,
+descrição e instrutor). Buscas recentes registram sua cobertura; enquanto ela está
+dentro do prazo, a busca é respondida pelo índice, sem consultar a plataforma.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS courses ('
+    ' id TEXT PRIMARY KEY,'
+    ' source TEXT NOT NULL,'
+    ' title TEXT,'
+    ' description TEXT,'
+    ' instructor TEXT,'
+    ' rating REAL,'
+    ' price REAL,'
+    ' level TEXT,'
+    ' language TEXT,'
+    ' data TEXT NOT NULL,'
+    ' updated_at REAL NOT NULL'
+    ')',
+    'CREATE INDEX IF NOT EXISTS courses_source ON courses (source)',
+    "CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5("
+    " title, description, instructor,"
+    " content='courses', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'"
+    ")",
+    # Índice FTS sincronizado com a tabela de cursos
+    'CREATE TRIGGER IF NOT EXISTS courses_ai AFTER INSERT ON courses BEGIN'
+    ' INSERT INTO courses_fts (rowid, title, description, instructor)'
+    ' VALUES (new.rowid, new.title, new.description, new.instructor);'
+    ' END',
+    'CREATE TRIGGER IF NOT EXISTS courses_ad AFTER DELETE ON courses BEGIN'
+    " INSERT INTO courses_fts (courses_fts, rowid, title, description, instructor)"
+    " VALUES ('delete', old.rowid, old.title, old.description, old.instructor);"
+    ' END',
+    'CREATE TRIGGER IF NOT EXISTS courses_au AFTER UPDATE ON courses BEGIN'
+    " INSERT INTO courses_fts (courses_fts, rowid, title, description, instructor)"
+    " VALUES ('delete', old.rowid, old.title, old.description, old.instructor);"
+    ' INSERT INTO courses_fts (rowid, title, description, instructor)'
+    ' VALUES (new.rowid, new.title, new.description, new.instructor);'
+    ' END',
+    # Cobertura: quando cada busca foi feita na plataforma e quantos cursos ela trouxe
+    'CREATE TABLE IF NOT EXISTS searches ('
+    ' query TEXT NOT NULL,'
+    ' platform TEXT NOT NULL,'
+    ' language TEXT NOT NULL,'
+    ' max_results INTEGER NOT NULL,'
+    ' total INTEGER NOT NULL,'
+    ' fetched_at REAL NOT NULL,'
+    ' PRIMARY KEY (query, platform, language)'
+    ')'
+)
+
+# Pesos do bm25 por coluna: título, descrição, instrutor
+BM25_WEIGHTS = (10.0, 1.0, 2.0)
+
+
+def normalize_query(query: str) -> str:
+    """Termos da busca em minúsculas, separados por espaço (chave de cobertura)"""
+    return ' '.join(re.findall(r'\w+', (query or '').lower()))
+
+
+def _matches_language(course: Dict[str, Any], language: str) -> bool:
+    """Mesmo critério do filtro de idioma do serviço (substring, sem diferenciar maiúsculas)"""
+    return not language or language in (course.get('language') or '').lower()
+
+
+def _text(value: Any) -> Optional[str]:
+    """Valor de coluna de texto: listas (ex.: instrutores da Coursera e da edX) viram uma string"""
+    if isinstance(value, (list, tuple)):
+        return ', '.join(map(str, value))
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _number(value: Any) -> Optional[float]:
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+class CourseCatalog:
+    """Catálogo SQLite + FTS5 dos cursos já obtidos, compartilhado pelos workers do nó"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        for statement in SCHEMA:
+            connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Conexão da thread atual (conexões SQLite não devem ser compartilhadas entre threads)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def search(self, query: str, platform: str, language: Optional[str], limit: int,
+               max_age: float) -> Optional[List[Dict[str, Any]]]:
+        """
+        Busca cursos da plataforma no índice local
+
+        Args:
+            query: Termo de busca
+            platform: Plataforma dos cursos
+            language: Idioma (mesmo filtro por substring do serviço; vazio para todos)
+            limit: Número máximo de resultados
+            max_age: Idade máxima (segundos) da última busca na plataforma para este termo
+
+        Returns:
+            Cursos do mais para o menos relevante, ou None se o catálogo não cobre a busca
+            (termo nunca buscado, cobertura expirada ou com menos cursos que a plataforma trouxe)
+        """
+        terms = normalize_query(query)
+        if not terms:
+            return None
+        language = (language or '').lower()
+
+        connection = self._connection()
+        coverage = connection.execute(
+            'SELECT max_results, total FROM searches'
+            ' WHERE query = ? AND platform = ? AND language = ? AND fetched_at > ?',
+            (terms, platform, language, time.time() - max_age)
+        ).fetchone()
+        if coverage is None:
+            return None
+        max_results, total = coverage
+        if max_results < limit and total >= max_results:
+            # A busca registrada trouxe menos cursos do que agora são pedidos
+            return None
+
+        # Cada termo entre aspas: caracteres especiais da sintaxe do FTS5 não são interpretados
+        match = ' '.join(f'"{term}"' for term in terms.split())
+        rows = connection.execute(
+            'SELECT c.data FROM courses_fts JOIN courses c ON c.rowid = courses_fts.rowid'
+            ' WHERE courses_fts MATCH ? AND c.source = ?'
+            " AND (? = '' OR instr(lower(coalesce(c.language, '')), ?) > 0)"
+            ' ORDER BY bm25(courses_fts, ?, ?, ?) LIMIT ?',
+            (match, platform, language, language, *BM25_WEIGHTS, limit)
+        ).fetchall()
+
+        if len(rows) < min(limit, total):
+            return None
+        return [json.loads(row[0]) for row in rows]
+
+    def fetched_at(self, query: str, platform: str, language: Optional[str]) -> Optional[float]:
+        """
+        Instante (epoch) da última busca registrada na plataforma para o termo
+
+        Args:
+            query: Termo de busca
+            platform: Plataforma dos cursos
+            language: Idioma da busca
+
+        Returns:
+            Timestamp da cobertura, ou None se o termo nunca foi buscado na plataforma
+        """
+        row = self._connection().execute(
+            'SELECT fetched_at FROM searches WHERE query = ? AND platform = ? AND language = ?',
+            (normalize_query(query), platform, (language or '').lower())
+        ).fetchone()
+        return row[0] if row else None
+
+    def upsert(self, platform: str, query: str, language: Optional[str], limit: int,
+               courses: List[Dict[str, Any]]):
+        """
+        Grava os cursos obtidos da plataforma e registra a cobertura da busca
+
+        Args:
+            platform: Plataforma consultada
+            query: Termo de busca enviado à plataforma
+            language: Idioma da busca
+            limit: Número de cursos pedido à plataforma
+            courses: Cursos no formato retornado pelo scraper
+        """
+        language = (language or '').lower()
+        now = time.time()
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            for course in courses:
+                if not course.get('id'):
+                    continue
+                connection.execute(
+                    'INSERT INTO courses'
+                    ' (id, source, title, description, instructor, rating, price, level, language, data, updated_at)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+                    ' ON CONFLICT (id) DO UPDATE SET'
+                    ' source = excluded.source, title = excluded.title, description = excluded.description,'
+                    ' instructor = excluded.instructor, rating = excluded.rating, price = excluded.price,'
+                    ' level = excluded.level, language = excluded.language, data = excluded.data,'
+                    ' updated_at = excluded.updated_at',
+                    (
+                        course['id'], platform, _text(course.get('title')), _text(course.get('description')),
+                        _text(course.get('instructor')), _number(course.get('rating')), _number(course.get('price')),
+                        _text(course.get('level')), _text(course.get('language')),
+                        json.dumps(course, ensure_ascii=False, default=str), now
+                    )
+                )
+            connection.execute(
+                'INSERT OR REPLACE INTO searches (query, platform, language, max_results, total, fetched_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    normalize_query(query), platform, language, limit,
+                    sum(1 for course in courses if _matches_language(course, language)), now
+                )
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+_catalog: Optional[CourseCatalog] = None
+_catalog_pid = None
+_catalog_lock = threading.Lock()
+
+
+def get_course_catalog() -> Optional[CourseCatalog]:
+    """Retorna o catálogo do processo, ou None se desabilitado ou indisponível (ex.: SQLite sem FTS5)"""
+    global _catalog, _catalog_pid
+    if _catalog_pid != os.getpid():
+        with _catalog_lock:
+            if _catalog_pid != os.getpid():
+                config = get_config()
+                _catalog = None
+                if config.COURSE_CATALOG_ENABLED and config.COURSE_CATALOG_PATH:
+                    try:
+                        _catalog = CourseCatalog(config.COURSE_CATALOG_PATH)
+                    except Exception as e:
+                        logger.error(f"Erro ao abrir catálogo de cursos: {str(e)}")
+                _catalog_pid = os.getpid()
+    return _catalog
+
+
+def close_course_catalog():
+    """Fecha o catálogo do processo"""
+    global _catalog, _catalog_pid
+    with _catalog_lock:
+        if _catalog is not None and _catalog_pid == os.getpid():
+            try:
+                _catalog.close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar catálogo de cursos: {str(e)}")
+        _catalog = None
+        _catalog_pid = None
@@ -3,9 +3,17 @@ Controllers para o módulo de cursos
 Responsável por gerenciar as requisições HTTP relacionadas a cursos
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, Response, request, jsonify, stream_with_context
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
 from functools import wraps
+import json
+import math
 import logging
+from common.cache import content_etag
+from common.cursors import InvalidCursor
+from config.settings import get_config
+from scrapers.rate_limiter import Throttled
 from .services import CourseService
 from .models import CourseSearchRequest, CourseDetailRequest
 import os
@@ -15,6 +23,10 @@ logger = logging.getLogger(__name__)
 # Blueprint para rotas de cursos
 courses_bp = Blueprint('courses', __name__, url_prefix='/api/v1/courses')
 
+# Formatos de resposta em streaming aceitos na busca (header Accept)
+NDJSON_MIMETYPE = 'application/x-ndjson'
+SSE_MIMETYPE = 'text/event-stream'
+
 def require_api_key(f):
     """Decorator para verificar API key"""
     @wraps(f)
@@ -39,6 +51,80 @@ def require_api_key(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def _get_service() -> CourseService:
+    """Serviço do processo, mantido pela aplicação e reutilizado entre requisições"""
+    return current_app.extensions['services'].get('courses')
+
+def _throttled_error(error):
+    """Corpo de erro quando o rate limit de saída para a plataforma de origem se esgotou"""
+    retry_after = max(1, math.ceil(error.retry_after))
+    return {
+        'error': 'rate_limit_exceeded',
+        'message': f'Limite de requisições a {error.host} excedido',
+        'details': {'host': error.host, 'retry_after': retry_after}
+    }
+
+def _throttled_response(error):
+    """Resposta 429 quando o rate limit de saída para a plataforma de origem se esgotou"""
+    logger.warning(f"Requisição recusada por rate limit de saída: {str(error)}")
+    body = _throttled_error(error)
+    response = jsonify(body)
+    response.headers['Retry-After'] = str(body['details']['retry_after'])
+    return response, 429
+
+def _conditional_response(payload, etag, max_age):
+    """
+    Resposta JSON com ETag e Cache-Control
+    
+    Se o cliente já tem esta versão (If-None-Match), responde 304 sem corpo e sem
+    serializar o resultado.
+    """
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(payload)
+    response.set_etag(etag)
+    # Respostas dependem da API key: apenas o cache do próprio cliente pode reutilizá-las
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response
+
+def _search_etag(search_request, result):
+    """ETag do corpo da busca: conteúdo do resultado e os campos ecoados da requisição"""
+    return content_etag([result.get('etag') or content_etag(result), search_request.query, search_request.platform])
+
+def _invalid_cursor_error(error):
+    """Corpo de erro para um cursor de paginação inválido"""
+    return {
+        'error': 'validation_error',
+        'message': str(error),
+        'details': {'field': 'cursor', 'constraint': 'invalid'}
+    }
+
+def _build_search_request(data):
+    """Cria a requisição de busca a partir do corpo JSON"""
+    return CourseSearchRequest(
+        query=data.get('query'),
+        platform=data.get('platform', 'all'),
+        limit=data.get('limit', 10),
+        level=data.get('level'),
+        language=data.get('language', 'en'),
+        price_range=data.get('price_range', 'all'),
+        cursor=data.get('cursor')
+    )
+
+def _search_body(search_request, result):
+    """Corpo da resposta de uma busca concluída"""
+    return {
+        'success': True,
+        'courses': result['courses'],
+        'total': result['total'],
+        'query': search_request.query,
+        'platform': search_request.platform,
+        'next_cursor': result.get('next_cursor'),
+        'timestamp': result['timestamp']
+    }
+
 @courses_bp.route('/', methods=['POST'])
 @require_api_key
 def search_courses():
@@ -57,14 +143,7 @@ def search_courses():
             }), 400
         
         # Criar objeto de requisição
-        search_request = CourseSearchRequest(
-            query=data.get('query'),
-            platform=data.get('platform', 'all'),
-            limit=data.get('limit', 10),
-            level=data.get('level'),
-            language=data.get('language', 'en'),
-            price_range=data.get('price_range', 'all')
-        )
+        search_request = _build_search_request(data)
         
         # Validar requisição
         validation_error = search_request.validate()
@@ -75,27 +154,208 @@ def search_courses():
                 'details': {'field': 'query', 'constraint': 'required'}
             }), 400
          
+        course_service = _get_service()
+        
+        # Streaming: cada plataforma é enviada assim que responde (apenas na primeira página)
+        mimetype = request.accept_mimetypes.best
+        if mimetype in (NDJSON_MIMETYPE, SSE_MIMETYPE) and not search_request.cursor:
+            return _stream_response(course_service.stream_search_courses(search_request), mimetype)
+        
         # Executar busca
-        course_service = CourseService()
         result = course_service.search_courses(search_request)
         
+        return _conditional_response(
+            _search_body(search_request, result),
+            _search_etag(search_request, result),
+            course_service.cache_max_age(search_request, result)
+        )
+        
+    except InvalidCursor as e:
+        return jsonify(_invalid_cursor_error(e)), 400
+    except Throttled as e:
+        return _throttled_response(e)
+    except Exception as e:
+        logger.error(f"Erro ao buscar cursos: {str(e)}")
+        return jsonify({
+            'error': 'internal_error',
+            'message': 'Erro interno do servidor',
+            'details': {'error': str(e)}
+        }), 500
+
+@courses_bp.route('/batch', methods=['POST'])
+@require_api_key
+def search_courses_batch():
+    """
+    Endpoint para várias buscas de cursos em uma requisição
+    POST /api/v1/courses/batch
+    
+    Corpo: {"searches": [{"query": ...}, ...]} ou a lista de buscas diretamente.
+    Buscas idênticas são executadas uma vez; cada item da resposta traz o resultado
+    ou o erro da busca correspondente, na mesma ordem.
+    """
+    try:
+        data = request.get_json(silent=True)
+        searches = data.get('searches') if isinstance(data, dict) else data
+        if not isinstance(searches, list) or not searches:
+            return jsonify({
+                'error': 'validation_error',
+                'message': 'Lista de buscas é obrigatória',
+                'details': {'field': 'searches', 'constraint': 'required'}
+            }), 400
+        
+        max_items = get_config().COURSE_BATCH_MAX_ITEMS
+        if len(searches) > max_items:
+            return jsonify({
+                'error': 'validation_error',
+                'message': f'No máximo {max_items} buscas por requisição',
+                'details': {'field': 'searches', 'constraint': f'max_items:{max_items}'}
+            }), 400
+        
+        # Itens inválidos viram erros individuais; os válidos seguem para a busca
+        items = []
+        valid = []
+        for index, item in enumerate(searches):
+            if not isinstance(item, dict):
+                items.append({
+                    'success': False,
+                    'error': 'validation_error',
+                    'message': 'Cada busca deve ser um objeto JSON',
+                    'details': {'field': f'searches[{index}]', 'constraint': 'object'}
+                })
+                continue
+            search_request = _build_search_request(item)
+            validation_error = search_request.validate()
+            if validation_error:
+                items.append({
+                    'success': False,
+                    'error': 'validation_error',
+                    'message': validation_error,
+                    'details': {'field': f'searches[{index}]'}
+                })
+                continue
+            items.append(None)
+            valid.append((index, search_request))
+        
+        outcomes = _get_service().search_courses_batch([search_request for _, search_request in valid])
+        for (index, search_request), outcome in zip(valid, outcomes):
+            items[index] = _batch_item(search_request, outcome)
+        
         return jsonify({
             'success': True,
-            'courses': result['courses'],
-            'total': result['total'],
-            'query': search_request.query,
-            'platform': search_request.platform,
-            'timestamp': result['timestamp']
+            'results': items,
+            'total': len(items),
+            'timestamp': datetime.now().isoformat()
         }), 200
         
     except Exception as e:
-        logger.error(f"Erro ao buscar cursos: {str(e)}")
+        logger.error(f"Erro ao executar lote de buscas de cursos: {str(e)}")
+        return jsonify({
+            'error': 'internal_error',
+            'message': 'Erro interno do servidor',
+            'details': {'error': str(e)}
+        }), 500
+
+@courses_bp.route('/', methods=['GET'])
+@require_api_key
+def get_courses_details():
+    """
+    Endpoint para obter detalhes de vários cursos em uma requisição
+    GET /api/v1/courses?ids=udemy_1,udemy_2,coursera_abc
+    """
+    try:
+        course_ids = [course_id.strip() for course_id in request.args.get('ids', '').split(',') if course_id.strip()]
+        if not course_ids:
+            return jsonify({
+                'error': 'validation_error',
+                'message': 'Parâmetro ids é obrigatório',
+                'details': {'field': 'ids', 'constraint': 'required'}
+            }), 400
+        
+        max_ids = get_config().COURSE_DETAILS_BATCH_MAX
+        if len(course_ids) > max_ids:
+            return jsonify({
+                'error': 'validation_error',
+                'message': f'No máximo {max_ids} IDs por requisição',
+                'details': {'field': 'ids', 'constraint': f'max_items:{max_ids}'}
+            }), 400
+        
+        for course_id in course_ids:
+            validation_error = CourseDetailRequest(course_id=course_id).validate()
+            if validation_error:
+                return jsonify({
+                    'error': 'validation_error',
+                    'message': validation_error,
+                    'details': {'field': 'ids', 'value': course_id}
+                }), 400
+        
+        course_service = _get_service()
+        result = course_service.get_courses_details(course_ids)
+        
+        return _conditional_response(
+            result, content_etag(result), course_service.details_max_age(result['courses'])
+        )
+        
+    except Throttled as e:
+        return _throttled_response(e)
+    except Exception as e:
+        logger.error(f"Erro ao obter detalhes dos cursos: {str(e)}")
         return jsonify({
             'error': 'internal_error',
             'message': 'Erro interno do servidor',
             'details': {'error': str(e)}
         }), 500
 
+def _batch_item(search_request, outcome):
+    """Resultado de uma busca do lote: o corpo da busca ou o erro correspondente"""
+    if isinstance(outcome, Throttled):
+        return {'success': False, **_throttled_error(outcome)}
+    if isinstance(outcome, InvalidCursor):
+        return {'success': False, **_invalid_cursor_error(outcome)}
+    if isinstance(outcome, FutureTimeoutError):
+        return {
+            'success': False,
+            'error': 'timeout',
+            'message': 'Busca não concluída no prazo do lote',
+            'details': {'query': search_request.query, 'timeout': get_config().COURSE_BATCH_TIMEOUT}
+        }
+    if isinstance(outcome, Exception):
+        return {
+            'success': False,
+            'error': 'internal_error',
+            'message': 'Erro interno do servidor',
+            'details': {'error': str(outcome)}
+        }
+    return _search_body(search_request, outcome)
+
+def _format_record(record, mimetype):
+    """Serializa um registro como linha NDJSON ou evento SSE"""
+    data = json.dumps(record, ensure_ascii=False, default=str)
+    if mimetype == SSE_MIMETYPE:
+        return f"event: {record['type']}\ndata: {data}\n\n"
+    return data + '\n'
+
+def _stream_response(records, mimetype):
+    """Resposta HTTP que envia os registros à medida que são gerados"""
+    def generate():
+        try:
+            for record in records:
+                yield _format_record(record, mimetype)
+        except Exception as e:
+            # O status 200 já foi enviado: o erro vai como último registro
+            logger.error(f"Erro na busca de cursos em streaming: {str(e)}")
+            yield _format_record({
+                'type': 'error',
+                'error': 'internal_error',
+                'message': 'Erro interno do servidor',
+                'details': {'error': str(e)}
+            }, mimetype)
+    
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers['Cache-Control'] = 'no-cache'
+    # Desabilitar o buffer do nginx para que cada registro chegue ao cliente na hora
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @courses_bp.route('/<course_id>', methods=['GET'])
 @require_api_key
 def get_course_details(course_id):
@@ -116,7 +376,7 @@ def get_course_details(course_id):
         detail_request = CourseDetailRequest(course_id=course_id)
         
         # Executar busca de detalhes
-        course_service = CourseService()
+        course_service = _get_service()
         course_details = course_service.get_course_details(detail_request)
         
         if not course_details:
@@ -126,8 +386,12 @@ def get_course_details(course_id):
                 'details': {'course_id': course_id}
             }), 404
         
-        return jsonify(course_details), 200
+        return _conditional_response(
+            course_details, content_etag(course_details), course_service.details_max_age([course_details])
+        )
         
+    except Throttled as e:
+        return _throttled_response(e)
     except Exception as e:
         logger.error(f"Erro ao obter detalhes do curso {course_id}: {str(e)}")
         return jsonify({
@@ -143,7 +407,7 @@ def courses_health():
     GET /api/v1/courses/health
     """
     try:
-        course_service = CourseService()
+        course_service = _get_service()
         health_status = course_service.health_check()
         
         return jsonify({
@@ -17,6 +17,8 @@ class CourseSearchRequest:
     level: Optional[str] = None
     language: Optional[str] = None
     price_range: str = 'all'
+    # next_cursor de uma resposta anterior: continua a mesma busca a partir dali
+    cursor: Optional[str] = None
     
     def validate(self) -> Optional[str]:
         """Valida os dados da requisição"""
@@ -29,6 +31,9 @@ class CourseSearchRequest:
         if self.limit < 1 or self.limit > 50:
             return "Limit deve estar entre 1 e 50"
         
+        if self.cursor is not None and not isinstance(self.cursor, str):
+            return "Cursor deve ser uma string"
+        
         valid_platforms = ['all', 'udemy', 'coursera', 'edx']
         if self.platform not in valid_platforms:
             return f"Platform deve ser uma das opções: {', '.join(valid_platforms)}"
@@ -51,8 +56,9 @@ class CourseDetailRequest:
         if not self.course_id or not self.course_id.strip():
             return "Course ID é obrigatório"
         
-        # Validar formato do ID (platform_id)
-        if not re.match(r'^[a-zA-Z]+_\d+$', self.course_id):
+        # Validar formato do ID (platform_id); Coursera e edX usam IDs alfanuméricos
+        # (ex.: coursera_Gtv4Xb1-EeS-ViIACwYKVQ, edx_MITx+6.00.1x)
+        if not re.match(r'^[a-zA-Z]+_[\w.:+-]+$', self.course_id):
             return "Course ID deve estar no formato: platform_id"
         
         return None
@@ -129,6 +135,7 @@ class CourseSearchResult:
     query: str
     platform: str
     timestamp: datetime
+    next_cursor: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte o resultado para dicionário"""
@@ -138,7 +145,8 @@ class CourseSearchResult:
             'total': self.total,
             'query': self.query,
             'platform': self.platform,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp.isoformat(),
+            'next_cursor': self.next_cursor
         }
 
 @dataclass
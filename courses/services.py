@@ -3,17 +3,32 @@ Services para o módulo de cursos
 Responsável pela lógica de negócio e integração com scrapers
 """
 
+import dataclasses
+import itertools
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple, Union
 import sys
 import os
 
 # Adicionar o diretório raiz ao path para importar o scraper
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scrapers.course_scraper import CourseScraper
+from scrapers.course_scraper import CourseScraper, PLATFORMS
+from scrapers.ranking import merge_ranked, score_platform_results
+from .catalog import CourseCatalog, get_course_catalog
+from common.cache import SearchCache, content_etag, make_cache_key
+from common.cache_backends import get_shared_backend
+from common.cursors import (
+    InvalidCursor, cursors_enabled, decode_cursor, encode_cursor, load_cursor_payload, pack_positions,
+    save_cursor_payload, unpack_positions
+)
+from common.prewarm import PrewarmSource
+from common.query_log import QueryLog
+from config.settings import get_config
 from .models import (
     CourseSearchRequest, 
     CourseDetailRequest, 
@@ -25,13 +40,52 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Cache de buscas: memória do processo + backend compartilhado entre workers (se configurado)
+_search_cache = SearchCache(
+    'courses',
+    max_entries=get_config().CACHE_MAX_ENTRIES,
+    stale_ttl=get_config().CACHE_STALE_TTL,
+    backend=get_shared_backend
+)
+
+# Buscas recentes do worker, usadas para pré-aquecer as mais frequentes
+_query_log = QueryLog(
+    'courses',
+    max_queries=get_config().QUERY_LOG_MAX_QUERIES,
+    half_life=get_config().QUERY_LOG_HALF_LIFE
+)
+
+_batch_executor = None
+_batch_executor_lock = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    """Executor compartilhado pelo processo para as buscas em lote"""
+    global _batch_executor
+    if _batch_executor is None:
+        with _batch_executor_lock:
+            if _batch_executor is None:
+                _batch_executor = ThreadPoolExecutor(
+                    max_workers=get_config().COURSE_BATCH_MAX_WORKERS,
+                    thread_name_prefix='course-batch'
+                )
+    return _batch_executor
+
+
+def shutdown_batch_executor():
+    """Encerra o executor das buscas em lote do processo (chamado no encerramento do worker)"""
+    global _batch_executor
+    with _batch_executor_lock:
+        executor, _batch_executor = _batch_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
 class CourseService:
     """Serviço para gerenciar operações relacionadas a cursos"""
     
     def __init__(self):
+        self.config = get_config()
         self.scraper = CourseScraper()
-        self._rate_limit_counter = 0
-        self._last_request_time = 0
     
     def search_courses(self, request: CourseSearchRequest) -> Dict[str, Any]:
         """
@@ -42,62 +96,552 @@ class CourseService:
             
         Returns:
             Dicionário com os resultados da busca
+            
+        Raises:
+            InvalidCursor: Se request.cursor for inválido ou de outra busca
         """
         try:
-            # Aplicar rate limiting
-            self._check_rate_limit()
+            if request.cursor:
+                # Páginas seguintes partem da posição gravada no cursor, fora do cache
+                return self._search_courses_page(request)
             
-            logger.info(f"Iniciando busca de cursos: {request.query} na plataforma {request.platform}")
+            cache_key = self._cache_key(request)
+            _query_log.record(cache_key, dataclasses.asdict(request))
             
-            # Executar busca usando o scraper
-            raw_courses = self.scraper.search_courses(
-                query=request.query,
-                platform=request.platform,
-                limit=request.limit,
-                language=request.language
+            if not self.config.CACHE_ENABLED:
+                # Sem cache, buscas idênticas simultâneas ainda compartilham uma única execução
+                return _search_cache.flight.do(cache_key, lambda: self._search_courses_uncached(request))
+            
+            return _search_cache.get_or_load(
+                cache_key,
+                lambda: self._search_courses_uncached(request),
+                ttl=lambda result: self._cache_ttl(request, result)
             )
             
-            # Converter para objetos Course
-            courses = []
-            for raw_course in raw_courses:
-                course = Course(
-                    id=raw_course.get('id', ''),
-                    title=raw_course.get('title', ''),
-                    instructor=raw_course.get('instructor', ''),
-                    num_reviews=raw_course.get('num_reviews'),
-                    rating=raw_course.get('rating'),
-                    students_count=raw_course.get('students_count'),
-                    price=raw_course.get('price'),
-                    original_price=raw_course.get('original_price'),
-                    language=raw_course.get('language'),
-                    duration=raw_course.get('duration'),
-                    level=raw_course.get('level'),
-                    url=raw_course.get('url'),
-                    image_url=raw_course.get('image_url'),
-                    description=raw_course.get('description'),
-                    source=raw_course.get('source', 'unknown')
+        except Exception as e:
+            logger.error(f"Erro na busca de cursos: {str(e)}")
+            raise
+    
+    def search_courses_batch(self, requests: List[CourseSearchRequest]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Executa várias buscas em paralelo, uma vez por busca distinta
+        
+        As buscas passam pelo mesmo caminho de search_courses (cache, catálogo e
+        rate limit de saída por host, compartilhado com as demais requisições).
+        
+        Args:
+            requests: Buscas do lote
+            
+        Returns:
+            Para cada busca, na ordem recebida, o resultado ou a exceção que a interrompeu
+            (TimeoutError se não terminou dentro de COURSE_BATCH_TIMEOUT)
+        """
+        unique: Dict[Any, CourseSearchRequest] = {}
+        keys = []
+        for request in requests:
+            key = (self._cache_key(request), request.cursor)
+            unique.setdefault(key, request)
+            keys.append(key)
+        
+        logger.info(f"Lote de {len(requests)} buscas de cursos ({len(unique)} distintas)")
+        
+        executor = _get_batch_executor()
+        futures = {key: executor.submit(self.search_courses, request) for key, request in unique.items()}
+        wait(futures.values(), timeout=self.config.COURSE_BATCH_TIMEOUT)
+        
+        outcomes: Dict[Any, Union[Dict[str, Any], Exception]] = {}
+        for key, future in futures.items():
+            if not future.done():
+                future.cancel()
+                outcomes[key] = FutureTimeoutError(f"Busca não concluída em {self.config.COURSE_BATCH_TIMEOUT}s")
+                continue
+            try:
+                outcomes[key] = future.result()
+            except Exception as e:
+                outcomes[key] = e
+        
+        return [outcomes[key] for key in keys]
+    
+    def _search_courses_uncached(self, request: CourseSearchRequest, bypass_catalog: bool = False) -> Dict[str, Any]:
+        """
+        Executa a busca sem passar pelo cache de resultados
+        
+        Plataformas cobertas pelo catálogo local são respondidas por ele; só as demais
+        são consultadas, e os cursos obtidos alimentam o catálogo.
+        
+        Args:
+            request: Objeto com os critérios de busca
+            bypass_catalog: Consultar todas as plataformas mesmo com cobertura no catálogo
+                (pré-aquecimento: a cobertura tem a mesma idade da entrada que vai vencer)
+            
+        Returns:
+            Dicionário com os resultados da busca
+        """
+        logger.info(f"Iniciando busca de cursos: {request.query} na plataforma {request.platform}")
+        
+        platforms = self._platforms(request)
+        catalog = self._catalog()
+        local = {} if bypass_catalog else self._catalog_results(catalog, request, platforms)
+        
+        # Consultar apenas as plataformas que o catálogo não cobre
+        results = self.scraper.search_platforms(
+            platforms, request.query, request.limit, request.language, known=local
+        )
+        self._store_in_catalog(catalog, request, {
+            name: [course for _, _, course in scored] for name, scored in results.items() if name not in local
+        })
+        raw_courses = merge_ranked(results, platforms, request.limit)
+        
+        # Converter para objetos Course
+        courses = [self._to_course(raw_course) for raw_course in raw_courses]
+        
+        # Aplicar filtros adicionais
+        courses = self._apply_filters(courses, request)
+        
+        # Criar resultado
+        result = CourseSearchResult(
+            courses=courses,
+            total=len(courses),
+            query=request.query,
+            platform=request.platform,
+            timestamp=datetime.now(),
+            next_cursor=self._first_page_cursor(request, platforms, results, local, raw_courses)
+        )
+        
+        logger.info(f"Busca concluída: {len(courses)} cursos encontrados ({len(local)} plataforma(s) pelo catálogo local)")
+        
+        data = self._result_dict(result)
+        data['ttl'] = self._fresh_ttl(catalog, request, platforms, local,
+                                      partial=any(name not in results for name in platforms))
+        return data
+    
+    def _search_courses_page(self, request: CourseSearchRequest) -> Dict[str, Any]:
+        """
+        Busca a página seguinte a partir do cursor de uma resposta anterior
+        
+        Os cursos já buscados e não entregues voltam do backend de coordenação; só as
+        plataformas com menos de `limit` deles são consultadas, a partir da primeira
+        posição ainda não buscada, de modo que nenhuma página da plataforma é refeita e a
+        página tem `limit` cursos enquanto as listagens não acabam. O catálogo local
+        não é usado: ele não conhece a posição dos cursos na listagem das plataformas.
+        
+        Args:
+            request: Objeto com os critérios de busca e o cursor
+            
+        Returns:
+            Dicionário com os resultados da página
+            
+        Raises:
+            InvalidCursor: Se o cursor for inválido ou de outra busca
+        """
+        state = decode_cursor(request.cursor, self._cache_key(request))
+        if not isinstance(state, dict) or not isinstance(state.get('platforms'), dict):
+            # Cursor emitido antes da mudança de formato
+            raise InvalidCursor('Cursor inválido')
+        positions = state['platforms']
+        platforms = [name for name in self._platforms(request) if name in positions]
+        payload = load_cursor_payload(state['payload']) if state.get('payload') else None
+        if state.get('payload') and payload is None:
+            logger.info("Cursos pendentes do cursor expiraram: buscando de novo as páginas que os continham")
+        
+        carried: Dict[str, List[Dict[str, Any]]] = {}
+        skip: Dict[str, Set[str]] = {}
+        starts: Dict[str, Optional[int]] = {}
+        pending: Dict[str, Set[int]] = {}
+        for name in platforms:
+            position = positions[name]
+            pending[name] = set(unpack_positions(position['rest']))
+            skip[name] = set((payload or {}).get('skip', {}).get(name, []))
+            if payload is not None or not pending[name]:
+                carried[name] = (payload or {}).get('rest', {}).get(name, [])
+                starts[name] = position['next']
+            else:
+                # Sem os cursos pendentes: buscar de novo a partir do primeiro deles
+                carried[name] = []
+                starts[name] = min(pending[name])
+        
+        fetch = [name for name in platforms if starts[name] is not None and len(carried[name]) < request.limit]
+        logger.info(f"Buscando página seguinte de cursos: {request.query} ({', '.join(fetch) or 'apenas cursos pendentes'})")
+        results = self.scraper.search_platforms(
+            fetch, request.query, request.limit, request.language,
+            starts={name: starts[name] for name in fetch}
+        ) if fetch else {}
+        
+        next_positions: Dict[str, Optional[int]] = {}
+        candidates: Dict[str, List[Dict[str, Any]]] = {}
+        for name in platforms:
+            position = positions[name]
+            next_positions[name] = position['next']
+            candidates[name] = list(carried[name])
+            if name not in results:
+                # Não consultada ou sem resposta (prazo, rate limit): mantém a posição
+                continue
+            
+            end, window = self._listing_window(starts[name], [
+                course for _, _, course in sorted(results[name], key=lambda item: item[1])
+            ])
+            known = {course.get('id') for course in carried[name]} | skip[name]
+            for course in window:
+                delivered = position['next'] is not None and course['_position'] < position['next'] \
+                    and course['_position'] not in pending[name]
+                if course.get('id') not in known and not delivered:
+                    candidates[name].append(course)
+            skip[name] -= {course.get('id') for course in window}
+            if position['next'] is not None:
+                next_positions[name] = None if end is None else max(end, position['next'])
+        
+        scored = {name: score_platform_results(courses) for name, courses in candidates.items() if courses}
+        raw_courses = merge_ranked(scored, platforms, request.limit)
+        courses = self._apply_filters([self._to_course(raw_course) for raw_course in raw_courses], request)
+        
+        return self._result_dict(CourseSearchResult(
+            courses=courses,
+            total=len(courses),
+            query=request.query,
+            platform=request.platform,
+            timestamp=datetime.now(),
+            next_cursor=self._next_cursor(request, next_positions, candidates, skip, raw_courses)
+        ))
+    
+    def _result_dict(self, result: CourseSearchResult) -> Dict[str, Any]:
+        """Resultado serializável, com o ETag do conteúdo (guardado junto no cache)"""
+        data = result.to_dict()
+        data['etag'] = content_etag(data)
+        return data
+    
+    def cache_max_age(self, request: CourseSearchRequest, result: Dict[str, Any]) -> int:
+        """
+        Por quantos segundos o cliente pode reutilizar o resultado da busca
+        
+        Args:
+            request: Busca atendida
+            result: Resultado retornado por search_courses
+            
+        Returns:
+            O que resta do TTL do resultado no cache (0 sem cache ou em páginas seguintes)
+        """
+        if not self.config.CACHE_ENABLED or request.cursor:
+            return 0
+        age = (datetime.now() - datetime.fromisoformat(result['timestamp'])).total_seconds()
+        return max(0, int(self._cache_ttl(request, result) - age))
+    
+    def details_max_age(self, courses: List[Dict[str, Any]]) -> int:
+        """Por quantos segundos o cliente pode reutilizar detalhes de cursos: o menor TTL das plataformas"""
+        if not self.config.CACHE_ENABLED or not courses:
+            return 0
+        return min(self.config.CACHE_TTLS.get(course.get('source'), 0) for course in courses)
+    
+    def _listing_window(self, start: int, courses: List[Dict[str, Any]]) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """
+        Trecho contínuo da listagem da plataforma obtido a partir de `start`
+        
+        Cursos depois de uma lacuna (ex.: página da Udemy que falhou) ficam de fora e são
+        buscados na página seguinte, junto com a lacuna.
+        
+        Args:
+            start: Posição da listagem a partir da qual a plataforma foi consultada
+            courses: Cursos devolvidos pela plataforma, com `_position`
+            
+        Returns:
+            Tupla (próxima posição a buscar, cursos do trecho); a posição é None se a
+            listagem acabou (nenhum curso em `start` ou o trecho inclui o último, `_last`)
+        """
+        fetched = {course['_position'] for course in courses if '_position' in course}
+        end = start
+        while end in fetched:
+            end += 1
+        window = [course for course in courses if start <= course.get('_position', -1) < end]
+        if not window or any(course.get('_last') for course in window):
+            return None, window
+        return end, window
+    
+    def _first_page_cursor(self, request: CourseSearchRequest, platforms: List[str],
+                           results: Dict[str, List[Any]], local: Dict[str, List[Dict[str, Any]]],
+                           raw_courses: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Cursor da segunda página de uma busca sem cursor
+        
+        Args:
+            request: Busca atual
+            platforms: Plataformas da busca
+            results: Plataforma -> cursos pontuados obtidos (inclusive os do catálogo)
+            local: Plataformas respondidas pelo catálogo local (sem posição na listagem)
+            raw_courses: Cursos entregues nesta página, antes dos filtros
+            
+        Returns:
+            Cursor opaco ou None
+        """
+        positions: Dict[str, Optional[int]] = {}
+        candidates: Dict[str, List[Dict[str, Any]]] = {}
+        skip: Dict[str, Set[str]] = {}
+        for name in platforms:
+            if name in local:
+                # A listagem da plataforma começa do início, sem repetir o que o catálogo entregou
+                positions[name] = 0
+                skip[name] = {course.get('id') for course in raw_courses if course.get('source') == name}
+            elif name in results:
+                positions[name], candidates[name] = self._listing_window(0, [
+                    course for _, _, course in sorted(results[name], key=lambda item: item[1])
+                ])
+            else:
+                # Sem resposta nesta página (prazo, rate limit): começar do início na próxima
+                positions[name] = 0
+        return self._next_cursor(request, positions, candidates, skip, raw_courses)
+    
+    def _next_cursor(self, request: CourseSearchRequest, positions: Dict[str, Optional[int]],
+                     candidates: Dict[str, List[Dict[str, Any]]], skip: Dict[str, Set[str]],
+                     raw_courses: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Cursor da página seguinte, ou None se as listagens acabaram e tudo foi entregue
+        
+        O cursor guarda, por plataforma, a próxima posição a buscar na listagem e as
+        posições dos cursos já buscados e não entregues (pack_positions); os cursos vão para o
+        backend de coordenação (save_cursor_payload), para o cursor continuar pequeno.
+        
+        Args:
+            request: Busca atual
+            positions: Plataforma -> próxima posição a buscar (None se a listagem acabou)
+            candidates: Plataforma -> cursos já buscados que disputaram esta página
+            skip: Plataforma -> IDs já entregues que a listagem ainda vai trazer (catálogo)
+            raw_courses: Cursos entregues nesta página, antes dos filtros
+            
+        Returns:
+            Cursor opaco ou None
+        """
+        if not cursors_enabled():
+            return None
+        delivered = {course.get('id') for course in raw_courses}
+        
+        state = {}
+        payload: Dict[str, Dict[str, List[Any]]] = {'rest': {}, 'skip': {}}
+        for name, next_position in positions.items():
+            rest = [course for course in candidates.get(name, []) if course.get('id') not in delivered]
+            if next_position is None and not rest:
+                continue
+            state[name] = {'next': next_position, 'rest': pack_positions(course['_position'] for course in rest)}
+            if rest:
+                payload['rest'][name] = rest
+            if skip.get(name):
+                payload['skip'][name] = sorted(skip[name])
+        
+        if not state:
+            return None
+        payload_id = save_cursor_payload(payload) if payload['rest'] or payload['skip'] else None
+        return encode_cursor(self._cache_key(request), {'platforms': state, 'payload': payload_id})
+    
+    def prewarm_source(self) -> PrewarmSource:
+        """Buscas de cursos recentes, para o pré-aquecimento do cache"""
+        def load(params: Dict[str, Any]) -> Dict[str, Any]:
+            # Buscar nas plataformas: o catálogo devolveria os mesmos cursos que estão vencendo
+            return self._search_courses_uncached(CourseSearchRequest(**params), bypass_catalog=True)
+        
+        def ttl(params: Dict[str, Any], result: Dict[str, Any]) -> float:
+            return self._cache_ttl(CourseSearchRequest(**params), result)
+        
+        return PrewarmSource('courses', _query_log, _search_cache, load, ttl)
+    
+    def _catalog(self) -> Optional[CourseCatalog]:
+        """Catálogo local, se habilitado (desligar o cache também desliga o catálogo)"""
+        return get_course_catalog() if self.config.CACHE_ENABLED else None
+    
+    def _catalog_results(self, catalog: Optional[CourseCatalog], request: CourseSearchRequest,
+                         platforms: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Cursos das plataformas cuja cobertura no catálogo ainda está no prazo"""
+        if catalog is None:
+            return {}
+        
+        local = {}
+        for name in platforms:
+            try:
+                courses = catalog.search(
+                    request.query, name, request.language, request.limit, self.config.CACHE_TTLS[name]
                 )
-                courses.append(course)
+            except Exception as e:
+                logger.warning(f"Erro ao consultar catálogo de cursos: {str(e)}")
+                return {}
+            if courses is not None:
+                local[name] = courses
+        return local
+    
+    def _store_in_catalog(self, catalog: Optional[CourseCatalog], request: CourseSearchRequest,
+                          results: Dict[str, List[Dict[str, Any]]]):
+        """Grava no catálogo os cursos obtidos das plataformas"""
+        if catalog is None:
+            return
+        
+        for name, courses in results.items():
+            try:
+                catalog.upsert(name, request.query, request.language, request.limit, courses)
+            except Exception as e:
+                logger.warning(f"Erro ao gravar cursos da plataforma {name} no catálogo: {str(e)}")
+    
+    def _platforms(self, request: CourseSearchRequest) -> List[str]:
+        """Plataformas consultadas pela busca"""
+        return [name for name in PLATFORMS if request.platform.lower() in ('all', name)]
+    
+    def stream_search_courses(self, request: CourseSearchRequest) -> Iterator[Dict[str, Any]]:
+        """
+        Busca cursos entregando os resultados de cada plataforma assim que ficam prontos
+        
+        Args:
+            request: Objeto com os critérios de busca
             
-            # Aplicar filtros adicionais
-            courses = self._apply_filters(courses, request)
+        Yields:
+            Registros {'type': 'courses', ...} por plataforma e, por último, {'type': 'summary', ...}
+        """
+        cache_key = self._cache_key(request)
+        _query_log.record(cache_key, dataclasses.asdict(request))
+        entry = _search_cache.get(cache_key) if self.config.CACHE_ENABLED else None
+        if entry is not None and entry.is_fresh():
+            # Resultado já conhecido: entregar agrupado por plataforma, na ordem original
+            by_platform: Dict[str, List[Dict[str, Any]]] = {}
+            for course in entry.value['courses']:
+                by_platform.setdefault(course['source'], []).append(course)
+            for name, courses in by_platform.items():
+                yield {'type': 'courses', 'platform': name, 'courses': courses, 'count': len(courses)}
+            yield self._summary_record(request, entry.value['total'], {}, cached=True)
+            return
+        
+        logger.info(f"Iniciando busca de cursos em streaming: {request.query} na plataforma {request.platform}")
+        
+        platforms = self._platforms(request)
+        catalog = self._catalog()
+        local = self._catalog_results(catalog, request, platforms)
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        statuses: Dict[str, str] = {}
+        emitted = 0
+        
+        # Plataformas cobertas pelo catálogo local saem primeiro, sem esperar as demais
+        pending = [name for name in platforms if name not in local]
+        upstream = self.scraper.iter_platform_results(pending, request.query, request.limit, request.language)
+        found = [(name, courses, 'catalog') for name, courses in local.items()]
+        
+        for name, raw_courses, status in itertools.chain(found, upstream):
+            statuses[name] = status
+            if status not in ('ok', 'catalog'):
+                continue
             
-            # Criar resultado
-            result = CourseSearchResult(
+            results[name] = raw_courses
+            if status == 'ok':
+                self._store_in_catalog(catalog, request, {name: raw_courses})
+            courses = [self._to_course(raw_course) for raw_course in raw_courses]
+            courses = self._apply_filters(courses, request)[:request.limit - emitted]
+            if courses:
+                emitted += len(courses)
+                yield {
+                    'type': 'courses',
+                    'platform': name,
+                    'courses': [course.to_dict() for course in courses],
+                    'count': len(courses)
+                }
+        
+        yield self._summary_record(request, emitted, statuses, cached=False)
+        
+        # Gravar no cache o mesmo resultado da busca não-streaming (ranqueamento global)
+        if self.config.CACHE_ENABLED:
+            scored = {name: score_platform_results(raw_courses) for name, raw_courses in results.items()}
+            merged = merge_ranked(scored, platforms, request.limit)
+            courses = self._apply_filters([self._to_course(raw_course) for raw_course in merged], request)
+            result = self._result_dict(CourseSearchResult(
                 courses=courses,
                 total=len(courses),
                 query=request.query,
                 platform=request.platform,
-                timestamp=datetime.now()
-            )
-            
-            logger.info(f"Busca concluída: {len(courses)} cursos encontrados")
-            
-            return result.to_dict()
+                timestamp=datetime.now(),
+                next_cursor=self._first_page_cursor(request, platforms, scored, local, merged)
+            ))
+            result['ttl'] = self._fresh_ttl(catalog, request, platforms, local,
+                                            partial=any(status not in ('ok', 'catalog') for status in statuses.values()))
+            _search_cache.set(cache_key, result, self._cache_ttl(request, result))
+    
+    def _summary_record(self, request: CourseSearchRequest, total: int,
+                        platforms: Dict[str, str], cached: bool) -> Dict[str, Any]:
+        """Registro final da busca em streaming"""
+        return {
+            'type': 'summary',
+            'success': True,
+            'total': total,
+            'query': request.query,
+            'platform': request.platform,
+            'platforms': platforms,
+            'cached': cached,
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def _to_course(self, raw_course: Dict[str, Any]) -> Course:
+        """Converte o dicionário retornado pelo scraper em Course"""
+        return Course(
+            id=raw_course.get('id', ''),
+            title=raw_course.get('title', ''),
+            instructor=raw_course.get('instructor', ''),
+            num_reviews=raw_course.get('num_reviews'),
+            rating=raw_course.get('rating'),
+            students_count=raw_course.get('students_count'),
+            price=raw_course.get('price'),
+            original_price=raw_course.get('original_price'),
+            language=raw_course.get('language'),
+            duration=raw_course.get('duration'),
+            level=raw_course.get('level'),
+            url=raw_course.get('url'),
+            image_url=raw_course.get('image_url'),
+            description=raw_course.get('description'),
+            source=raw_course.get('source', 'unknown')
+        )
+    
+    def _cache_key(self, request: CourseSearchRequest) -> str:
+        """Chave de cache da busca (campos que influenciam o resultado)"""
+        return make_cache_key('courses', {
+            'query': request.query,
+            'platform': request.platform,
+            'limit': request.limit,
+            'level': request.level,
+            'language': request.language,
+            'price_range': request.price_range
+        })
+    
+    def _cache_ttl(self, request: CourseSearchRequest, result: Dict[str, Any]) -> float:
+        """TTL do resultado: a validade calculada na busca (_fresh_ttl) ou o menor TTL das plataformas"""
+        if not result['total']:
+            return self.config.CACHE_EMPTY_TTL
+        if 'ttl' in result:
+            return result['ttl']
+        
+        return min(self.config.CACHE_TTLS[platform] for platform in self._platforms(request))
+    
+    def _fresh_ttl(self, catalog: Optional[CourseCatalog], request: CourseSearchRequest,
+                   platforms: List[str], local: Dict[str, List[Dict[str, Any]]], partial: bool = False) -> float:
+        """
+        Validade de um resultado recém-montado: o menor TTL entre as plataformas consultadas
+        
+        Plataformas respondidas pelo catálogo local valem apenas o que resta da cobertura
+        (CACHE_TTLS menos a idade da busca que a gravou); sem esse desconto o resultado
+        poderia chegar a quase o dobro do TTL da plataforma. Resultados parciais valem
+        no máximo CACHE_PARTIAL_TTL, para que a plataforma que falhou seja consultada logo.
+        
+        Args:
+            catalog: Catálogo local usado na busca
+            request: Busca atendida
+            platforms: Plataformas da busca
+            local: Plataformas respondidas pelo catálogo
+            partial: Alguma plataforma não respondeu (prazo, rate limit ou erro)
             
-        except Exception as e:
-            logger.error(f"Erro na busca de cursos: {str(e)}")
-            raise
+        Returns:
+            TTL em segundos (0 se alguma cobertura já venceu)
+        """
+        now = time.time()
+        ttls = [self.config.CACHE_PARTIAL_TTL] if partial else []
+        for name in platforms:
+            ttl = self.config.CACHE_TTLS[name]
+            if name in local:
+                try:
+                    fetched_at = catalog.fetched_at(request.query, name, request.language)
+                except Exception as e:
+                    logger.warning(f"Erro ao consultar cobertura do catálogo de cursos: {str(e)}")
+                    fetched_at = None
+                # Sem registro da cobertura, não há como saber quanto resta: não estender
+                ttl = ttl - (now - fetched_at) if fetched_at is not None else 0
+            ttls.append(ttl)
+        return max(0.0, min(ttls))
     
     def get_course_details(self, request: CourseDetailRequest) -> Optional[Dict[str, Any]]:
         """
@@ -110,9 +654,6 @@ class CourseService:
             Dicionário com os detalhes do curso ou None se não encontrado
         """
         try:
-            # Aplicar rate limiting
-            self._check_rate_limit()
-            
             logger.info(f"Obtendo detalhes do curso: {request.course_id}")
             
             # Executar busca de detalhes usando o scraper
@@ -122,31 +663,7 @@ class CourseService:
                 logger.warning(f"Curso não encontrado: {request.course_id}")
                 return None
             
-            # Converter para objeto CourseDetail
-            course_detail = CourseDetail(
-                id=raw_details.get('id', ''),
-                title=raw_details.get('title', ''),
-                instructor=raw_details.get('instructor', ''),
-                num_reviews=raw_details.get('num_reviews'),
-                rating=raw_details.get('rating'),
-                students_count=raw_details.get('students_count'),
-                price=raw_details.get('price'),
-                original_price=raw_details.get('original_price'),
-                language=raw_details.get('language'),
-                duration=raw_details.get('duration'),
-                level=raw_details.get('level'),
-                url=raw_details.get('url'),
-                image_url=raw_details.get('image_url'),
-                description=raw_details.get('description'),
-                source=raw_details.get('source', 'unknown'),
-                full_description=raw_details.get('full_description'),
-                curriculum=raw_details.get('curriculum'),
-                requirements=raw_details.get('requirements'),
-                objectives=raw_details.get('objectives'),
-                last_updated=raw_details.get('last_updated'),
-                certificate=raw_details.get('certificate'),
-                subtitles=raw_details.get('subtitles')
-            )
+            course_detail = self._to_course_detail(raw_details)
             
             logger.info(f"Detalhes obtidos com sucesso para: {request.course_id}")
             
@@ -156,6 +673,70 @@ class CourseService:
             logger.error(f"Erro ao obter detalhes do curso {request.course_id}: {str(e)}")
             raise
     
+    def get_courses_details(self, course_ids: List[str]) -> Dict[str, Any]:
+        """
+        Obtém os detalhes de vários cursos de uma vez
+        
+        Args:
+            course_ids: IDs dos cursos (podem ser de plataformas diferentes)
+            
+        Returns:
+            Dicionário com os cursos encontrados e os IDs não encontrados
+        """
+        try:
+            logger.info(f"Obtendo detalhes de {len(course_ids)} cursos")
+            
+            raw_details = self.scraper.get_courses_details(course_ids)
+            
+            courses = []
+            not_found = []
+            for course_id, raw in raw_details.items():
+                if raw:
+                    courses.append(self._to_course_detail(raw).to_dict())
+                else:
+                    not_found.append(course_id)
+            
+            logger.info(f"Detalhes obtidos: {len(courses)} cursos, {len(not_found)} não encontrados")
+            
+            return {
+                'success': True,
+                'courses': courses,
+                'not_found': not_found,
+                'total': len(courses),
+                'timestamp': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Erro ao obter detalhes dos cursos: {str(e)}")
+            raise
+    
+    def _to_course_detail(self, raw_details: Dict[str, Any]) -> CourseDetail:
+        """Converte os detalhes retornados pelo scraper em CourseDetail"""
+        return CourseDetail(
+            id=raw_details.get('id', ''),
+            title=raw_details.get('title', ''),
+            instructor=raw_details.get('instructor', ''),
+            num_reviews=raw_details.get('num_reviews'),
+            rating=raw_details.get('rating'),
+            students_count=raw_details.get('students_count'),
+            price=raw_details.get('price'),
+            original_price=raw_details.get('original_price'),
+            language=raw_details.get('language'),
+            duration=raw_details.get('duration'),
+            level=raw_details.get('level'),
+            url=raw_details.get('url'),
+            image_url=raw_details.get('image_url'),
+            description=raw_details.get('description'),
+            source=raw_details.get('source', 'unknown'),
+            full_description=raw_details.get('full_description'),
+            curriculum=raw_details.get('curriculum'),
+            requirements=raw_details.get('requirements'),
+            objectives=raw_details.get('objectives'),
+            last_updated=raw_details.get('last_updated'),
+            certificate=raw_details.get('certificate'),
+            subtitles=raw_details.get('subtitles')
+        )
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Verifica a saúde do serviço de cursos
@@ -226,23 +807,9 @@ class CourseService:
         
         return filtered_courses
     
-    def _check_rate_limit(self):
-        """
-        Verifica e aplica rate limiting
-        """
-        current_time = time.time()
-        
-        # Rate limit: 10 requisições por minuto
-        if current_time - self._last_request_time < 6:  # 6 segundos entre requisições
-            time.sleep(6 - (current_time - self._last_request_time))
-        
-        self._last_request_time = time.time()
-        self._rate_limit_counter += 1
-    
-    def __del__(self):
-        """Destrutor para limpar recursos"""
-        if hasattr(self, 'scraper'):
-            try:
-                self.scraper.close()
-            except Exception as e:
-                logger.error(f"Erro ao fechar scraper: {str(e)}")
+    def close(self):
+        """Libera os recursos do scraper (chamado no encerramento da aplicação)"""
+        try:
+            self.scraper.close()
+        except Exception as e:
+            logger.error(f"Erro ao fechar scraper: {str(e)}")
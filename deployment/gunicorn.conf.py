@@ -4,10 +4,19 @@ import multiprocessing
 import os
 
 # Configurações básicas
+wsgi_app = "main:create_app()"
 bind = "0.0.0.0:5000"
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
-worker_connections = 1000
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# Classe de worker: gthread (padrão), gevent ou sync
+# Uma busca passa quase todo o tempo esperando as plataformas; com gthread cada worker
+# atende `threads` requisições ao mesmo tempo, e com gevent até `worker_connections`.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+# Com threads > 1 o gunicorn troca sync por gthread; por isso o padrão é 1 fora do gthread
+threads = int(os.environ.get('GUNICORN_THREADS', 8 if worker_class == 'gthread' else 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 100))
+# Com gevent o monkey patch é aplicado no início de main.py (ver comentário lá)
+
 max_requests = 1000
 max_requests_jitter = 50
 timeout = 120
@@ -50,3 +59,18 @@ worker_exit_on_app_exit = True
 
 # Configurações de reload (apenas para desenvolvimento)
 reload = os.environ.get('FLASK_ENV') == 'development'
+
+# Ciclo de vida dos serviços (ver main.startup_app/shutdown_app)
+def post_worker_init(worker):
+    """Cria os serviços do worker antes da primeira requisição"""
+    from main import startup_app
+    startup_app(worker.wsgi)
+
+
+def worker_exit(server, worker):
+    """Libera drivers, sessões e executores do worker ao encerrar"""
+    app = getattr(worker, 'wsgi', None)
+    if app is None:
+        return
+    from main import shutdown_app
+    shutdown_app(app)
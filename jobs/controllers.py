@@ -3,11 +3,19 @@ Controllers para o módulo de vagas
 Responsável por gerenciar as requisições HTTP relacionadas a vagas de emprego
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify, url_for
 from functools import wraps
+from datetime import datetime
 import logging
+import math
+import re
+from common.cache import content_etag
+from common.cursors import InvalidCursor
+from scrapers.rate_limiter import Throttled
 from .services import JobService
 from .models import JobSearchRequest, JobDetailRequest
+from common.tasks import TaskQueueFull, SUCCEEDED, FAILED, FINISHED
+from config.settings import get_config
 import os
 
 logger = logging.getLogger(__name__)
@@ -39,6 +47,39 @@ def require_api_key(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def _get_service() -> JobService:
+    """Serviço do processo, mantido pela aplicação e reutilizado entre requisições"""
+    return current_app.extensions['services'].get('jobs')
+
+def _conditional_response(payload, etag, max_age):
+    """
+    Resposta JSON com ETag e Cache-Control
+    
+    Se o cliente já tem esta versão (If-None-Match), responde 304 sem corpo e sem
+    serializar o resultado.
+    """
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(payload)
+    response.set_etag(etag)
+    # Respostas dependem da API key: apenas o cache do próprio cliente pode reutilizá-las
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response
+
+def _throttled_response(error):
+    """Resposta 429 quando o rate limit de saída para a plataforma de origem se esgotou"""
+    retry_after = max(1, math.ceil(error.retry_after))
+    logger.warning(f"Requisição recusada por rate limit de saída: {str(error)}")
+    response = jsonify({
+        'error': 'rate_limit_exceeded',
+        'message': f'Limite de requisições a {error.host} excedido',
+        'details': {'host': error.host, 'retry_after': retry_after}
+    })
+    response.headers['Retry-After'] = str(retry_after)
+    return response, 429
+
 @jobs_bp.route('/', methods=['POST'])
 @require_api_key
 def search_jobs():
@@ -62,7 +103,8 @@ def search_jobs():
             location=data.get('location'),
             limit=data.get('limit', 10),
             experience_level=data.get('experience_level'),
-            job_type=data.get('job_type')
+            job_type=data.get('job_type'),
+            cursor=data.get('cursor')
         )
         
         # Validar requisição
@@ -74,18 +116,65 @@ def search_jobs():
                 'details': {'field': 'query', 'constraint': 'required'}
             }), 400
         
+        job_service = _get_service()
+        
+        # Busca assíncrona: responder 202 e processar em segundo plano
+        prefer_async = 'respond-async' in request.headers.get('Prefer', '')
+        wants_async = prefer_async or data.get('async') is True
+        if wants_async and not job_service.async_search_available():
+            # Sem estado compartilhado, outro worker não encontraria a tarefa: responder na hora
+            logger.warning("Busca assíncrona indisponível sem backend compartilhado; executando de forma síncrona")
+            wants_async = False
+        if wants_async:
+            try:
+                task = job_service.submit_search(search_request)
+            except TaskQueueFull as e:
+                response = jsonify({
+                    'error': 'service_unavailable',
+                    'message': 'Muitas buscas em andamento, tente novamente em instantes',
+                    'details': {'error': str(e)}
+                })
+                response.headers['Retry-After'] = '5'
+                return response, 503
+            
+            status_url = url_for('jobs.get_search_task', task_id=task['task_id'])
+            response = jsonify({
+                'success': True,
+                'task_id': task['task_id'],
+                'status': task['status'],
+                'status_url': status_url
+            })
+            response.headers['Location'] = status_url
+            response.headers['Retry-After'] = '1'
+            if prefer_async:
+                response.headers['Preference-Applied'] = 'respond-async'
+            return response, 202
+        
         # Executar busca
-        job_service = JobService()
         result = job_service.search_jobs(search_request)
         
-        return jsonify({
-            'success': True,
-            'jobs': result['jobs'],
-            'total': result['total'],
-            'query': search_request.query,
-            'timestamp': result['timestamp']
-        }), 200
+        return _conditional_response(
+            {
+                'success': True,
+                'jobs': result['jobs'],
+                'total': result['total'],
+                'query': search_request.query,
+                'next_cursor': result.get('next_cursor'),
+                'timestamp': result['timestamp']
+            },
+            # Conteúdo do resultado e a query ecoada da requisição
+            content_etag([result.get('etag') or content_etag(result), search_request.query]),
+            job_service.cache_max_age(search_request, result)
+        )
         
+    except InvalidCursor as e:
+        return jsonify({
+            'error': 'validation_error',
+            'message': str(e),
+            'details': {'field': 'cursor', 'constraint': 'invalid'}
+        }), 400
+    except Throttled as e:
+        return _throttled_response(e)
     except Exception as e:
         logger.error(f"Erro ao buscar vagas: {str(e)}")
         return jsonify({
@@ -94,6 +183,121 @@ def search_jobs():
             'details': {'error': str(e)}
         }), 500
 
+@jobs_bp.route('/', methods=['GET'])
+@require_api_key
+def get_jobs_details():
+    """
+    Endpoint para obter detalhes de várias vagas em uma requisição
+    GET /api/v1/jobs?ids=linkedin_1,linkedin_2
+    """
+    try:
+        job_ids = [job_id.strip() for job_id in request.args.get('ids', '').split(',') if job_id.strip()]
+        if not job_ids:
+            return jsonify({
+                'error': 'validation_error',
+                'message': 'Parâmetro ids é obrigatório',
+                'details': {'field': 'ids', 'constraint': 'required'}
+            }), 400
+        
+        max_ids = get_config().JOB_DETAILS_BATCH_MAX
+        if len(job_ids) > max_ids:
+            return jsonify({
+                'error': 'validation_error',
+                'message': f'No máximo {max_ids} IDs por requisição',
+                'details': {'field': 'ids', 'constraint': f'max_items:{max_ids}'}
+            }), 400
+        
+        for job_id in job_ids:
+            validation_error = JobDetailRequest(job_id=job_id).validate()
+            if validation_error:
+                return jsonify({
+                    'error': 'validation_error',
+                    'message': validation_error,
+                    'details': {'field': 'ids', 'value': job_id}
+                }), 400
+        
+        job_service = _get_service()
+        result = job_service.get_jobs_details(job_ids)
+        
+        return _conditional_response(result, content_etag(result), job_service.details_max_age())
+        
+    except Throttled as e:
+        return _throttled_response(e)
+    except Exception as e:
+        logger.error(f"Erro ao obter detalhes das vagas: {str(e)}")
+        return jsonify({
+            'error': 'internal_error',
+            'message': 'Erro interno do servidor',
+            'details': {'error': str(e)}
+        }), 500
+
+def _task_response(task):
+    """Monta o corpo da consulta de uma tarefa de busca"""
+    body = {
+        'success': True,
+        'task_id': task['task_id'],
+        'status': task['status'],
+        'created_at': datetime.fromtimestamp(task['created_at']).isoformat(),
+        'finished_at': datetime.fromtimestamp(task['finished_at']).isoformat() if task['finished_at'] else None
+    }
+    if task['status'] == SUCCEEDED:
+        body['result'] = task['result']
+    elif task['status'] == FAILED:
+        body['error'] = {
+            'error': 'internal_error',
+            'message': 'Erro ao buscar vagas',
+            'details': {'error': task['error']}
+        }
+    return body
+
+@jobs_bp.route('/tasks/<task_id>', methods=['GET'])
+@require_api_key
+def get_search_task(task_id):
+    """
+    Endpoint para consultar uma busca assíncrona
+    GET /api/v1/jobs/tasks/{task_id}?wait=10
+    """
+    try:
+        if not re.match(r'^[0-9a-f]{32}$', task_id):
+            return jsonify({
+                'error': 'validation_error',
+                'message': 'ID de tarefa inválido',
+                'details': {'field': 'task_id', 'value': task_id}
+            }), 400
+        
+        max_wait = get_config().JOB_TASK_MAX_WAIT
+        try:
+            wait = min(max(float(request.args.get('wait', 0)), 0.0), max_wait)
+        except ValueError:
+            return jsonify({
+                'error': 'validation_error',
+                'message': f'wait deve ser um número entre 0 e {max_wait:g}',
+                'details': {'field': 'wait', 'value': request.args.get('wait')}
+            }), 400
+        
+        job_service = _get_service()
+        task = job_service.get_search_task(task_id, wait=wait)
+        
+        if not task:
+            return jsonify({
+                'error': 'task_not_found',
+                'message': 'Tarefa desconhecida ou expirada',
+                'details': {'task_id': task_id, 'result_ttl': get_config().JOB_TASK_RESULT_TTL}
+            }), 404
+        
+        response = jsonify(_task_response(task))
+        if task['status'] not in FINISHED:
+            response.headers['Retry-After'] = '1'
+        return response, 200
+        
+    except Exception as e:
+        logger.error(f"Erro ao consultar tarefa {task_id}: {str(e)}")
+        return jsonify({
+            'error': 'internal_error',
+            'message': 'Erro interno do servidor',
+            'details': {'error': str(e)}
+        }), 500
+
 @jobs_bp.route('/<job_id>', methods=['GET'])
 @require_api_key
 def get_job_details(job_id):
@@ -114,7 +318,7 @@ def get_job_details(job_id):
         detail_request = JobDetailRequest(job_id=job_id)
         
         # Executar busca de detalhes
-        job_service = JobService()
+        job_service = _get_service()
         job_details = job_service.get_job_details(detail_request)
         
         if not job_details:
@@ -124,8 +328,10 @@ def get_job_details(job_id):
                 'details': {'job_id': job_id}
             }), 404
         
-        return jsonify(job_details), 200
+        return _conditional_response(job_details, content_etag(job_details), job_service.details_max_age())
         
+    except Throttled as e:
+        return _throttled_response(e)
     except Exception as e:
         logger.error(f"Erro ao obter detalhes da vaga {job_id}: {str(e)}")
         return jsonify({
@@ -141,14 +347,15 @@ def jobs_health():
     GET /api/v1/jobs/health
     """
     try:
-        job_service = JobService()
+        job_service = _get_service()
         health_status = job_service.health_check()
         
         return jsonify({
             'status': 'healthy',
             'module': 'jobs',
             'timestamp': health_status['timestamp'],
-            'message': 'Módulo de vagas funcionando normalmente'
+            'message': 'Módulo de vagas funcionando normalmente',
+            'driver_pool': health_status['driver_pool']
         }), 200
         
     except Exception as e:
@@ -16,6 +16,8 @@ class JobSearchRequest:
     limit: int = 10
     experience_level: Optional[str] = None
     job_type: Optional[str] = None
+    # next_cursor de uma resposta anterior: continua a mesma busca a partir dali
+    cursor: Optional[str] = None
     
     def validate(self) -> Optional[str]:
         """Valida os dados da requisição"""
@@ -28,6 +30,9 @@ class JobSearchRequest:
         if self.limit < 1 or self.limit > 50:
             return "Limit deve estar entre 1 e 50"
         
+        if self.cursor is not None and not isinstance(self.cursor, str):
+            return "Cursor deve ser uma string"
+        
         if self.experience_level and self.experience_level not in [
             'entry', 'associate', 'mid-senior', 'senior', 'executive'
         ]:
@@ -115,6 +120,7 @@ class JobSearchResult:
     total: int
     query: str
     timestamp: datetime
+    next_cursor: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte o resultado para dicionário"""
@@ -123,7 +129,8 @@ class JobSearchResult:
             'jobs': [job.to_dict() for job in self.jobs],
             'total': self.total,
             'query': self.query,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp.isoformat(),
+            'next_cursor': self.next_cursor
         }
 
 @dataclass
@@ -134,6 +141,7 @@ class JobHealthStatus:
     timestamp: datetime = None
     message: str = 'Módulo de vagas funcionando normalmente'
     error: Optional[str] = None
+    driver_pool: Optional[Dict[str, Any]] = None
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -146,5 +154,6 @@ class JobHealthStatus:
             'module': self.module,
             'timestamp': self.timestamp.isoformat(),
             'message': self.message,
-            'error': self.error
+            'error': self.error,
+            'driver_pool': self.driver_pool
         }
@@ -3,8 +3,8 @@ Services para o módulo de vagas
 Responsável pela lógica de negócio e integração com scrapers
 """
 
+import dataclasses
 import logging
-import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import sys
@@ -14,6 +14,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scrapers.job_scraper import JobScraper
+from common.cache import SearchCache, content_etag, make_cache_key
+from common.cache_backends import get_coordination_backend, get_shared_backend
+from common.cursors import decode_cursor, encode_cursor
+from common.prewarm import PrewarmSource
+from common.query_log import QueryLog
+from common.tasks import TaskManager
+from config.settings import get_config
 from .models import (
     JobSearchRequest, 
     JobDetailRequest, 
@@ -25,13 +32,42 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Cache de buscas: memória do processo + backend compartilhado entre workers (se configurado)
+_search_cache = SearchCache(
+    'jobs',
+    max_entries=get_config().CACHE_MAX_ENTRIES,
+    stale_ttl=get_config().CACHE_STALE_TTL,
+    backend=get_shared_backend
+)
+
+# Buscas assíncronas: executor limitado por worker, estado compartilhado pelo backend
+# de coordenação (o de cache ou, sem CACHE_BACKEND_URL, o SQLite local do nó)
+_search_tasks = TaskManager(
+    'jobs-search',
+    max_workers=get_config().JOB_TASK_WORKERS,
+    max_pending=get_config().JOB_TASK_MAX_PENDING,
+    result_ttl=get_config().JOB_TASK_RESULT_TTL,
+    poll_interval=get_config().JOB_TASK_POLL_INTERVAL,
+    backend=get_coordination_backend
+)
+
+# Buscas recentes do worker, usadas para pré-aquecer as mais frequentes
+_query_log = QueryLog(
+    'jobs',
+    max_queries=get_config().QUERY_LOG_MAX_QUERIES,
+    half_life=get_config().QUERY_LOG_HALF_LIFE
+)
+
+def shutdown_search_tasks():
+    """Encerra o executor das buscas assíncronas do processo"""
+    _search_tasks.shutdown()
+
 class JobService:
     """Serviço para gerenciar operações relacionadas a vagas de emprego"""
     
     def __init__(self):
+        self.config = get_config()
         self.scraper = JobScraper()
-        self._rate_limit_counter = 0
-        self._last_request_time = 0
     
     def search_jobs(self, request: JobSearchRequest) -> Dict[str, Any]:
         """
@@ -42,56 +78,199 @@ class JobService:
             
         Returns:
             Dicionário com os resultados da busca
+            
+        Raises:
+            InvalidCursor: Se request.cursor for inválido ou de outra busca
         """
         try:
-            # Aplicar rate limiting
-            self._check_rate_limit()
+            if request.cursor:
+                # Páginas seguintes partem da posição gravada no cursor, fora do cache
+                return self._search_jobs_upstream(request, decode_cursor(request.cursor, self._cache_key(request)))
             
-            logger.info(f"Iniciando busca de vagas: {request.query} em {request.location or 'todas as localizações'}")
+            cache_key = self._cache_key(request)
+            _query_log.record(cache_key, dataclasses.asdict(request))
             
-            # Executar busca usando o scraper
-            raw_jobs = self.scraper.search_jobs(
-                query=request.query,
-                location=request.location,
-                limit=request.limit
-            )
+            if not self.config.CACHE_ENABLED:
+                # Sem cache, buscas idênticas simultâneas ainda compartilham uma única execução
+                return _search_cache.flight.do(cache_key, lambda: self._search_jobs_upstream(request))
             
-            # Converter para objetos Job
-            jobs = []
-            for raw_job in raw_jobs:
-                job = Job(
-                    id=raw_job.get('id', ''),
-                    title=raw_job.get('title', ''),
-                    company=raw_job.get('company', ''),
-                    location=raw_job.get('location', ''),
-                    description=raw_job.get('description', ''),
-                    url=raw_job.get('url', ''),
-                    posted_date=self._parse_date(raw_job.get('posted_date')),
-                    experience_level=raw_job.get('experience_level'),
-                    job_type=raw_job.get('job_type'),
-                    source=raw_job.get('source', 'linkedin')
-                )
-                jobs.append(job)
-            
-            # Aplicar filtros adicionais
-            jobs = self._apply_filters(jobs, request)
-            
-            # Criar resultado
-            result = JobSearchResult(
-                jobs=jobs,
-                total=len(jobs),
-                query=request.query,
-                timestamp=datetime.now()
+            return _search_cache.get_or_load(
+                cache_key,
+                lambda: self._search_jobs_upstream(request),
+                ttl=self._cache_ttl
             )
             
-            logger.info(f"Busca concluída: {len(jobs)} vagas encontradas")
-            
-            return result.to_dict()
-            
         except Exception as e:
             logger.error(f"Erro na busca de vagas: {str(e)}")
             raise
     
+    def async_search_available(self) -> bool:
+        """
+        Indica se buscas podem ser agendadas em segundo plano
+        
+        Sem backend para o estado das tarefas, a consulta em /tasks/<id> pode cair em
+        outro worker que não conhece a tarefa; nesse caso a busca é feita na hora.
+        
+        Returns:
+            True se o estado das tarefas é visível por todos os workers
+        """
+        return _search_tasks.shared()
+    
+    def submit_search(self, request: JobSearchRequest) -> Dict[str, Any]:
+        """
+        Agenda a busca de vagas em segundo plano
+        
+        Args:
+            request: Objeto com os critérios de busca
+            
+        Returns:
+            Estado inicial da tarefa (task_id, status)
+            
+        Raises:
+            TaskQueueFull: Se o worker já atingiu o limite de buscas em andamento
+            InvalidCursor: Se request.cursor for inválido ou de outra busca
+        """
+        if request.cursor:
+            # Cursor inválido é erro da requisição, não da tarefa
+            decode_cursor(request.cursor, self._cache_key(request))
+        task = _search_tasks.submit(lambda: self.search_jobs(request))
+        logger.info(f"Busca de vagas agendada: {request.query} (tarefa {task['task_id']})")
+        return task
+    
+    def get_search_task(self, task_id: str, wait: float = 0) -> Optional[Dict[str, Any]]:
+        """
+        Consulta uma busca agendada, aguardando a conclusão por até `wait` segundos
+        
+        Args:
+            task_id: ID retornado por submit_search
+            wait: Tempo máximo de espera (long-poll); 0 retorna imediatamente
+            
+        Returns:
+            Estado da tarefa ou None se desconhecida/expirada
+        """
+        if wait > 0:
+            return _search_tasks.wait(task_id, wait)
+        return _search_tasks.get(task_id)
+    
+    def _search_jobs_upstream(self, request: JobSearchRequest,
+                              position: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Executa a busca no LinkedIn, sem passar pelo cache
+        
+        Args:
+            request: Objeto com os critérios de busca
+            position: Posição na listagem gravada no cursor (None para a primeira página)
+            
+        Returns:
+            Dicionário com os resultados da busca
+        """
+        logger.info(f"Iniciando busca de vagas: {request.query} em {request.location or 'todas as localizações'}")
+        
+        # Executar busca usando o scraper
+        raw_jobs = self.scraper.search_jobs(
+            query=request.query,
+            location=request.location,
+            limit=request.limit,
+            start=position['start'] if position else 0
+        )
+        
+        # Converter para objetos Job
+        jobs = []
+        for raw_job in raw_jobs:
+            job = Job(
+                id=raw_job.get('id', ''),
+                title=raw_job.get('title', ''),
+                company=raw_job.get('company', ''),
+                location=raw_job.get('location', ''),
+                description=raw_job.get('description', ''),
+                url=raw_job.get('url', ''),
+                posted_date=self._parse_date(raw_job.get('posted_date')),
+                experience_level=raw_job.get('experience_level'),
+                job_type=raw_job.get('job_type'),
+                source=raw_job.get('source', 'linkedin')
+            )
+            jobs.append(job)
+        
+        # Aplicar filtros adicionais
+        jobs = self._apply_filters(jobs, request)
+        
+        # Criar resultado
+        result = JobSearchResult(
+            jobs=jobs,
+            total=len(jobs),
+            query=request.query,
+            timestamp=datetime.now(),
+            next_cursor=self._next_cursor(request, raw_jobs)
+        )
+        
+        logger.info(f"Busca concluída: {len(jobs)} vagas encontradas")
+        
+        # ETag do conteúdo, guardado junto no cache
+        data = result.to_dict()
+        data['etag'] = content_etag(data)
+        # Paginação interrompida (erro ou rate limit): resultado parcial, refeito logo
+        if not getattr(raw_jobs, 'complete', True):
+            data['ttl'] = self.config.CACHE_PARTIAL_TTL
+        return data
+    
+    def prewarm_source(self) -> PrewarmSource:
+        """Buscas de vagas recentes, para o pré-aquecimento do cache"""
+        return PrewarmSource(
+            'jobs',
+            _query_log,
+            _search_cache,
+            lambda params: self._search_jobs_upstream(JobSearchRequest(**params)),
+            lambda params, result: self._cache_ttl(result)
+        )
+    
+    def cache_max_age(self, request: JobSearchRequest, result: Dict[str, Any]) -> int:
+        """
+        Por quantos segundos o cliente pode reutilizar o resultado da busca
+        
+        Args:
+            request: Busca atendida
+            result: Resultado retornado por search_jobs
+            
+        Returns:
+            O que resta do TTL do resultado no cache (0 sem cache ou em páginas seguintes)
+        """
+        if not self.config.CACHE_ENABLED or request.cursor:
+            return 0
+        age = (datetime.now() - datetime.fromisoformat(result['timestamp'])).total_seconds()
+        return max(0, int(self._cache_ttl(result) - age))
+    
+    def details_max_age(self) -> int:
+        """Por quantos segundos o cliente pode reutilizar detalhes de vagas (TTL do LinkedIn)"""
+        return self.config.CACHE_TTLS['linkedin'] if self.config.CACHE_ENABLED else 0
+    
+    def _next_cursor(self, request: JobSearchRequest, raw_jobs: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Cursor da página seguinte: posição na listagem logo após a última vaga obtida
+        
+        None se a listagem acabou (menos vagas que o limite) ou se a busca foi feita
+        pelo navegador, que não informa a posição das vagas.
+        """
+        positions = [raw_job['_position'] for raw_job in raw_jobs if '_position' in raw_job]
+        if len(raw_jobs) < request.limit or len(positions) < len(raw_jobs):
+            return None
+        return encode_cursor(self._cache_key(request), {'start': max(positions) + 1})
+    
+    def _cache_key(self, request: JobSearchRequest) -> str:
+        """Chave de cache da busca (campos que influenciam o resultado)"""
+        return make_cache_key('jobs', {
+            'query': request.query,
+            'location': request.location,
+            'limit': request.limit,
+            'experience_level': request.experience_level,
+            'job_type': request.job_type
+        })
+    
+    def _cache_ttl(self, result: Dict[str, Any]) -> float:
+        """TTL do resultado em cache (CACHE_PARTIAL_TTL se a busca foi interrompida)"""
+        if not result['total']:
+            return self.config.CACHE_EMPTY_TTL
+        return result.get('ttl', self.config.CACHE_TTLS['linkedin'])
+    
     def get_job_details(self, request: JobDetailRequest) -> Optional[Dict[str, Any]]:
         """
         Obtém detalhes completos de uma vaga específica
@@ -103,9 +282,6 @@ class JobService:
             Dicionário com os detalhes da vaga ou None se não encontrada
         """
         try:
-            # Aplicar rate limiting
-            self._check_rate_limit()
-            
             logger.info(f"Obtendo detalhes da vaga: {request.job_id}")
             
             # Executar busca de detalhes usando o scraper
@@ -116,24 +292,7 @@ class JobService:
                 return None
             
             # Converter para objeto JobDetail
-            job_detail = JobDetail(
-                id=raw_details.get('id', ''),
-                title=raw_details.get('title', ''),
-                company=raw_details.get('company', ''),
-                location=raw_details.get('location', ''),
-                description=raw_details.get('description', ''),
-                url=raw_details.get('url', ''),
-                posted_date=self._parse_date(raw_details.get('posted_date')),
-                experience_level=raw_details.get('experience_level'),
-                job_type=raw_details.get('job_type'),
-                source=raw_details.get('source', 'linkedin'),
-                full_description=raw_details.get('full_description'),
-                requirements=raw_details.get('requirements'),
-                benefits=raw_details.get('benefits'),
-                salary_range=raw_details.get('salary_range'),
-                application_count=raw_details.get('application_count'),
-                skills=raw_details.get('skills')
-            )
+            job_detail = self._to_job_detail(raw_details)
             
             logger.info(f"Detalhes obtidos com sucesso para: {request.job_id}")
             
@@ -143,6 +302,43 @@ class JobService:
             logger.error(f"Erro ao obter detalhes da vaga {request.job_id}: {str(e)}")
             raise
     
+    def get_jobs_details(self, job_ids: List[str]) -> Dict[str, Any]:
+        """
+        Obtém os detalhes de várias vagas de uma vez
+        
+        Args:
+            job_ids: IDs das vagas
+            
+        Returns:
+            Dicionário com as vagas encontradas e os IDs não encontrados
+        """
+        try:
+            logger.info(f"Obtendo detalhes de {len(job_ids)} vagas")
+            
+            raw_details = self.scraper.get_jobs_details(job_ids)
+            
+            jobs = []
+            not_found = []
+            for job_id, raw in raw_details.items():
+                if raw:
+                    jobs.append(self._to_job_detail(raw).to_dict())
+                else:
+                    not_found.append(job_id)
+            
+            logger.info(f"Detalhes obtidos: {len(jobs)} vagas, {len(not_found)} não encontradas")
+            
+            return {
+                'success': True,
+                'jobs': jobs,
+                'not_found': not_found,
+                'total': len(jobs),
+                'timestamp': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Erro ao obter detalhes das vagas: {str(e)}")
+            raise
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Verifica a saúde do serviço de vagas
@@ -156,7 +352,8 @@ class JobService:
             
             health_status = JobHealthStatus(
                 status="healthy",
-                message="Serviço de vagas funcionando normalmente"
+                message="Serviço de vagas funcionando normalmente",
+                driver_pool=self.scraper.pool_stats()
             )
             
             return health_status.to_dict()
@@ -167,7 +364,8 @@ class JobService:
             health_status = JobHealthStatus(
                 status="unhealthy",
                 message="Erro no serviço de vagas",
-                error=str(e)
+                error=str(e),
+                driver_pool=self.scraper.pool_stats()
             )
             
             return health_status.to_dict()
@@ -208,6 +406,35 @@ class JobService:
         
         return filtered_jobs
     
+    def _to_job_detail(self, raw_details: Dict[str, Any]) -> JobDetail:
+        """
+        Converte os dados brutos do scraper em JobDetail
+        
+        Args:
+            raw_details: Dicionário retornado pelo scraper
+            
+        Returns:
+            Objeto JobDetail
+        """
+        return JobDetail(
+            id=raw_details.get('id', ''),
+            title=raw_details.get('title', ''),
+            company=raw_details.get('company', ''),
+            location=raw_details.get('location', ''),
+            description=raw_details.get('description', ''),
+            url=raw_details.get('url', ''),
+            posted_date=self._parse_date(raw_details.get('posted_date')),
+            experience_level=raw_details.get('experience_level'),
+            job_type=raw_details.get('job_type'),
+            source=raw_details.get('source', 'linkedin'),
+            full_description=raw_details.get('full_description'),
+            requirements=raw_details.get('requirements'),
+            benefits=raw_details.get('benefits'),
+            salary_range=raw_details.get('salary_range'),
+            application_count=raw_details.get('application_count'),
+            skills=raw_details.get('skills')
+        )
+    
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """
         Converte string de data para datetime
@@ -244,23 +471,9 @@ class JobService:
             logger.error(f"Erro ao parsear data {date_str}: {str(e)}")
             return None
     
-    def _check_rate_limit(self):
-        """
-        Verifica e aplica rate limiting
-        """
-        current_time = time.time()
-        
-        # Rate limit: 10 requisições por minuto
-        if current_time - self._last_request_time < 6:  # 6 segundos entre requisições
-            time.sleep(6 - (current_time - self._last_request_time))
-        
-        self._last_request_time = time.time()
-        self._rate_limit_counter += 1
-    
-    def __del__(self):
-        """Destrutor para limpar recursos"""
-        if hasattr(self, 'scraper'):
-            try:
-                self.scraper.close()
-            except Exception as e:
-                logger.error(f"Erro ao fechar scraper: {str(e)}")
+    def close(self):
+        """Libera os recursos do scraper (chamado no encerramento da aplicação)"""
+        try:
+            self.scraper.close()
+        except Exception as e:
+            logger.error(f"Erro ao fechar scraper: {str(e)}")
@@ -4,6 +4,14 @@ Integra todos os módulos (courses, jobs) e configura a aplicação Flask
 """
 
 import os
+
+if os.environ.get('GUNICORN_WORKER_CLASS') == 'gevent':
+    # Com preload_app o gunicorn importa a aplicação no master, antes de o worker gevent
+    # aplicar o patch; locks e sockets criados nos imports abaixo seriam os nativos e
+    # bloqueariam o worker inteiro. Por isso o patch vem antes de qualquer outro import.
+    from gevent import monkey
+    monkey.patch_all()
+
 import logging
 from datetime import datetime
 from flask import Flask, jsonify, request
@@ -13,7 +21,18 @@ from flask_limiter.util import get_remote_address
 
 # Importar blueprints dos módulos
 from courses.controllers import courses_bp
+from courses.catalog import close_course_catalog
+from courses.services import CourseService, shutdown_batch_executor
 from jobs.controllers import jobs_bp
+from jobs.services import JobService, shutdown_search_tasks
+from common.cache import shutdown_refresh_executor
+from common.cache_backends import close_coordination_backend, close_shared_backend
+from common.lifecycle import ServiceRegistry
+from common.prewarm import create_prewarm_crawler
+from scrapers import http_pool
+from scrapers.course_scraper import shutdown_executors
+from scrapers.driver_pool import close_driver_pool
+from scrapers.job_scraper import shutdown_detail_executor
 
 # Configurar logging
 logging.basicConfig(
@@ -45,6 +64,28 @@ def create_app():
         default_limits=["200 per day", "50 per hour"]
     )
     
+    # Serviços do processo, reutilizados entre requisições (ver shutdown_app)
+    services = ServiceRegistry()
+    services.register('courses', CourseService)
+    services.register('jobs', JobService)
+    # Pré-aquecimento das buscas frequentes (thread iniciada no startup do worker)
+    services.register('prewarm', lambda: create_prewarm_crawler([
+        services.get('courses').prewarm_source(),
+        services.get('jobs').prewarm_source()
+    ]))
+    # Recursos compartilhados, liberados na ordem inversa após os serviços
+    services.on_shutdown(close_shared_backend)
+    services.on_shutdown(close_coordination_backend)
+    services.on_shutdown(close_course_catalog)
+    services.on_shutdown(http_pool.close_all)
+    services.on_shutdown(close_driver_pool)
+    services.on_shutdown(shutdown_refresh_executor)
+    services.on_shutdown(shutdown_executors)
+    services.on_shutdown(shutdown_detail_executor)
+    services.on_shutdown(shutdown_search_tasks)
+    services.on_shutdown(shutdown_batch_executor)
+    app.extensions['services'] = services
+    
     # Registrar blueprints
     app.register_blueprint(courses_bp)
     app.register_blueprint(jobs_bp)
@@ -82,12 +123,16 @@ def create_app():
                 'health': '/health',
                 'courses': {
                     'search': 'POST /api/v1/courses',
+                    'search_batch': 'POST /api/v1/courses/batch',
                     'details': 'GET /api/v1/courses/{course_id}',
+                    'details_batch': 'GET /api/v1/courses?ids={course_id},{course_id}',
                     'health': 'GET /api/v1/courses/health'
                 },
                 'jobs': {
                     'search': 'POST /api/v1/jobs',
                     'details': 'GET /api/v1/jobs/{job_id}',
+                    'details_batch': 'GET /api/v1/jobs?ids={job_id},{job_id}',
+                    'search_task': 'GET /api/v1/jobs/tasks/{task_id}',
                     'health': 'GET /api/v1/jobs/health'
                 }
             },
@@ -134,6 +179,14 @@ def create_app():
     
     return app
 
+def startup_app(app):
+    """Cria os serviços do processo antes da primeira requisição (hook post_worker_init do gunicorn)"""
+    app.extensions['services'].startup()
+
+def shutdown_app(app):
+    """Encerra serviços, drivers, sessões e executores do processo (hook worker_exit do gunicorn)"""
+    app.extensions['services'].shutdown()
+
 if __name__ == '__main__':
     # Criar diretório de logs se não existir
     os.makedirs('logs', exist_ok=True)
@@ -150,4 +203,8 @@ if __name__ == '__main__':
     logger.info(f"Modo debug: {debug}")
     
     # Executar aplicação
-    app.run(host=host, port=port, debug=debug)
+    startup_app(app)
+    try:
+        app.run(host=host, port=port, debug=debug)
+    finally:
+        shutdown_app(app)
@@ -1,33 +1,114 @@
 import os
 import time
 import logging
-import requests
-import cloudscraper
-import pandas as pd
-from typing import List, Dict, Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+
+from config.settings import get_config
+from .rate_limiter import Throttled, get_host_limiter
+from .http_pool import get_session
+from .ranking import (
+    ScoreCeilings, TopKRanker, kth_best_score, merge_ranked, score_platform_results, udemy_rank_key
+)
 
 logger = logging.getLogger(__name__)
 
+# Plataformas suportadas, na ordem em que os resultados são concatenados
+PLATFORMS = ('udemy', 'coursera', 'edx')
+
+UDEMY_HOST = 'www.udemy.com'
+# A busca da Udemy devolve páginas de 12 cursos
+UDEMY_PAGE_SIZE = 12
+COURSERA_HOST = 'www.coursera.org'
+# API de catálogo da Coursera: outro host, com rate limit e pool de conexões próprios
+COURSERA_API_HOST = 'api.coursera.org'
+EDX_HOST = 'www.edx.org'
+
+# Campos pedidos à API da Udemy (fields[...]): apenas o que é mapeado em Course/CourseDetail,
+# em vez do payload padrão com dezenas de campos descartados
+UDEMY_SEARCH_FIELDS = {
+    'fields[course]': ','.join((
+        'id', 'title', 'url', 'headline', 'visible_instructors', 'num_reviews', 'rating',
+        'num_subscribers', 'price', 'price_detail', 'lang_s', 'content_info', 'instructional_level',
+        'image_480x270'
+    )),
+    'fields[user]': 'display_name'
+}
+UDEMY_DETAIL_FIELDS = {
+    'fields[course]': ','.join((
+        'title', 'url', 'description', 'visible_instructors', 'num_reviews', 'rating', 'num_subscribers',
+        'price', 'price_detail', 'locale', 'content_info', 'instructional_level', 'image_480x270',
+        'requirements', 'objectives', 'curriculum'
+    )),
+    'fields[user]': 'display_name',
+    'fields[locale]': 'title'
+}
+
+# API de catálogo da Coursera: aceita vários IDs em uma requisição
+COURSERA_COURSES_URL = f'https://{COURSERA_API_HOST}/api/courses.v1'
+COURSERA_COURSE_FIELDS = 'description,photoUrl,primaryLanguages,workload,instructorIds,certificates'
+
+# Melhores escores recentes de cada plataforma (por processo), usados para encerrar a busca cedo
+_score_ceilings = ScoreCeilings(
+    window=get_config().COURSE_RANK_CEILING_WINDOW,
+    min_samples=get_config().COURSE_RANK_CEILING_MIN_SAMPLES,
+    ttl=get_config().COURSE_RANK_CEILING_TTL
+)
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(name: str = 'course-search') -> ThreadPoolExecutor:
+    """
+    Retorna um executor compartilhado pelo processo
+    
+    Executores separados evitam que tarefas aninhadas (páginas da Udemy dentro
+    do fan-out de plataformas) esperem por threads do mesmo pool.
+    """
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=get_config().COURSE_SEARCH_MAX_WORKERS,
+                    thread_name_prefix=name
+                )
+                _executors[name] = executor
+    return executor
+
+
+def shutdown_executors():
+    """Encerra os executores do processo (chamado no encerramento do worker)"""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class CourseScraper:
     def __init__(self):
+        self.config = get_config()
         self.driver = None
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
         
-        # Inicializar cloudscraper para Udemy
-        self.udemy_scraper = cloudscraper.create_scraper()
+        # Sessão HTTP compartilhada pelo processo (keep-alive entre requisições)
+        self.session = get_session('default')
+    
+    @property
+    def udemy_scraper(self):
+        """Pool de sessões cloudscraper da Udemy, criado (e o cloudscraper importado) no primeiro uso"""
+        return get_session('udemy')
         
     def _setup_driver(self):
         """Configura o driver do Chrome com opções headless"""
+        # Selenium só é carregado por quem precisa de navegador
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -55,122 +136,278 @@ class CourseScraper:
         Returns:
             Lista de cursos encontrados
         """
-        courses = []
-        
         try:
-            if platform.lower() == "all" or platform.lower() == "udemy":
-                udemy_courses = self._search_udemy(query, limit, language)
-                courses.extend(udemy_courses)
+            platform = platform.lower()
+            platforms = [name for name in PLATFORMS if platform in ('all', name)]
             
-            if platform.lower() == "all" or platform.lower() == "coursera":
-                coursera_courses = self._search_coursera(query, limit)
-                courses.extend(coursera_courses)
+            results = self.search_platforms(platforms, query, limit, language)
             
-            if platform.lower() == "all" or platform.lower() == "edx":
-                edx_courses = self._search_edx(query, limit)
-                courses.extend(edx_courses)
-            
-            # Ordenar por relevância e limitar resultados
-            courses = courses[:limit]
+            # Intercalar as plataformas pelo escore normalizado; as que estouraram o prazo ficam de fora
+            courses = merge_ranked(results, platforms, limit)
             
             logger.info(f"Encontrados {len(courses)} cursos para '{query}' na plataforma {platform}")
             return courses
             
+        except Throttled:
+            raise
         except Exception as e:
             logger.error(f"Erro na busca de cursos: {str(e)}")
             return []
     
-    def _search_udemy(self, query: str, limit: int, language: str) -> List[Dict]:
-        """Busca cursos na Udemy usando cloudscraper e pandas"""
+    def search_platforms(self, platforms: List[str], query: str, limit: int, language: str,
+                         known: Optional[Dict[str, List[Dict]]] = None,
+                         starts: Optional[Dict[str, int]] = None) -> Dict[str, List[Tuple[float, int, Dict]]]:
+        """
+        Consulta as plataformas em paralelo e pontua os cursos de cada uma
+        
+        Args:
+            platforms: Plataformas da busca
+            query: Termo de busca
+            limit: Número máximo de resultados
+            language: Idioma dos cursos
+            known: Cursos já conhecidos de algumas plataformas (ex.: catálogo local);
+                essas plataformas não são consultadas
+            starts: Posição na listagem de cada plataforma a partir da qual buscar (paginação)
+            
+        Returns:
+            Plataforma -> cursos pontuados (score_platform_results), apenas com as que responderam
+            
+        Raises:
+            Throttled: Se nenhuma das plataformas consultadas tinha capacidade de saída
+        """
+        results = {name: score_platform_results(courses) for name, courses in (known or {}).items()}
+        pending = [name for name in platforms if name not in results]
+        
+        def can_skip(name: str) -> bool:
+            # O melhor escore recente da plataforma não alcança o k-ésimo já obtido
+            # (estimativa, não limite: pode descartar cursos que entrariam no top-k)
+            if not self.config.COURSE_RANK_EARLY_STOP or len(platforms) == 1:
+                return False
+            threshold = kth_best_score(results, limit)
+            return threshold is not None and _score_ceilings.ceiling(name) <= threshold
+        
+        throttled = []
+        for name, raw_courses, status in self.iter_platform_results(
+            pending, query, limit, language, skip=can_skip, starts=starts
+        ):
+            if status == 'ok':
+                results[name] = score_platform_results(raw_courses)
+                _score_ceilings.record(name, results[name])
+            elif status == 'throttled':
+                throttled.append(raw_courses)
+        
+        # Nenhuma plataforma tinha capacidade: sinalizar para o cliente tentar mais tarde
+        if throttled and len(throttled) == len(pending):
+            raise min(throttled, key=lambda error: error.retry_after)
+        
+        return results
+    
+    def iter_platform_results(self, platforms: List[str], query: str, limit: int, language: str,
+                              skip: Optional[Callable[[str], bool]] = None,
+                              starts: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, Optional[List[Dict]], str]]:
+        """
+        Consulta as plataformas em paralelo e entrega cada resultado assim que fica pronto
+        
+        Args:
+            platforms: Plataformas a consultar
+            query: Termo de busca
+            limit: Número máximo de resultados por plataforma
+            language: Idioma dos cursos
+            skip: Chamada após cada resultado para cada plataforma pendente; se retornar
+                True, a busca nela é cancelada
+            starts: Posição na listagem de cada plataforma a partir da qual buscar (paginação)
+            
+        Yields:
+            Tuplas (plataforma, cursos, status) na ordem de conclusão; status é 'ok',
+            'timeout' (prazo da plataforma esgotado), 'skipped' (descartada por `skip`)
+            ou 'error' (cursos é None nesses casos), ou 'throttled' (no lugar dos cursos
+            vem a exceção Throttled, com o tempo sugerido para nova tentativa)
+        """
+        starts = starts or {}
+        searches = {
+            'udemy': lambda: self._search_udemy(query, limit, language, start=starts.get('udemy', 0)),
+            'coursera': lambda: self._search_coursera(query, limit, start=starts.get('coursera', 0)),
+            'edx': lambda: self._search_edx(query, limit, start=starts.get('edx', 0))
+        }
+        
+        started_at = time.monotonic()
+        executor = _get_executor()
+        futures = {executor.submit(searches[name]): name for name in platforms}
+        deadlines = {future: started_at + self._platform_timeout(name) for future, name in futures.items()}
+        pending = set(futures)
+        
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=max(0.0, min(deadlines[future] for future in pending) - time.monotonic()),
+                return_when=FIRST_COMPLETED
+            )
+            
+            # Entregar na ordem das plataformas os que terminaram juntos
+            for future in sorted(done, key=lambda future: platforms.index(futures[future])):
+                pending.discard(future)
+                name = futures[future]
+                try:
+                    yield name, future.result(), 'ok'
+                except Throttled as e:
+                    logger.warning(f"Plataforma {name} sem capacidade de saída: {str(e)}")
+                    yield name, e, 'throttled'
+                except Exception as e:
+                    logger.error(f"Erro ao buscar cursos na plataforma {name}: {str(e)}")
+                    yield name, None, 'error'
+            
+            now = time.monotonic()
+            for future in sorted(pending, key=lambda future: platforms.index(futures[future])):
+                if done and skip is not None and not future.done() and skip(futures[future]):
+                    pending.discard(future)
+                    future.cancel()
+                    logger.info(f"Plataforma {futures[future]} descartada: não alcançaria os melhores resultados")
+                    yield futures[future], None, 'skipped'
+                elif deadlines[future] <= now and not future.done():
+                    pending.discard(future)
+                    future.cancel()
+                    name = futures[future]
+                    logger.warning(f"Plataforma {name} excedeu o prazo de {self._platform_timeout(name)}s e foi descartada")
+                    yield name, None, 'timeout'
+    
+    def _platform_timeout(self, platform: str) -> float:
+        """Prazo máximo (segundos) de uma plataforma na busca concorrente"""
+        return self.config.COURSE_PLATFORM_TIMEOUTS.get(platform, self.config.SCRAPER_TIMEOUT)
+    
+    def _search_udemy(self, query: str, limit: int, language: str, start: int = 0) -> List[Dict]:
+        """
+        Busca cursos na Udemy usando cloudscraper, ranqueando por rating e reviews
+        
+        `limit` define quantas páginas buscar; todos os cursos delas (a partir de `start`)
+        são devolvidos, do melhor para o pior, para que a paginação guarde os que não
+        forem entregues sem buscar a mesma página de novo.
+        """
         try:
-            # Headers específicos para Udemy
-            headers = {
-                "Referer": f"https://www.udemy.com/courses/search/?p=1&q={query}&src=ukw",
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-            }
+            # Paginação: começar na página que contém a posição `start` da listagem
+            first_page, skipped = divmod(start, UDEMY_PAGE_SIZE)
+            max_pages = min(3, ((skipped + limit) // UDEMY_PAGE_SIZE) + 1)
             
-            cursos_totais = []
-            max_pages = min(3, (limit // 12) + 1)  # Udemy retorna ~12 cursos por página
+            # Páginas buscadas em paralelo; o token bucket do host controla o ritmo
+            executor = _get_executor('udemy-pages')
+            futures = {
+                executor.submit(self._fetch_udemy_page, query, language, page): page
+                for page in range(first_page + 1, first_page + max_pages + 1)
+            }
             
-            for i in range(1, max_pages + 1):
+            # Ranquear à medida que as páginas chegam (cabem todos os cursos buscados)
+            ranker = TopKRanker(max_pages * UDEMY_PAGE_SIZE, key=udemy_rank_key)
+            throttled = []
+            errors = []
+            for future in as_completed(futures):
+                page = futures[future]
                 try:
-                    # URL da API da Udemy
-                    url_api = f'https://www.udemy.com/api-2.0/search-courses/?src=ukw&q={query}&skip_price=true&lang={language}&p={i}'
-                    
-                    response = self.udemy_scraper.get(url_api, headers=headers)
-                    response.raise_for_status()
-                    
-                    # Parsear a resposta JSON
-                    data = response.json()
-                    print(data)
-                    
-                    # Extrair dados dos cursos
-                    cursos = data.get("courses", [])
-                    
-                    for curso in cursos:
-                        curso_data = {
-                            "id": f"udemy_{curso.get('id')}",
-                            "title": curso.get("title"),
-                            "instructor": curso.get("visible_instructors", [{}])[0].get("display_name", ""),
-                            "num_reviews": curso.get("num_reviews"),
-                            "rating": curso.get("rating"),
-                            "students_count": curso.get("num_students"),
-                            "price": curso.get("price"),
-                            "original_price": curso.get("price_detail", {}).get("list_price"),
-                            "language": curso.get("lang_s"),
-                            "duration": curso.get("content_info"),
-                            "level": curso.get("instructional_level"),
-                            "url": f"https://www.udemy.com{curso.get('url')}",
-                            "image_url": curso.get("image_480x270"),
-                            "description": curso.get("headline"),
-                            "source": "udemy"
-                        }
-                        cursos_totais.append(curso_data)
-                        
-                        # Log para debug
-                        logger.debug(f"Curso encontrado: {curso_data['title']}")
-                        logger.debug(f"Reviews: {curso_data['num_reviews']}")
-                        logger.debug(f"Rating: {curso_data['rating']}")
-                    
-                    # Pausa entre requisições para evitar rate limiting
-                    time.sleep(1)
-                    
+                    cursos = future.result()
+                    # Página incompleta: fim da listagem (a paginação não busca a seguinte)
+                    if cursos and len(cursos) < UDEMY_PAGE_SIZE:
+                        cursos[-1]['_last'] = True
+                    ranker.extend([curso for curso in cursos if curso['_position'] >= start], group=page)
+                except Throttled as e:
+                    logger.warning(f"Rate limit da Udemy: página {page} descartada")
+                    throttled.append(e)
                 except Exception as e:
-                    logger.error(f"Erro ao buscar página {i} da Udemy: {str(e)}")
-                    continue
+                    logger.error(f"Erro ao buscar página {page} da Udemy: {str(e)}")
+                    errors.append(e)
+            
+            # Nenhuma página obtida: falha, não listagem vazia (a paginação mantém a posição)
+            if len(throttled) + len(errors) == len(futures):
+                raise throttled[0] if throttled else errors[0]
             
-            # Usar pandas para processar e ordenar os dados
+            cursos_totais = ranker.results()
             if cursos_totais:
-                df = pd.DataFrame(cursos_totais)
-                
-                # Ordenar por rating (se disponível) e número de reviews
-                if 'rating' in df.columns and 'num_reviews' in df.columns:
-                    df = df.sort_values(['rating', 'num_reviews'], ascending=[False, False])
-                
-                # Converter de volta para lista de dicionários
-                cursos_totais = df.head(limit).to_dict('records')
-                
                 logger.info(f"Total de cursos encontrados na Udemy: {len(cursos_totais)}")
             
             return cursos_totais
             
+        except Throttled:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar cursos na Udemy: {str(e)}")
-            return []
+            raise
+    
+    def _fetch_udemy_page(self, query: str, language: str, page: int) -> List[Dict]:
+        """
+        Busca uma página de resultados na API de busca da Udemy
+        
+        Args:
+            query: Termo de busca
+            language: Idioma dos cursos
+            page: Número da página (a partir de 1)
+            
+        Returns:
+            Lista de cursos da página
+            
+        Raises:
+            Throttled: Se o rate limit da Udemy não liberar a requisição dentro do prazo
+        """
+        timeout = self._platform_timeout('udemy')
+        get_host_limiter(UDEMY_HOST).permit(timeout=timeout)
+        
+        # Headers específicos para Udemy
+        headers = {
+            "Referer": f"https://www.udemy.com/courses/search/?p=1&q={query}&src=ukw",
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+        }
+        
+        # URL da API da Udemy
+        url_api = 'https://www.udemy.com/api-2.0/search-courses/'
+        params = {'src': 'ukw', 'q': query, 'skip_price': 'true', 'lang': language, 'p': page, **UDEMY_SEARCH_FIELDS}
+        
+        response = self.udemy_scraper.get(url_api, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        
+        # Parsear a resposta JSON
+        data = response.json()
+        
+        # Extrair dados dos cursos
+        cursos = []
+        for index, curso in enumerate(data.get("courses", [])):
+            curso_data = {
+                "id": f"udemy_{curso.get('id')}",
+                "title": curso.get("title"),
+                "instructor": curso.get("visible_instructors", [{}])[0].get("display_name", ""),
+                "num_reviews": curso.get("num_reviews"),
+                "rating": curso.get("rating"),
+                "students_count": curso.get("num_subscribers"),
+                "price": curso.get("price"),
+                "original_price": curso.get("price_detail", {}).get("list_price"),
+                "language": curso.get("lang_s"),
+                "duration": curso.get("content_info"),
+                "level": curso.get("instructional_level"),
+                "url": f"https://www.udemy.com{curso.get('url')}",
+                "image_url": curso.get("image_480x270"),
+                "description": curso.get("headline"),
+                "source": "udemy",
+                # Posição na listagem da Udemy (paginação por cursor)
+                "_position": (page - 1) * UDEMY_PAGE_SIZE + index
+            }
+            cursos.append(curso_data)
+            
+            # Log para debug
+            logger.debug(f"Curso encontrado: {curso_data['title']}")
+            logger.debug(f"Reviews: {curso_data['num_reviews']}")
+            logger.debug(f"Rating: {curso_data['rating']}")
+        
+        return cursos
     
-    def _search_coursera(self, query: str, limit: int) -> List[Dict]:
+    def _search_coursera(self, query: str, limit: int, start: int = 0) -> List[Dict]:
         """Busca cursos na Coursera"""
         try:
             # URL de busca da Coursera
-            search_url = f"https://www.coursera.org/api/searchQuery?query={query}&start=0&limit={limit}"
+            search_url = f"https://www.coursera.org/api/searchQuery?query={query}&start={start}&limit={limit}"
             
-            response = self.session.get(search_url)
+            get_host_limiter(COURSERA_HOST).permit(timeout=self._platform_timeout('coursera'))
+            response = self.session.get(search_url, timeout=self._platform_timeout('coursera'))
             response.raise_for_status()
             
             data = response.json()
             courses = []
             
-            for course in data.get('linked', {}).get('onDemandCourses', {}).get('v1', []):
+            for index, course in enumerate(data.get('linked', {}).get('onDemandCourses', {}).get('v1', [])):
                 course_data = {
                     'id': f"coursera_{course.get('id')}",
                     'title': course.get('name'),
@@ -184,29 +421,42 @@ class CourseScraper:
                     'url': f"https://www.coursera.org/learn/{course.get('slug')}",
                     'image_url': course.get('photoUrl'),
                     'description': course.get('description'),
-                    'source': 'coursera'
+                    'source': 'coursera',
+                    '_position': start + index
                 }
                 courses.append(course_data)
             
+            # Menos cursos que o pedido: fim da listagem
+            if courses and len(courses) < limit:
+                courses[-1]['_last'] = True
+            
             return courses
             
+        except Throttled:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar cursos na Coursera: {str(e)}")
-            return []
+            raise
     
-    def _search_edx(self, query: str, limit: int) -> List[Dict]:
+    def _search_edx(self, query: str, limit: int, start: int = 0) -> List[Dict]:
         """Busca cursos na edX"""
         try:
-            # URL de busca da edX
-            search_url = f"https://www.edx.org/api/v1/search/catalog/?q={query}&page=1&page_size={limit}"
+            # URL de busca da edX; com `start`, a página de `limit` cursos que contém essa posição
+            page = start // limit + 1
+            search_url = f"https://www.edx.org/api/v1/search/catalog/?q={query}&page={page}&page_size={limit}"
             
-            response = self.session.get(search_url)
+            get_host_limiter(EDX_HOST).permit(timeout=self._platform_timeout('edx'))
+            response = self.session.get(search_url, timeout=self._platform_timeout('edx'))
             response.raise_for_status()
             
             data = response.json()
             courses = []
             
-            for course in data.get('objects', {}).get('results', []):
+            listing = data.get('objects', {}).get('results', [])
+            for index, course in enumerate(listing):
+                position = (page - 1) * limit + index
+                if position < start:
+                    continue
                 course_data = {
                     'id': f"edx_{course.get('key')}",
                     'title': course.get('title'),
@@ -220,15 +470,22 @@ class CourseScraper:
                     'url': f"https://www.edx.org{course.get('url')}",
                     'image_url': course.get('image', {}).get('src'),
                     'description': course.get('short_description'),
-                    'source': 'edx'
+                    'source': 'edx',
+                    '_position': position
                 }
                 courses.append(course_data)
             
+            # Página incompleta: fim da listagem
+            if courses and len(listing) < limit:
+                courses[-1]['_last'] = True
+            
             return courses
             
+        except Throttled:
+            raise
         except Exception as e:
             logger.error(f"Erro ao buscar cursos na edX: {str(e)}")
-            return []
+            raise
     
     def get_course_details(self, course_id: str) -> Optional[Dict]:
         """
@@ -252,10 +509,57 @@ class CourseScraper:
                 # Tentar detectar automaticamente
                 return self._detect_and_get_course_details(course_id)
                 
+        except Throttled:
+            raise
         except Exception as e:
             logger.error(f"Erro ao obter detalhes do curso {course_id}: {str(e)}")
             return None
     
+    def get_courses_details(self, course_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Obtém os detalhes de vários cursos, agrupados por plataforma
+        
+        Os grupos são buscados em paralelo. Plataformas com endpoint em lote (Coursera)
+        recebem uma única requisição para todos os seus IDs; nas demais cada curso é
+        buscado em paralelo, nas sessões HTTP compartilhadas.
+        
+        Args:
+            course_ids: IDs dos cursos (udemy_<id>, coursera_<id>, edx_<id>)
+            
+        Returns:
+            Dicionário ID -> detalhes (None para cursos não encontrados)
+        """
+        unique_ids = list(dict.fromkeys(course_ids))
+        coursera_ids = [course_id for course_id in unique_ids if course_id.startswith('coursera_')]
+        other_ids = [course_id for course_id in unique_ids if not course_id.startswith('coursera_')]
+        
+        executor = _get_executor('course-details')
+        futures = {course_id: executor.submit(self.get_course_details, course_id) for course_id in other_ids}
+        if coursera_ids:
+            futures[tuple(coursera_ids)] = executor.submit(self._get_coursera_courses_details, coursera_ids)
+        
+        details: Dict[str, Optional[Dict]] = {}
+        throttled = []
+        for key, future in futures.items():
+            group = list(key) if isinstance(key, tuple) else [key]
+            try:
+                result = future.result()
+                if isinstance(key, tuple):
+                    details.update(result)
+                else:
+                    details[key] = result
+            except Throttled as e:
+                logger.warning(f"Rate limit atingido: detalhes de {', '.join(group)} não obtidos")
+                throttled.append(e)
+                details.update(dict.fromkeys(group))
+            except Exception as e:
+                logger.error(f"Erro ao obter detalhes de {', '.join(group)}: {str(e)}")
+                details.update(dict.fromkeys(group))
+        
+        if throttled and len(throttled) == len(futures):
+            raise throttled[0]
+        return {course_id: details.get(course_id) for course_id in unique_ids}
+    
     def _get_udemy_course_details(self, course_id: str) -> Optional[Dict]:
         """Obtém detalhes de um curso da Udemy usando cloudscraper"""
         try:
@@ -270,7 +574,10 @@ class CourseScraper:
             
             url = f"https://www.udemy.com/api-2.0/courses/{actual_id}/"
             
-            response = self.udemy_scraper.get(url, headers=headers)
+            get_host_limiter(UDEMY_HOST).permit(timeout=self.config.SCRAPER_TIMEOUT)
+            response = self.udemy_scraper.get(
+                url, params=UDEMY_DETAIL_FIELDS, headers=headers, timeout=self.config.SCRAPER_TIMEOUT
+            )
             response.raise_for_status()
             
             course = response.json()
@@ -281,7 +588,7 @@ class CourseScraper:
                 'instructor': course.get('visible_instructors', [{}])[0].get('display_name', ''),
                 'rating': course.get('rating'),
                 'num_reviews': course.get('num_reviews'),
-                'students_count': course.get('num_students'),
+                'students_count': course.get('num_subscribers'),
                 'price': course.get('price'),
                 'original_price': course.get('price_detail', {}).get('list_price'),
                 'language': course.get('locale', {}).get('title'),
@@ -296,14 +603,54 @@ class CourseScraper:
                 'source': 'udemy'
             }
             
+        except Throttled:
+            raise
         except Exception as e:
             logger.error(f"Erro ao obter detalhes do curso Udemy {course_id}: {str(e)}")
             return None
     
     def _get_coursera_course_details(self, course_id: str) -> Optional[Dict]:
         """Obtém detalhes de um curso da Coursera"""
-        # Implementar lógica específica para Coursera
-        return None
+        return self._get_coursera_courses_details([course_id]).get(course_id)
+    
+    def _get_coursera_courses_details(self, course_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Obtém detalhes de vários cursos da Coursera em uma única requisição à API de catálogo"""
+        actual_ids = {course_id.replace('coursera_', '', 1): course_id for course_id in course_ids}
+        details: Dict[str, Optional[Dict]] = dict.fromkeys(course_ids)
+        
+        try:
+            get_host_limiter(COURSERA_API_HOST).permit(timeout=self.config.SCRAPER_TIMEOUT)
+            response = self.session.get(
+                COURSERA_COURSES_URL,
+                params={'ids': ','.join(actual_ids), 'fields': COURSERA_COURSE_FIELDS},
+                timeout=self.config.SCRAPER_TIMEOUT
+            )
+            response.raise_for_status()
+            
+            for course in response.json().get('elements', []):
+                course_id = actual_ids.get(course.get('id'))
+                if course_id is None:
+                    continue
+                languages = course.get('primaryLanguages') or []
+                details[course_id] = {
+                    'id': course_id,
+                    'title': course.get('name'),
+                    'instructor': course.get('instructorIds', []),
+                    'language': languages[0] if languages else None,
+                    'duration': course.get('workload'),
+                    'url': f"https://www.coursera.org/learn/{course.get('slug')}",
+                    'image_url': course.get('photoUrl'),
+                    'description': course.get('description'),
+                    'certificate': bool(course.get('certificates')),
+                    'source': 'coursera'
+                }
+            
+        except Throttled:
+            raise
+        except Exception as e:
+            logger.error(f"Erro ao obter detalhes de cursos da Coursera: {str(e)}")
+        
+        return details
     
     def _get_edx_course_details(self, course_id: str) -> Optional[Dict]:
         """Obtém detalhes de um curso da edX"""
@@ -0,0 +1,242 @@
+"""
+Pool de WebDrivers do Selenium
+Mantém navegadores Chrome headless vivos entre requisições, com checkout/checkin,
+verificação de saúde e reciclagem após N usos ou erro
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPoolTimeout(Exception):
+    """Nenhum driver ficou disponível dentro do prazo de checkout"""
+
+
+def create_chrome_driver():
+    """Cria um driver do Chrome com opções headless"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+
+    return webdriver.Chrome(options=chrome_options)
+
+
+class PooledDriver:
+    """Driver emprestado pelo pool, com o estado que sobrevive entre requisições"""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.time()
+        self.logged_in = False
+
+
+class WebDriverPool:
+    """Pool limitado de WebDrivers de longa duração"""
+
+    def __init__(self, factory: Callable[[], Any], max_size: int, max_uses: int, checkout_timeout: float):
+        self.factory = factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._stats = {
+            'created': 0,
+            'recycled': 0,
+            'failed_health_checks': 0,
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'total_wait_time': 0.0,
+            'max_wait_time': 0.0
+        }
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Empresta um driver saudável do pool, criando um novo se houver vaga
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (padrão: checkout_timeout)
+
+        Returns:
+            Driver emprestado; deve ser devolvido com checkin()
+
+        Raises:
+            DriverPoolTimeout: Se nenhum driver ficar disponível no prazo
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started_at = time.monotonic()
+        deadline = started_at + timeout
+        waited = False
+
+        while True:
+            item = None
+            create = False
+            with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    if self._closed:
+                        raise DriverPoolTimeout("Pool de drivers encerrado")
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise DriverPoolTimeout(f"Nenhum driver disponível em {timeout}s")
+                    waited = True
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    item = self._idle.popleft()
+                else:
+                    self._size += 1
+                    create = True
+
+            if create:
+                try:
+                    item = PooledDriver(self.factory())
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._stats['created'] += 1
+            elif not self._is_healthy(item):
+                with self._cond:
+                    self._stats['failed_health_checks'] += 1
+                self._discard(item)
+                continue
+
+            wait_time = time.monotonic() - started_at
+            with self._cond:
+                self._stats['checkouts'] += 1
+                if waited:
+                    self._stats['waits'] += 1
+                self._stats['total_wait_time'] += wait_time
+                self._stats['max_wait_time'] = max(self._stats['max_wait_time'], wait_time)
+            return item
+
+    def checkin(self, item: PooledDriver, error: bool = False):
+        """
+        Devolve um driver ao pool
+
+        Args:
+            item: Driver emprestado por checkout()
+            error: Se o uso terminou em erro (o driver é reciclado)
+        """
+        item.uses += 1
+        if error or self._closed or item.uses >= self.max_uses:
+            self._discard(item)
+            return
+
+        with self._cond:
+            self._idle.append(item)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Context manager de checkout/checkin; exceções reciclam o driver"""
+        item = self.checkout(timeout)
+        try:
+            yield item
+        except Exception:
+            self.checkin(item, error=True)
+            raise
+        else:
+            self.checkin(item)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna o tamanho do pool e as estatísticas de espera"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'max_size': self.max_size,
+                'max_uses': self.max_uses
+            })
+        checkouts = stats['checkouts']
+        stats['avg_wait_time'] = stats['total_wait_time'] / checkouts if checkouts else 0.0
+        return stats
+
+    def close(self):
+        """Encerra todos os drivers ociosos; os emprestados são encerrados no checkin"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for item in idle:
+            self._discard(item)
+
+    def _is_healthy(self, item: PooledDriver) -> bool:
+        """Verifica se o navegador ainda responde"""
+        try:
+            item.driver.execute_script('return 1')
+            return True
+        except Exception as e:
+            logger.warning(f"Driver falhou na verificação de saúde: {str(e)}")
+            return False
+
+    def _discard(self, item: PooledDriver):
+        """Encerra o driver e libera sua vaga no pool"""
+        try:
+            item.driver.quit()
+        except Exception as e:
+            logger.error(f"Erro ao fechar driver: {str(e)}")
+        finally:
+            with self._cond:
+                self._size -= 1
+                self._stats['recycled'] += 1
+                self._cond.notify()
+
+
+_pool: Optional[WebDriverPool] = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> WebDriverPool:
+    """Retorna o pool de drivers do processo, criando-o no primeiro uso"""
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                config = get_config()
+                _pool = WebDriverPool(
+                    create_chrome_driver,
+                    max_size=config.DRIVER_POOL_SIZE,
+                    max_uses=config.DRIVER_MAX_USES,
+                    checkout_timeout=config.DRIVER_CHECKOUT_TIMEOUT
+                )
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def close_driver_pool():
+    """Encerra o pool de drivers do processo, se existir"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+        _pool = None
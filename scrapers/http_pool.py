@@ -0,0 +1,194 @@
+"""
+Pool de clientes HTTP dos scrapers
+Sessões compartilhadas por processo (worker), com keep-alive e limite de conexões por host.
+A sessão cloudscraper da Udemy não é segura entre threads: a Udemy usa um pool limitado
+de sessões, cada uma emprestada a uma requisição por vez.
+"""
+
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+_sessions: Dict[str, Union[requests.Session, 'SessionPool']] = {}
+_sessions_pid = os.getpid()
+_sessions_lock = threading.Lock()
+
+
+def _configure_adapter(adapter: HTTPAdapter, maxsize: int):
+    """Reconfigura o pool de conexões de um adapter já montado"""
+    config = get_config()
+    adapter.init_poolmanager(config.HTTP_POOL_CONNECTIONS, maxsize, block=config.HTTP_POOL_BLOCK)
+
+
+def _host_maxsize(host: str) -> int:
+    """Número máximo de conexões simultâneas para o host"""
+    config = get_config()
+    return config.HTTP_HOST_MAX_CONNECTIONS.get(host, config.HTTP_POOL_MAXSIZE)
+
+
+def _create_default_session() -> requests.Session:
+    """Sessão genérica (Coursera, edX, ...) com um pool dedicado por host configurado"""
+    config = get_config()
+    session = requests.Session()
+    session.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+
+    for prefix in ('http://', 'https://'):
+        _configure_adapter(session.get_adapter(prefix), config.HTTP_POOL_MAXSIZE)
+
+    for host in config.HTTP_HOST_MAX_CONNECTIONS:
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_host_maxsize(host),
+            pool_block=config.HTTP_POOL_BLOCK
+        )
+        session.mount(f'https://{host}', adapter)
+
+    return session
+
+
+def _create_udemy_session() -> requests.Session:
+    """Sessão cloudscraper para a Udemy, mantendo o adapter TLS do cloudscraper"""
+    import cloudscraper
+
+    session = cloudscraper.create_scraper()
+    # Cada sessão atende uma requisição por vez (ver SessionPool): uma conexão basta
+    for prefix in ('http://', 'https://'):
+        _configure_adapter(session.get_adapter(prefix), 1)
+    return session
+
+
+class SessionPool:
+    """
+    Sessões emprestadas a uma requisição por vez (check-out/check-in)
+
+    Para clientes que não são seguros entre threads, como o cloudscraper, que guarda o
+    estado do desafio anti-bot (cookies, headers, tentativas) na própria sessão. O pool
+    cria no máximo `size` sessões; com todas em uso, a requisição espera uma ser devolvida.
+    Expõe get() como uma sessão requests, para os scrapers não mudarem.
+    """
+
+    def __init__(self, factory: Callable[[], requests.Session], size: int):
+        self.size = max(1, size)
+        self._factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created: List[requests.Session] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[requests.Session]:
+        """
+        Empresta uma sessão exclusiva até o fim do bloco
+
+        Args:
+            timeout: Espera máxima (segundos) por uma sessão livre; None espera indefinidamente
+
+        Yields:
+            Sessão que nenhuma outra requisição usa ao mesmo tempo
+
+        Raises:
+            TimeoutError: Se nenhuma sessão for devolvida dentro do prazo
+        """
+        session = self._acquire(timeout)
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def _acquire(self, timeout: Optional[float]) -> requests.Session:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._created) < self.size:
+                session = self._factory()
+                self._created.append(session)
+                return session
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Nenhuma sessão HTTP livre em {timeout}s")
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET com uma sessão emprestada; espera por ela no máximo o timeout da requisição"""
+        with self.checkout(timeout=kwargs.get('timeout')) as session:
+            return session.get(url, **kwargs)
+
+    def close(self):
+        """Fecha todas as sessões criadas pelo pool"""
+        with self._lock:
+            sessions = list(self._created)
+            self._created.clear()
+            self._idle = queue.LifoQueue()
+        for session in sessions:
+            session.close()
+
+
+def _create_udemy_pool() -> SessionPool:
+    """Pool de sessões cloudscraper da Udemy, limitado às conexões permitidas para o host"""
+    return SessionPool(_create_udemy_session, _host_maxsize('www.udemy.com'))
+
+
+_FACTORIES: Dict[str, Callable[[], Union[requests.Session, SessionPool]]] = {
+    'default': _create_default_session,
+    'udemy': _create_udemy_pool
+}
+
+
+def get_session(name: str = 'default') -> Union[requests.Session, SessionPool]:
+    """
+    Retorna a sessão HTTP compartilhada do processo
+
+    As sessões são recriadas após um fork (ex: gunicorn com preload_app), para que
+    workers nunca compartilhem sockets com o processo master.
+
+    Args:
+        name: Nome do pool (default, udemy)
+
+    Returns:
+        Sessão requests (ou SessionPool, na Udemy) reutilizada por todas as instâncias
+        de scraper do processo
+    """
+    global _sessions_pid
+
+    session = _sessions.get(name)
+    if session is not None and _sessions_pid == os.getpid():
+        return session
+
+    with _sessions_lock:
+        if _sessions_pid != os.getpid():
+            # Processo filho: descartar as referências herdadas sem fechar os sockets do pai
+            _sessions.clear()
+            _sessions_pid = os.getpid()
+
+        session = _sessions.get(name)
+        if session is None:
+            session = _FACTORIES[name]()
+            _sessions[name] = session
+            logger.info(f"Pool HTTP '{name}' criado no processo {_sessions_pid}")
+        return session
+
+
+def close_all():
+    """Fecha todas as sessões do processo (chamado no encerramento do worker)"""
+    with _sessions_lock:
+        for name, session in list(_sessions.items()):
+            try:
+                session.close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar pool HTTP '{name}': {str(e)}")
+        _sessions.clear()
@@ -1,137 +1,305 @@
 import os
-import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from linkedin_scraper import JobSearch, actions
+
+from config.settings import get_config
+from .driver_pool import DriverPoolTimeout, PooledDriver, get_driver_pool
+from .http_pool import get_session
+from .linkedin_http import (
+    GUEST_JOB_URL, LINKEDIN_HOST, fetch_job_detail_http, parse_job_detail, search_jobs_http
+)
+from .linkedin_session import LinkedInSessionStore
+from .rate_limiter import Throttled, get_host_limiter
+
+LINKEDIN_URL = 'https://www.linkedin.com'
+
+# Trechos de URL para onde o LinkedIn redireciona sessões não autenticadas
+LOGIN_URL_MARKERS = ('/login', '/authwall', '/checkpoint', '/uas/')
 
 logger = logging.getLogger(__name__)
 
+_detail_executor = None
+_detail_executor_lock = threading.Lock()
+
+# Um login por vez no processo: com workers gthread/gevent várias requisições podem
+# encontrar drivers sem sessão ao mesmo tempo, e logins simultâneos disparam o captcha
+_login_lock = threading.Lock()
+
+
+def _get_detail_executor() -> ThreadPoolExecutor:
+    """Executor compartilhado pelo processo para buscar detalhes de vagas em lote"""
+    global _detail_executor
+    if _detail_executor is None:
+        with _detail_executor_lock:
+            if _detail_executor is None:
+                _detail_executor = ThreadPoolExecutor(
+                    max_workers=get_config().JOB_DETAIL_MAX_WORKERS,
+                    thread_name_prefix='job-details'
+                )
+    return _detail_executor
+
+
+def shutdown_detail_executor():
+    """Encerra o executor de detalhes do processo (chamado no encerramento do worker)"""
+    global _detail_executor
+    with _detail_executor_lock:
+        executor, _detail_executor = _detail_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class JobScraper:
     def __init__(self):
-        self.driver = None
+        self.config = get_config()
+        self.pool = get_driver_pool()
+        self.session = get_session('default')
         self.email = os.environ.get('LINKEDIN_EMAIL', '')
         self.password = os.environ.get('LINKEDIN_PASSWORD', '')
-        self.is_logged_in = False
-        
-    def _setup_driver(self):
-        """Configura o driver do Chrome com opções headless"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+        self.session_store = LinkedInSessionStore.from_config()
+    
+    def _login(self, pooled: PooledDriver):
+        """Faz login no LinkedIn com o driver emprestado do pool"""
+        if self._restore_session(pooled):
+            return True
         
+        if not self.email or not self.password:
+            logger.warning("Credenciais do LinkedIn não configuradas")
+            return False
+        
+        with _login_lock:
+            # Outra requisição pode ter feito login (e salvo os cookies) enquanto esta esperava
+            if self._restore_session(pooled):
+                return True
+            return self._login_with_credentials(pooled)
+    
+    def _login_with_credentials(self, pooled: PooledDriver) -> bool:
+        """Faz login com e-mail e senha e salva os cookies da sessão"""
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            from linkedin_scraper import actions
+            
+            actions.login(pooled.driver, self.email, self.password)
+            pooled.logged_in = True
+            logger.info("Login no LinkedIn realizado com sucesso")
+            self.session_store.save(pooled.driver.get_cookies())
             return True
+            
         except Exception as e:
-            logger.error(f"Erro ao configurar driver: {str(e)}")
+            logger.error(f"Erro no login: {str(e)}")
             return False
     
-    def _login(self):
-        """Faz login no LinkedIn"""
-        if not self.email or not self.password:
-            logger.warning("Credenciais do LinkedIn não configuradas")
+    def _restore_session(self, pooled: PooledDriver) -> bool:
+        """
+        Injeta no driver os cookies da sessão salva, evitando um novo login
+        
+        Returns:
+            True se o LinkedIn aceitou os cookies
+        """
+        cookies = self.session_store.load()
+        if not cookies:
             return False
-            
+        
+        driver = pooled.driver
         try:
-            if not self.driver:
-                if not self._setup_driver():
-                    return False
+            # add_cookie exige que o navegador esteja no domínio do cookie
+            driver.get(LINKEDIN_URL)
+            for cookie in cookies:
+                driver.add_cookie(cookie)
+            driver.get(f"{LINKEDIN_URL}/feed/")
             
-            actions.login(self.driver, self.email, self.password)
-            self.is_logged_in = True
-            logger.info("Login no LinkedIn realizado com sucesso")
+            if any(marker in driver.current_url for marker in LOGIN_URL_MARKERS):
+                logger.info("Cookies do LinkedIn rejeitados; novo login necessário")
+                self.session_store.clear()
+                driver.delete_all_cookies()
+                return False
+            
+            pooled.logged_in = True
+            logger.info("Sessão do LinkedIn restaurada a partir dos cookies salvos")
             return True
             
         except Exception as e:
-            logger.error(f"Erro no login: {str(e)}")
+            logger.error(f"Erro ao restaurar sessão do LinkedIn: {str(e)}")
             return False
     
-    def search_jobs(self, query: str, location: str = "", limit: int = 10) -> List[Dict]:
+    def search_jobs(self, query: str, location: str = "", limit: int = 10, require_description: bool = False,
+                    start: int = 0) -> List[Dict]:
         """
         Busca vagas no LinkedIn
         
+        Tenta primeiro a listagem pública via HTTP; o Selenium só é usado se ela
+        falhar ou se a descrição completa das vagas for necessária.
+        
         Args:
             query: Termo de busca
             location: Localização (opcional)
             limit: Número máximo de resultados
+            require_description: Exige a descrição das vagas (só disponível via navegador)
+            start: Posição na listagem a partir da qual buscar (paginação); a busca pelo
+                navegador não pagina, então páginas seguintes usam apenas a listagem pública
             
         Returns:
             Lista de vagas encontradas
         """
+        if start:
+            return self._search_jobs_http(query, location, limit, start) or []
+        
+        if self.config.LINKEDIN_HTTP_FAST_PATH and not require_description:
+            jobs = self._search_jobs_http(query, location, limit)
+            if jobs is not None:
+                # Listagem vazia é resposta válida: o navegador só entra se a busca HTTP falhar
+                return jobs
+            logger.info(f"Busca HTTP falhou para '{query}'; usando o navegador")
+        
+        return self._search_jobs_browser(query, location, limit)
+    
+    def _search_jobs_http(self, query: str, location: str, limit: int, start: int = 0) -> Optional[List[Dict]]:
+        """Busca vagas na listagem pública do LinkedIn, sem navegador (None se a requisição falhar)"""
         try:
-            if not self.driver:
-                if not self._setup_driver():
-                    return []
-            
-            if not self.is_logged_in:
-                if not self._login():
-                    logger.warning("Continuando sem login - resultados limitados")
-            
-            # Criar instância do JobSearch
-            job_search = JobSearch(
-                driver=self.driver, 
-                close_on_complete=False, 
-                scrape=False
+            jobs = search_jobs_http(
+                self.session, query, location, limit, timeout=self.config.SCRAPER_TIMEOUT, start=start
             )
-            
-            # Realizar busca
-            search_query = query
-            if location:
-                search_query += f" {location}"
-            
-            job_listings = job_search.search(search_query)
-            
-            # Processar resultados
-            jobs = []
-            for i, job in enumerate(job_listings):
-                if i >= limit:
-                    break
+            logger.info(f"Encontradas {len(jobs)} vagas para '{query}' via HTTP")
+            return jobs
+        except Throttled:
+            # Sem capacidade para o LinkedIn: o navegador também seria barrado
+            raise
+        except Exception as e:
+            logger.warning(f"Erro na busca HTTP de vagas: {str(e)}")
+            return None
+    
+    def _search_jobs_browser(self, query: str, location: str, limit: int) -> List[Dict]:
+        """Busca vagas no LinkedIn com o Selenium"""
+        get_host_limiter(LINKEDIN_HOST).permit(timeout=self.config.SCRAPER_TIMEOUT)
+        
+        try:
+            with self.pool.driver() as pooled:
+                if not pooled.logged_in:
+                    if not self._login(pooled):
+                        logger.warning("Continuando sem login - resultados limitados")
+                
+                # linkedin_scraper (e o Selenium) só é carregado quando o navegador é necessário
+                from linkedin_scraper import JobSearch
+                
+                # Criar instância do JobSearch
+                job_search = JobSearch(
+                    driver=pooled.driver, 
+                    close_on_complete=False, 
+                    scrape=False
+                )
+                
+                # Realizar busca
+                search_query = query
+                if location:
+                    search_query += f" {location}"
+                
+                job_listings = job_search.search(search_query)
+                
+                # Processar resultados
+                jobs = []
+                for i, job in enumerate(job_listings):
+                    if i >= limit:
+                        break
                     
-                try:
-                    job_data = {
-                        'id': getattr(job, 'job_id', f'job_{i}'),
-                        'title': getattr(job, 'title', ''),
-                        'company': getattr(job, 'company', ''),
-                        'location': getattr(job, 'location', ''),
-                        'description': getattr(job, 'description', ''),
-                        'posted_date': getattr(job, 'posted_date', ''),
-                        'applicants': getattr(job, 'applicants', ''),
-                        'url': getattr(job, 'job_url', ''),
-                        'source': 'linkedin'
-                    }
-                    jobs.append(job_data)
+                    try:
+                        job_data = {
+                            'id': getattr(job, 'job_id', f'job_{i}'),
+                            'title': getattr(job, 'title', ''),
+                            'company': getattr(job, 'company', ''),
+                            'location': getattr(job, 'location', ''),
+                            'description': getattr(job, 'description', ''),
+                            'posted_date': getattr(job, 'posted_date', ''),
+                            'applicants': getattr(job, 'applicants', ''),
+                            'url': getattr(job, 'job_url', ''),
+                            'source': 'linkedin'
+                        }
+                        jobs.append(job_data)
                     
-                except Exception as e:
-                    logger.error(f"Erro ao processar vaga {i}: {str(e)}")
-                    continue
+                    except Exception as e:
+                        logger.error(f"Erro ao processar vaga {i}: {str(e)}")
+                        continue
             
             logger.info(f"Encontradas {len(jobs)} vagas para '{query}'")
             return jobs
             
+        except DriverPoolTimeout as e:
+            logger.error(f"Nenhum driver disponível para a busca de vagas: {str(e)}")
+            return []
         except Exception as e:
             logger.error(f"Erro na busca de vagas: {str(e)}")
             return []
     
-    def close(self):
-        """Fecha o driver"""
-        if self.driver:
+    def get_job_details(self, job_id: str) -> Optional[Dict]:
+        """
+        Obtém os detalhes completos de uma vaga do LinkedIn
+        
+        Args:
+            job_id: ID da vaga (linkedin_<número> ou apenas o número)
+            
+        Returns:
+            Dicionário com os detalhes da vaga ou None se não encontrada
+        """
+        numeric_id = job_id.replace('linkedin_', '', 1)
+        if not numeric_id.isdigit():
+            logger.warning(f"ID de vaga inválido: {job_id}")
+            return None
+        
+        try:
+            return fetch_job_detail_http(self.session, numeric_id, timeout=self.config.SCRAPER_TIMEOUT)
+        except Throttled:
+            raise
+        except Exception as e:
+            logger.warning(f"Erro ao obter detalhes da vaga {job_id} via HTTP: {str(e)}")
+        
+        return self._get_job_details_browser(numeric_id)
+    
+    def get_jobs_details(self, job_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Obtém os detalhes de várias vagas em paralelo
+        
+        Args:
+            job_ids: IDs das vagas
+            
+        Returns:
+            Dicionário ID -> detalhes (None para vagas não encontradas)
+        """
+        unique_ids = list(dict.fromkeys(job_ids))
+        executor = _get_detail_executor()
+        futures = {job_id: executor.submit(self.get_job_details, job_id) for job_id in unique_ids}
+        
+        details = {}
+        throttled = []
+        for job_id, future in futures.items():
             try:
-                self.driver.quit()
+                details[job_id] = future.result()
+            except Throttled as e:
+                logger.warning(f"Rate limit do LinkedIn: detalhes da vaga {job_id} não obtidos")
+                throttled.append(e)
+                details[job_id] = None
             except Exception as e:
-                logger.error(f"Erro ao fechar driver: {str(e)}")
-            finally:
-                self.driver = None
-                self.is_logged_in = False
+                logger.error(f"Erro ao obter detalhes da vaga {job_id}: {str(e)}")
+                details[job_id] = None
+        
+        if throttled and len(throttled) == len(futures):
+            raise throttled[0]
+        return details
     
-    def __del__(self):
-        """Destrutor para garantir que o driver seja fechado"""
-        self.close()
+    def _get_job_details_browser(self, numeric_id: str) -> Optional[Dict]:
+        """Obtém os detalhes de uma vaga carregando a página pública no navegador do pool"""
+        get_host_limiter(LINKEDIN_HOST).permit(timeout=self.config.SCRAPER_TIMEOUT)
+        
+        try:
+            with self.pool.driver() as pooled:
+                pooled.driver.get(GUEST_JOB_URL.format(job_id=numeric_id))
+                return parse_job_detail(pooled.driver.page_source, numeric_id)
+        except Exception as e:
+            logger.error(f"Erro ao obter detalhes da vaga {numeric_id} via navegador: {str(e)}")
+            return None
+    
+    def pool_stats(self) -> Dict:
+        """Retorna as estatísticas do pool de drivers"""
+        return self.pool.stats()
+    
+    def close(self):
+        """Os drivers pertencem ao pool do processo; não há recursos por instância"""
+        pass
@@ -0,0 +1,360 @@
+"""
+Busca de vagas do LinkedIn sem navegador
+Consulta a listagem pública de vagas (jobs-guest) via HTTP e extrai os cards com lxml
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+from .rate_limiter import Throttled, get_host_limiter
+
+logger = logging.getLogger(__name__)
+
+LINKEDIN_HOST = 'www.linkedin.com'
+GUEST_SEARCH_URL = f'https://{LINKEDIN_HOST}/jobs-guest/jobs/api/seeMoreJobPostings/search'
+
+# A listagem pública devolve ~10 cards por página; `start` avança por cards
+GUEST_PAGE_SIZE = 10
+
+GUEST_JOB_URL = f'https://{LINKEDIN_HOST}/jobs-guest/jobs/api/jobPosting/{{job_id}}'
+
+JOB_URN_PREFIX = 'urn:li:jobPosting:'
+
+# Tags que quebram linha ao extrair o texto da descrição
+BLOCK_TAGS = {'p', 'div', 'li', 'br', 'ul', 'ol', 'h1', 'h2', 'h3', 'h4', 'section'}
+
+# Rótulos em inglês garantidos pelo Accept-Language das requisições de detalhe
+DETAIL_HEADERS = {'Accept-Language': 'en-US,en;q=0.9'}
+
+# "Job criteria" do LinkedIn -> valores aceitos por JobSearchRequest
+EXPERIENCE_LEVELS = {
+    'internship': 'entry',
+    'entry level': 'entry',
+    'associate': 'associate',
+    'mid-senior level': 'mid-senior',
+    'director': 'executive',
+    'executive': 'executive'
+}
+JOB_TYPES = {
+    'full-time': 'full-time',
+    'part-time': 'part-time',
+    'contract': 'contract',
+    'temporary': 'temporary',
+    'internship': 'internship'
+}
+
+# Vocabulário usado para extrair habilidades da descrição da vaga
+SKILL_KEYWORDS = (
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'C++', 'C#', 'Ruby', 'PHP', 'Kotlin',
+    'Swift', 'Scala', 'R', 'SQL', 'NoSQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch',
+    'Django', 'Flask', 'FastAPI', 'Spring', 'Node.js', 'React', 'Angular', 'Vue.js', 'Next.js',
+    'HTML', 'CSS', 'GraphQL', 'REST', 'Docker', 'Kubernetes', 'Terraform', 'AWS', 'Azure', 'GCP',
+    'Linux', 'Git', 'CI/CD', 'Kafka', 'Spark', 'Hadoop', 'Airflow', 'Pandas', 'NumPy', 'TensorFlow',
+    'PyTorch', 'Scikit-learn', 'Machine Learning', 'Deep Learning', 'NLP', 'Data Science',
+    'Power BI', 'Tableau', 'Excel', 'Scrum', 'Agile'
+)
+_SKILL_PATTERNS = [
+    # Nomes curtos (Go, R, REST, Excel) só casam com a grafia exata para evitar palavras comuns
+    (skill, re.compile(rf'(?<![\w+#]){re.escape(skill)}(?![\w+#$])', re.IGNORECASE if len(skill) > 5 else 0))
+    for skill in SKILL_KEYWORDS
+]
+
+_SALARY_AMOUNT = re.compile(r'([^\d\s.,]*)\s*([\d.,]+)\s*([kK])?')
+_SALARY_PERIODS = {'yr': 'year', 'year': 'year', 'mo': 'month', 'month': 'month', 'hr': 'hour', 'hour': 'hour'}
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath que casa elementos contendo a classe CSS informada"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _first_text(element, xpath: str) -> str:
+    """Texto normalizado do primeiro elemento encontrado pelo XPath"""
+    found = element.xpath(xpath)
+    if not found:
+        return ''
+    return ' '.join(found[0].text_content().split())
+
+
+def _block_text(element) -> str:
+    """Texto do elemento com uma linha por bloco (p, li, br, ...), preservando trechos inline"""
+    parts = []
+
+    def walk(node):
+        if not isinstance(node.tag, str):
+            return  # comentários e instruções de processamento
+        block = node.tag in BLOCK_TAGS
+        if block:
+            parts.append('\n')
+        parts.append(node.text or '')
+        for child in node:
+            walk(child)
+            parts.append(child.tail or '')
+        if block:
+            parts.append('\n')
+
+    walk(element)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _strip_query(url: str) -> str:
+    """Remove parâmetros de rastreamento da URL da vaga"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+
+def parse_job_cards(page: str) -> List[Dict]:
+    """
+    Extrai as vagas de uma página da listagem pública do LinkedIn
+
+    Args:
+        page: HTML retornado pelo endpoint jobs-guest
+
+    Returns:
+        Lista de vagas no mesmo formato da busca via Selenium
+    """
+    if not page.strip():
+        return []
+
+    from lxml import html
+
+    document = html.fromstring(page)
+    jobs = []
+    for card in document.xpath(f"//div[{_class_xpath('base-card')}][@data-entity-urn]"):
+        urn = card.get('data-entity-urn', '')
+        if not urn.startswith(JOB_URN_PREFIX):
+            continue
+
+        link = card.xpath(f".//a[{_class_xpath('base-card__full-link')}]/@href")
+        posted = card.xpath(".//time/@datetime")
+
+        jobs.append({
+            'id': f"linkedin_{urn[len(JOB_URN_PREFIX):]}",
+            'title': _first_text(card, f".//*[{_class_xpath('base-search-card__title')}]"),
+            'company': _first_text(card, f".//*[{_class_xpath('base-search-card__subtitle')}]"),
+            'location': _first_text(card, f".//*[{_class_xpath('job-search-card__location')}]"),
+            'description': '',
+            'posted_date': posted[0] if posted else '',
+            'applicants': '',
+            'url': _strip_query(link[0]) if link else '',
+            'source': 'linkedin'
+        })
+    return jobs
+
+
+class JobListing(list):
+    """Vagas de uma busca; `complete` é False se a paginação parou por erro ou rate limit"""
+
+    complete = True
+
+
+def search_jobs_http(session: requests.Session, query: str, location: Optional[str], limit: int,
+                     timeout: float, start: int = 0) -> JobListing:
+    """
+    Busca vagas na listagem pública do LinkedIn, página a página, até atingir o limite
+
+    Args:
+        session: Sessão HTTP do pool
+        query: Termo de busca
+        location: Localização (opcional)
+        limit: Número máximo de resultados
+        timeout: Timeout de cada requisição em segundos
+        start: Posição na listagem a partir da qual buscar (paginação)
+
+    Returns:
+        Lista de vagas (pode ser menor que o limite se a listagem acabar ou uma página
+        seguinte falhar, com `complete` False), cada uma com a posição na listagem em `_position`
+
+    Raises:
+        requests.RequestException: Se o LinkedIn recusar ou falhar a primeira página
+        Throttled: Se o rate limit do LinkedIn não liberar nem a primeira página
+    """
+    limiter = get_host_limiter(LINKEDIN_HOST)
+    jobs = JobListing()
+    seen = set()
+
+    while len(jobs) < limit:
+        try:
+            limiter.permit(timeout=timeout)
+        except Throttled:
+            if not jobs:
+                raise
+            logger.warning("Rate limit do LinkedIn: busca HTTP interrompida")
+            jobs.complete = False
+            break
+
+        params = {'keywords': query, 'start': start}
+        if location:
+            params['location'] = location
+
+        try:
+            response = session.get(GUEST_SEARCH_URL, params=params, timeout=timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if not jobs:
+                raise
+            # As vagas das páginas anteriores continuam válidas
+            logger.warning(f"Erro na busca HTTP do LinkedIn (start={start}); retornando {len(jobs)} vagas: {str(e)}")
+            jobs.complete = False
+            break
+
+        page_jobs = parse_job_cards(response.text)
+        if not page_jobs:
+            break
+
+        found = len(jobs)
+        for index, job in enumerate(page_jobs):
+            if job['id'] not in seen:
+                seen.add(job['id'])
+                job['_position'] = start + index
+                jobs.append(job)
+
+        # Além do fim da listagem o LinkedIn repete vagas já vistas: parar em vez de insistir
+        if len(jobs) == found:
+            break
+
+        start += len(page_jobs)
+
+    del jobs[limit:]
+    return jobs
+
+
+def _parse_number(text: str) -> Optional[float]:
+    """Converte '120,000.00' ou '8.000,00' em número; o último separador só é decimal se seguido de 1-2 dígitos"""
+    match = re.match(r'^(.*?)[.,](\d{1,2})$', text)
+    integer, decimals = match.groups() if match else (text, '0')
+    try:
+        return float(re.sub(r'[.,]', '', integer) + '.' + decimals)
+    except ValueError:
+        return None
+
+
+def parse_salary(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Interpreta a faixa salarial exibida pelo LinkedIn
+
+    Args:
+        text: Texto como '$120,000.00/yr - $150,000.00/yr'
+
+    Returns:
+        Dicionário com min, max, currency, period e o texto original, ou None
+    """
+    text = ' '.join(text.split())
+    if not text:
+        return None
+
+    amounts = []
+    currency = None
+    for symbol, number, thousands in _SALARY_AMOUNT.findall(text):
+        value = _parse_number(number)
+        if value is None:
+            continue
+        amounts.append(value * 1000 if thousands else value)
+        currency = currency or symbol or None
+
+    period_match = re.search(r'/\s*(yr|year|mo|month|hr|hour)', text)
+    return {
+        'min': amounts[0] if amounts else None,
+        'max': amounts[-1] if amounts else None,
+        'currency': currency,
+        'period': _SALARY_PERIODS[period_match.group(1)] if period_match else None,
+        'text': text
+    }
+
+
+def parse_applicants(text: str) -> Optional[int]:
+    """Extrai o número de candidatos de textos como 'Over 200 applicants'"""
+    match = re.search(r'([\d,]+)\s+applicant', text)
+    return int(match.group(1).replace(',', '')) if match else None
+
+
+def extract_skills(text: str) -> List[str]:
+    """Habilidades do vocabulário citadas no texto, na ordem em que aparecem"""
+    found = []
+    for skill, pattern in _SKILL_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            found.append((match.start(), skill))
+    return [skill for _, skill in sorted(found)]
+
+
+def parse_job_detail(page: str, job_id: str) -> Optional[Dict]:
+    """
+    Extrai os detalhes de uma vaga da página pública do LinkedIn
+
+    Args:
+        page: HTML do endpoint jobs-guest/jobPosting (ou page_source do navegador)
+        job_id: ID numérico da vaga no LinkedIn
+
+    Returns:
+        Dicionário com os campos de JobDetail ou None se a página não contém a vaga
+    """
+    if not page.strip():
+        return None
+
+    from lxml import html
+
+    document = html.fromstring(page)
+    title = _first_text(document, f"//*[{_class_xpath('top-card-layout__title')}]")
+    if not title:
+        return None
+
+    criteria = {}
+    for item in document.xpath(f"//li[{_class_xpath('description__job-criteria-item')}]"):
+        label = _first_text(item, f".//*[{_class_xpath('description__job-criteria-subheader')}]")
+        value = _first_text(item, f".//*[{_class_xpath('description__job-criteria-text')}]")
+        if label:
+            criteria[label.lower()] = value
+
+    markup = document.xpath(f"//*[{_class_xpath('show-more-less-html__markup')}]")
+    full_description = _block_text(markup[0]) if markup else ''
+
+    salary = _first_text(document, f"//*[{_class_xpath('compensation__salary')}]")
+    applicants = _first_text(document, f"//*[{_class_xpath('num-applicants__caption')}]")
+    link = document.xpath(f"//a[{_class_xpath('topcard__link')}]/@href")
+
+    return {
+        'id': f"linkedin_{job_id}",
+        'title': title,
+        'company': _first_text(document, f"//*[{_class_xpath('topcard__org-name-link')}]"),
+        'location': _first_text(document, f"//*[{_class_xpath('topcard__flavor--bullet')}]"),
+        'description': ' '.join(full_description.split()),
+        'url': _strip_query(link[0]) if link else f"https://{LINKEDIN_HOST}/jobs/view/{job_id}",
+        'experience_level': EXPERIENCE_LEVELS.get(criteria.get('seniority level', '').lower()),
+        'job_type': JOB_TYPES.get(criteria.get('employment type', '').lower()),
+        'source': 'linkedin',
+        'full_description': full_description,
+        'salary_range': parse_salary(salary),
+        'application_count': parse_applicants(applicants),
+        'skills': extract_skills(full_description)
+    }
+
+
+def fetch_job_detail_http(session: requests.Session, job_id: str, timeout: float) -> Optional[Dict]:
+    """
+    Busca os detalhes de uma vaga na página pública do LinkedIn
+
+    Args:
+        session: Sessão HTTP do pool
+        job_id: ID numérico da vaga no LinkedIn
+        timeout: Timeout da requisição em segundos
+
+    Returns:
+        Detalhes da vaga ou None se ela não existe
+
+    Raises:
+        requests.RequestException: Se o LinkedIn recusar ou falhar a requisição
+        Throttled: Se o rate limit do LinkedIn não liberar a requisição dentro do prazo
+    """
+    get_host_limiter(LINKEDIN_HOST).permit(timeout=timeout)
+
+    response = session.get(GUEST_JOB_URL.format(job_id=job_id), headers=DETAIL_HEADERS, timeout=timeout)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return parse_job_detail(response.text, job_id)
@@ -0,0 +1,135 @@
+"""
+Persistência da sessão autenticada do LinkedIn
+Os cookies obtidos após o login são gravados criptografados (Fernet) no disco local,
+permitindo que drivers novos ou do pool reutilizem a sessão sem repetir o login
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from config.settings import get_config, is_placeholder_secret
+
+logger = logging.getLogger(__name__)
+
+# Cookie que identifica a sessão autenticada no LinkedIn
+AUTH_COOKIE = 'li_at'
+
+# Campos aceitos por WebDriver.add_cookie
+COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry', 'sameSite')
+
+
+class LinkedInSessionStore:
+    """Armazena os cookies da sessão do LinkedIn criptografados em um arquivo local"""
+
+    def __init__(self, path: str, secret: str, ttl: int):
+        self.path = path
+        self.ttl = ttl
+        self.enabled = not is_placeholder_secret(secret)
+        if not self.enabled:
+            logger.warning(
+                "LINKEDIN_COOKIE_SECRET ausente ou com valor de exemplo; a sessão do LinkedIn não será salva em disco"
+            )
+        self._key = base64.urlsafe_b64encode(hashlib.sha256(secret.encode()).digest())
+        self._cipher = None
+
+    @property
+    def _fernet(self):
+        """Cifra Fernet, criada (e o cryptography importado) no primeiro uso"""
+        if self._cipher is None:
+            from cryptography.fernet import Fernet
+
+            self._cipher = Fernet(self._key)
+        return self._cipher
+
+    @classmethod
+    def from_config(cls) -> 'LinkedInSessionStore':
+        """Cria o store a partir das configurações da aplicação"""
+        config = get_config()
+        return cls(
+            path=config.LINKEDIN_COOKIE_FILE,
+            secret=config.LINKEDIN_COOKIE_SECRET,
+            ttl=config.LINKEDIN_COOKIE_TTL
+        )
+
+    def load(self) -> Optional[List[Dict]]:
+        """
+        Carrega os cookies salvos
+
+        Returns:
+            Lista de cookies ou None se não houver sessão válida (ausente, expirada ou ilegível)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with open(self.path, 'rb') as f:
+                token = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error(f"Erro ao ler sessão do LinkedIn: {str(e)}")
+            return None
+
+        from cryptography.fernet import InvalidToken
+
+        try:
+            cookies = json.loads(self._fernet.decrypt(token, ttl=self.ttl))
+        except (InvalidToken, ValueError):
+            logger.info("Sessão do LinkedIn salva expirou ou é inválida")
+            self.clear()
+            return None
+
+        auth = next((c for c in cookies if c.get('name') == AUTH_COOKIE), None)
+        if auth is None or ('expiry' in auth and auth['expiry'] <= time.time()):
+            logger.info("Cookie de autenticação do LinkedIn ausente ou expirado")
+            self.clear()
+            return None
+
+        return cookies
+
+    def save(self, cookies: List[Dict]):
+        """
+        Grava os cookies criptografados, de forma atômica e legível apenas pelo usuário do processo
+
+        Args:
+            cookies: Cookies retornados por WebDriver.get_cookies()
+        """
+        if not self.enabled:
+            return
+
+        cookies = [{k: v for k, v in c.items() if k in COOKIE_FIELDS} for c in cookies]
+        if not any(c.get('name') == AUTH_COOKIE for c in cookies):
+            logger.warning("Login sem cookie de autenticação; sessão não será salva")
+            return
+
+        token = self._fernet.encrypt(json.dumps(cookies).encode())
+        directory = os.path.dirname(self.path) or '.'
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.linkedin-session-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(token)
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            logger.info("Sessão do LinkedIn salva")
+        except OSError as e:
+            logger.error(f"Erro ao salvar sessão do LinkedIn: {str(e)}")
+
+    def clear(self):
+        """Remove a sessão salva"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Erro ao remover sessão do LinkedIn: {str(e)}")
@@ -0,0 +1,191 @@
+"""
+Ranqueamento de cursos
+- Seleção dos melhores resultados (top-k) à medida que as páginas chegam, sem pandas
+- Escore normalizado entre plataformas e intercalação (k-way merge) dos resultados
+"""
+
+import heapq
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and not _is_missing(value)
+
+
+def udemy_rank_key(course: Dict) -> Tuple:
+    """
+    Chave de ordenação dos cursos da Udemy: rating e número de reviews, decrescentes
+
+    Valores ausentes ficam depois de todos os presentes em cada coluna, como no
+    `sort_values(['rating', 'num_reviews'], ascending=False)` do pandas (na_position='last').
+
+    Args:
+        course: Curso no formato retornado pelo scraper
+
+    Returns:
+        Tupla comparável (maior = melhor)
+    """
+    rating = course.get('rating')
+    num_reviews = course.get('num_reviews')
+    return (
+        not _is_missing(rating), 0 if _is_missing(rating) else rating,
+        not _is_missing(num_reviews), 0 if _is_missing(num_reviews) else num_reviews
+    )
+
+
+class TopKRanker:
+    """Mantém os k melhores itens segundo uma chave, com desempate estável pela ordem de chegada"""
+
+    def __init__(self, k: int, key: Callable[[Dict], Tuple]):
+        self.k = k
+        self.key = key
+        # Min-heap: a raiz é o pior item mantido
+        self._heap: List[Tuple[Tuple, Tuple, Dict]] = []
+
+    def push(self, item: Dict, order: Tuple):
+        """
+        Considera um item
+
+        Args:
+            item: Item a ranquear
+            order: Posição original do item (ex.: (página, índice)); em empate, menor vence
+        """
+        if self.k <= 0:
+            return
+        entry = (self.key(item), tuple(-position for position in order), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, items: Iterable[Dict], group: int = 0):
+        """Considera os itens de uma página, na ordem em que aparecem"""
+        for index, item in enumerate(items):
+            self.push(item, (group, index))
+
+    def results(self) -> List[Dict]:
+        """Itens mantidos, do melhor para o pior"""
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+# Escore normalizado entre plataformas (0 a 1)
+QUALITY_WEIGHT = 0.7
+RELEVANCE_WEIGHT = 0.3
+# Média bayesiana: avaliações de cursos com poucas reviews são puxadas para a média
+PRIOR_RATING = 3.5
+PRIOR_REVIEWS = 50
+
+
+def course_score(course: Dict, position: int, total: int) -> float:
+    """
+    Escore normalizado de um curso, comparável entre Udemy, Coursera e edX
+
+    Combina a qualidade (rating de 0 a 5 ajustado pela quantidade de reviews ou alunos)
+    com a relevância (posição do curso na lista devolvida pela plataforma).
+
+    Args:
+        course: Curso no formato retornado pelo scraper
+        position: Posição do curso na lista da plataforma (a partir de 0)
+        total: Tamanho da lista da plataforma
+
+    Returns:
+        Escore entre 0 e 1 (maior = melhor)
+    """
+    rating = course.get('rating')
+    votes = course.get('num_reviews')
+    if not _is_number(votes):
+        votes = course.get('students_count')
+    if not _is_number(rating):
+        rating, votes = PRIOR_RATING, 0
+    elif not _is_number(votes):
+        votes = 0
+
+    rating = min(max(rating, 0), 5)
+    votes = max(votes, 0)
+    quality = (votes * rating + PRIOR_REVIEWS * PRIOR_RATING) / (votes + PRIOR_REVIEWS) / 5
+    relevance = 1 - position / total if total else 0
+    return QUALITY_WEIGHT * quality + RELEVANCE_WEIGHT * relevance
+
+
+def score_platform_results(courses: List[Dict]) -> List[Tuple[float, int, Dict]]:
+    """Calcula o escore de cada curso de uma plataforma, do maior para o menor"""
+    scored = [(course_score(course, position, len(courses)), position, course) for position, course in enumerate(courses)]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return scored
+
+
+def merge_ranked(results: Dict[str, List[Tuple[float, int, Dict]]], platforms: List[str], limit: int) -> List[Dict]:
+    """
+    Intercala as listas ordenadas das plataformas (k-way merge) e retorna os `limit` melhores
+
+    Args:
+        results: Plataforma -> cursos pontuados por score_platform_results
+        platforms: Ordem das plataformas, usada no desempate
+        limit: Número máximo de cursos
+
+    Returns:
+        Cursos do maior para o menor escore
+    """
+    streams = [
+        [(-score, order, position, course) for score, position, course in results[name]]
+        for order, name in enumerate(platforms) if name in results
+    ]
+    merged = heapq.merge(*streams, key=lambda item: item[:3])
+    return [item[3] for _, item in zip(range(limit), merged)]
+
+
+def kth_best_score(results: Dict[str, List[Tuple[float, int, Dict]]], k: int) -> Optional[float]:
+    """Menor escore entre os k melhores já obtidos, ou None se ainda há menos de k cursos"""
+    scores = heapq.nlargest(k, (score for scored in results.values() for score, _, _ in scored))
+    return scores[-1] if len(scores) >= k else None
+
+
+class ScoreCeilings:
+    """
+    Maior escore observado recentemente em cada plataforma
+
+    Serve de estimativa para decidir se vale a pena esperar uma plataforma que ainda
+    não respondeu: se nem o seu melhor curso típico entraria no top-k, a busca nela é
+    cancelada. Não é um limite superior de verdade: o escore máximo possível é 1.0
+    (rating 5 com muitas reviews na primeira posição), e uma busca pode superar o
+    histórico da plataforma. O corte é, portanto, uma heurística com perda, usada
+    apenas com COURSE_RANK_EARLY_STOP ligado.
+    """
+
+    # Folga sobre o máximo observado, para não descartar plataformas por pouco
+    MARGIN = 0.05
+
+    def __init__(self, window: int, min_samples: int, ttl: float):
+        self.min_samples = min_samples
+        # Amostras expiram: uma plataforma descartada volta a ser consultada e reavaliada
+        self.ttl = ttl
+        self._window = window
+        self._samples: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, platform: str, scored: List[Tuple[float, int, Dict]]):
+        """Registra o melhor escore de uma resposta da plataforma"""
+        if not scored:
+            return
+        with self._lock:
+            self._samples.setdefault(platform, deque(maxlen=self._window)).append((time.time(), scored[0][0]))
+
+    def ceiling(self, platform: str) -> float:
+        """Limite superior estimado do escore da plataforma (1.0 se ainda não há amostras suficientes)"""
+        now = time.time()
+        with self._lock:
+            scores = [score for recorded_at, score in self._samples.get(platform, ()) if now - recorded_at < self.ttl]
+        if len(scores) < self.min_samples:
+            return 1.0
+        return min(1.0, max(scores) + self.MARGIN)
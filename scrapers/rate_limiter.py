@@ -0,0 +1,208 @@
+"""
+Rate limiting de saída para os scrapers
+Token bucket por host de destino, compartilhado entre os workers pelo backend de cache
+(ou pelo SQLite de coordenação do nó, sem CACHE_BACKEND_URL). Quem chama obtém a permissão na hora, aguarda em uma
+fila limitada ou recebe `Throttled` com o tempo sugerido para nova tentativa.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from common.cache_backends import CacheBackend, get_coordination_backend
+from config.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket thread-safe: `rate` tokens por segundo, no máximo `capacity` acumulados"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Repõe os tokens acumulados desde a última atualização"""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Tenta consumir tokens sem bloquear
+
+        Args:
+            tokens: Quantidade de tokens a consumir
+
+        Returns:
+            0 se os tokens foram consumidos, senão os segundos até haver tokens suficientes
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Consome tokens, aguardando a reposição se necessário
+
+        Args:
+            tokens: Quantidade de tokens a consumir
+            timeout: Tempo máximo de espera em segundos (None espera indefinidamente)
+
+        Returns:
+            True se os tokens foram consumidos, False se o prazo expirou
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or wait > remaining:
+                    return False
+            time.sleep(wait)
+
+
+class Throttled(Exception):
+    """Host de destino sem capacidade no momento; `retry_after` sugere quando tentar de novo"""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"Rate limit de saída para {host} excedido (tente em {retry_after:.1f}s)")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class HostRateLimiter:
+    """Token bucket de um host, compartilhado entre workers, com fila de espera limitada"""
+
+    def __init__(self, host: str, rate: float, capacity: float, max_waiters: int,
+                 backend: Optional[Callable[[], Optional[CacheBackend]]] = None):
+        self.host = host
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.max_waiters = max_waiters
+        # Função que retorna o backend compartilhado do processo (resolvido a cada uso, após o fork)
+        self.backend = backend
+        # Usado quando não há backend compartilhado ou ele está indisponível
+        self.local = TokenBucket(rate, capacity)
+
+        self._waiters = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Tenta consumir tokens sem bloquear
+
+        Args:
+            tokens: Quantidade de tokens a consumir
+
+        Returns:
+            0 se os tokens foram consumidos, senão os segundos até haver tokens suficientes
+        """
+        backend = self.backend() if self.backend else None
+        if backend is not None:
+            try:
+                return backend.take_tokens(f"ratelimit:{self.host}", self.rate, self.capacity, tokens)
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                logger.warning(f"Rate limiter de {self.host}: backend indisponível, usando limite local: {str(e)}")
+        return self.local.try_acquire(tokens)
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Consome tokens, aguardando na fila do host se necessário
+
+        Args:
+            tokens: Quantidade de tokens a consumir
+            timeout: Tempo máximo de espera em segundos (None espera indefinidamente)
+
+        Returns:
+            True se os tokens foram consumidos, False se o prazo expirou ou a fila está cheia
+        """
+        try:
+            self.permit(tokens, timeout)
+            return True
+        except Throttled:
+            return False
+
+    def permit(self, tokens: float = 1.0, timeout: Optional[float] = 0) -> None:
+        """
+        Obtém permissão para uma requisição ao host
+
+        Args:
+            tokens: Quantidade de tokens a consumir
+            timeout: Tempo máximo de espera em segundos; 0 não espera, None espera indefinidamente
+
+        Raises:
+            Throttled: Se não houver tokens dentro do prazo ou se a fila de espera estiver cheia
+        """
+        wait = self.try_acquire(tokens)
+        if wait == 0:
+            return
+
+        with self._lock:
+            if self._waiters >= self.max_waiters:
+                raise Throttled(self.host, wait + self._waiters * tokens / self.rate)
+            self._waiters += 1
+
+        try:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if wait > remaining:
+                        raise Throttled(self.host, wait)
+                time.sleep(wait)
+                wait = self.try_acquire(tokens)
+                if wait == 0:
+                    return
+        finally:
+            with self._lock:
+                self._waiters -= 1
+
+    def waiters(self) -> int:
+        """Chamadas aguardando tokens neste worker"""
+        with self._lock:
+            return self._waiters
+
+
+_limiters: Dict[str, HostRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> HostRateLimiter:
+    """
+    Retorna o rate limiter do host, criando-o na primeira chamada
+
+    Args:
+        host: Nome do host de destino (ex: www.udemy.com)
+
+    Returns:
+        Rate limiter do host, compartilhado entre os workers
+    """
+    limiter = _limiters.get(host)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(host)
+            if limiter is None:
+                config = get_config()
+                rate, capacity = config.HOST_RATE_LIMITS.get(host, config.HOST_RATE_LIMIT_DEFAULT)
+                limiter = HostRateLimiter(
+                    host, rate, capacity,
+                    max_waiters=config.HOST_RATE_LIMIT_MAX_WAITERS,
+                    backend=get_coordination_backend
+                )
+                _limiters[host] = limiter
+                logger.debug(f"Rate limiter criado para {host}: {rate} req/s, burst {capacity}")
+    return limiter
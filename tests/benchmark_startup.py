@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark de inicialização de um worker
+Mede, em um interpretador novo, o tempo de `import main` + `main.create_app()` e o
+RSS resultante, e lista quais dependências pesadas de scraping foram carregadas.
+Para comparação, repete a medição pré-carregando essas dependências (como acontecia
+quando os scrapers as importavam no topo do módulo).
+
+Uso: python tests/benchmark_startup.py [repetições]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('selenium', 'linkedin_scraper', 'cloudscraper', 'pandas', 'bs4', 'lxml', 'cryptography')
+
+PROBE = """
+import json, sys, time, warnings
+warnings.simplefilter('ignore')
+preload = {preload!r}
+started = time.perf_counter()
+for name in preload:
+    try:
+        __import__(name)
+    except ImportError:
+        pass
+import main
+main.create_app()
+elapsed = time.perf_counter() - started
+
+def rss_kb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(json.dumps({{
+    'seconds': elapsed,
+    'rss_kb': rss_kb(),
+    'loaded': [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+
+def measure(preload=()) -> dict:
+    code = PROBE.format(preload=tuple(preload), heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def summarize(label: str, runs: list):
+    seconds = statistics.median(run['seconds'] for run in runs) * 1000
+    rss = statistics.median(run['rss_kb'] for run in runs) / 1024
+    loaded = ', '.join(runs[0]['loaded']) or 'nenhuma'
+    print(f"{label:<22} {seconds:8.0f} ms  {rss:7.1f} MB RSS  dependências pesadas: {loaded}")
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    summarize('create_app (lazy)', [measure() for _ in range(repetitions)])
+    summarize('com pré-carga (antes)', [measure(HEAVY_MODULES) for _ in range(repetitions)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark do payload da busca da Udemy com e sem projeção de campos (fields[...])
+Parte de uma página de exemplo no formato padrão da API (tests/fixtures/udemy_search_page.json,
+replicada até o tamanho real da página) e aplica a mesma projeção pedida por
+_fetch_udemy_page. Mede bytes transferidos, tempo de json.loads e o tempo do
+parse completo da página pelo scraper.
+
+Uso: python tests/benchmark_udemy_payload.py [repetições]
+"""
+
+import copy
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers import course_scraper
+from scrapers.course_scraper import CourseScraper, UDEMY_SEARCH_FIELDS
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'udemy_search_page.json')
+PAGE_SIZE = 12
+
+
+def full_page() -> dict:
+    """Página padrão: o curso de exemplo replicado com IDs distintos"""
+    with open(FIXTURE, encoding='utf-8') as f:
+        page = json.load(f)
+    template = page['courses'][0]
+    page['courses'] = []
+    for index in range(PAGE_SIZE):
+        course = copy.deepcopy(template)
+        course['id'] = template['id'] + index
+        course['title'] = f"{template['title']} ({index})"
+        page['courses'].append(course)
+    return page
+
+
+def projected_page(page: dict) -> dict:
+    """Mesma página com apenas os campos de UDEMY_SEARCH_FIELDS (como a API responde à projeção)"""
+    course_fields = set(UDEMY_SEARCH_FIELDS['fields[course]'].split(',')) | {'_class', 'id'}
+    user_fields = set(UDEMY_SEARCH_FIELDS['fields[user]'].split(',')) | {'_class'}
+    projected = dict(page)
+    projected['courses'] = []
+    for course in page['courses']:
+        course = {key: value for key, value in course.items() if key in course_fields}
+        course['visible_instructors'] = [
+            {key: value for key, value in user.items() if key in user_fields}
+            for user in course.get('visible_instructors', [])
+        ]
+        projected['courses'].append(course)
+    return projected
+
+
+class _Response:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class _Session:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def get(self, *args, **kwargs):
+        return _Response(self.body)
+
+
+class _NoLimit:
+    def permit(self, timeout=None):
+        pass
+
+
+def measure(label: str, body: bytes, repeat: int):
+    scraper = CourseScraper()
+    session = _Session(body)
+    course_scraper.get_session = lambda name='default': session
+    course_scraper.get_host_limiter = lambda host: _NoLimit()
+
+    decode = min(timeit.repeat(lambda: json.loads(body), number=repeat, repeat=5)) / repeat
+    parse = min(timeit.repeat(
+        lambda: scraper._fetch_udemy_page('python', 'en', 1), number=repeat, repeat=5
+    )) / repeat
+    print(f"{label:<10} {len(body):>8} bytes  json.loads {decode * 1e6:7.1f} µs  página {parse * 1e6:7.1f} µs")
+    return len(body), decode
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    page = full_page()
+    full = json.dumps(page, ensure_ascii=False).encode('utf-8')
+    projected = json.dumps(projected_page(page), ensure_ascii=False).encode('utf-8')
+
+    print(f"Página de {PAGE_SIZE} cursos, {repeat} repetições")
+    full_bytes, full_decode = measure('padrão', full, repeat)
+    projected_bytes, projected_decode = measure('projeção', projected, repeat)
+    print(f"Redução: {100 * (1 - projected_bytes / full_bytes):.0f}% dos bytes, "
+          f"{100 * (1 - projected_decode / full_decode):.0f}% do json.loads")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark do ranqueamento dos cursos da Udemy
+Compara o caminho anterior (DataFrame do pandas) com o TopKRanker, para o volume
+real de uma busca (até 3 páginas de ~12 cursos).
+
+Uso: python tests/benchmark_udemy_ranker.py [repetições]
+"""
+
+import os
+import random
+import subprocess
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.ranking import TopKRanker, udemy_rank_key
+
+PAGES = 3
+PAGE_SIZE = 12
+LIMIT = 10
+
+
+def make_pages(seed: int = 7):
+    """Páginas sintéticas com os campos devolvidos por _fetch_udemy_page"""
+    rng = random.Random(seed)
+    pages = []
+    for page in range(1, PAGES + 1):
+        pages.append([
+            {
+                'id': f"udemy_{page}{index}",
+                'title': f"Curso {page}-{index}",
+                'instructor': 'Instrutor',
+                'num_reviews': rng.choice([None, rng.randint(0, 50000)]),
+                'rating': rng.choice([None, round(rng.uniform(3.0, 5.0), 2)]),
+                'students_count': rng.randint(0, 200000),
+                'price': None,
+                'original_price': None,
+                'language': 'pt',
+                'duration': None,
+                'level': None,
+                'url': f"https://www.udemy.com/course/{page}-{index}/",
+                'image_url': None,
+                'description': 'Descrição',
+                'source': 'udemy'
+            }
+            for index in range(PAGE_SIZE)
+        ])
+    return pages
+
+
+def rank_with_pandas(pages):
+    import pandas as pd
+
+    rows = [course for page in pages for course in page]
+    df = pd.DataFrame(rows)
+    df = df.sort_values(['rating', 'num_reviews'], ascending=[False, False])
+    return df.head(LIMIT).to_dict('records')
+
+
+def rank_with_heap(pages):
+    ranker = TopKRanker(LIMIT, key=udemy_rank_key)
+    for page, courses in enumerate(pages, 1):
+        ranker.extend(courses, group=page)
+    return ranker.results()
+
+
+def pandas_import_time() -> float:
+    """Tempo de importação do pandas em um interpretador novo (custo de cold start)"""
+    code = 'import time; t = time.perf_counter(); import pandas; print(time.perf_counter() - t)'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return float(output.stdout.strip())
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pages = make_pages()
+
+    heap_ids = [course['id'] for course in rank_with_heap(pages)]
+    heap_time = timeit.timeit(lambda: rank_with_heap(pages), number=repetitions)
+    print(f"TopKRanker: {heap_time / repetitions * 1e6:8.1f} µs por busca")
+
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        print("pandas não instalado: comparação ignorada")
+        return
+
+    pandas_ids = [course['id'] for course in rank_with_pandas(pages)]
+    pandas_time = timeit.timeit(lambda: rank_with_pandas(pages), number=repetitions)
+    print(f"pandas:     {pandas_time / repetitions * 1e6:8.1f} µs por busca")
+    print(f"Ganho:      {pandas_time / heap_time:8.1f}x")
+    print(f"Importação do pandas: {pandas_import_time() * 1000:.0f} ms")
+    print(f"Mesma ordem: {'sim' if heap_ids == pandas_ids else 'NÃO'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark das classes de worker do gunicorn (sync, gthread, gevent)
+Sobe a aplicação real com deployment/gunicorn.conf.py, trocando as plataformas de
+cursos por um servidor local que responde após um atraso fixo (upstream simulado),
+e mede requisições por segundo e latência p50/p99 de POST /api/v1/courses sob
+carga concorrente. Cada requisição usa uma consulta diferente, sem cache, para
+que a coalescência de buscas idênticas não mascare a concorrência.
+
+Uso: python tests/benchmark_workers.py [requisições] [concorrência] [atraso_upstream_ms]
+"""
+
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+API_KEY = 'api-key-1-change-in-production'
+WORKERS = 2
+THREADS = 8
+
+
+class StubUpstream(BaseHTTPRequestHandler):
+    """Plataforma simulada: responde com cursos após `delay` segundos"""
+
+    delay = 0.2
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        params = parse_qs(urlparse(self.path).query)
+        platform = params.get('platform', ['udemy'])[0]
+        limit = int(params.get('limit', ['10'])[0])
+        body = json.dumps([
+            {
+                'id': f"{platform}_{index}",
+                'title': f"Curso {index}",
+                'rating': 4.5,
+                'num_reviews': 100 + index,
+                'language': 'en',
+                'source': platform
+            }
+            for index in range(limit)
+        ]).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_stubbed_app():
+    """Aplicação real com as buscas nas plataformas apontando para o upstream simulado"""
+    from main import create_app
+    from scrapers.course_scraper import CourseScraper
+
+    upstream = os.environ['BENCHMARK_UPSTREAM_URL']
+
+    def fetch(self, platform, limit):
+        response = self.session.get(upstream, params={'platform': platform, 'limit': limit}, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    CourseScraper._search_udemy = lambda self, query, limit, language, start=0: fetch(self, 'udemy', limit)
+    CourseScraper._search_coursera = lambda self, query, limit, start=0: fetch(self, 'coursera', limit)
+    CourseScraper._search_edx = lambda self, query, limit, start=0: fetch(self, 'edx', limit)
+
+    app = create_app()
+    # O limite por IP (200/dia) barraria o próprio benchmark
+    for limiter in app.extensions.get('limiter', ()):
+        limiter.enabled = False
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(url: str, timeout: float = 30):
+    import requests
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"gunicorn não respondeu em {timeout}s")
+
+
+def run_load(base_url: str, requests_total: int, concurrency: int, label: str) -> dict:
+    """Dispara `requests_total` buscas com `concurrency` clientes simultâneos"""
+    import requests
+
+    local = threading.local()
+
+    def one(index: int):
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = local.session = requests.Session()
+        started = time.perf_counter()
+        response = session.post(
+            f"{base_url}/api/v1/courses/",
+            json={'query': f"{label}-{index}", 'limit': 5},
+            headers={'X-API-Key': API_KEY},
+            timeout=60
+        )
+        return time.perf_counter() - started, response.status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one, range(requests_total)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        'rps': len(results) / elapsed,
+        'p50': statistics.median(latencies),
+        'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        'errors': sum(1 for _, status in results if status != 200)
+    }
+
+
+def measure(worker_class: str, upstream_url: str, requests_total: int, concurrency: int) -> dict:
+    port = free_port()
+    env = dict(
+        os.environ,
+        PYTHONPATH=ROOT,
+        BENCHMARK_UPSTREAM_URL=upstream_url,
+        GUNICORN_WORKER_CLASS=worker_class,
+        GUNICORN_THREADS=str(THREADS if worker_class == 'gthread' else 1),
+        CACHE_ENABLED='false',
+        # As três plataformas simuladas estão no mesmo host: o pool não deve serializá-las
+        HTTP_POOL_MAXSIZE=str(3 * THREADS),
+        CACHE_BACKEND_URL=''
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        process = subprocess.Popen(
+            [
+                sys.executable, '-m', 'gunicorn',
+                '--config', 'deployment/gunicorn.conf.py',
+                '--bind', f"127.0.0.1:{port}",
+                '--workers', str(WORKERS),
+                '--pid', os.path.join(tmp, 'gunicorn.pid'),
+                'tests.benchmark_workers:create_stubbed_app()'
+            ],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            wait_ready(f"{base_url}/health")
+            run_load(base_url, concurrency, concurrency, f"{worker_class}-warmup")
+            return run_load(base_url, requests_total, concurrency, worker_class)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+def summarize(label: str, result: dict):
+    print(
+        f"{label:<8} {result['rps']:8.1f} req/s  p50 {result['p50'] * 1000:7.0f} ms  "
+        f"p99 {result['p99'] * 1000:7.0f} ms  erros: {result['errors']}"
+    )
+
+
+def main():
+    requests_total = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    StubUpstream.delay = (int(sys.argv[3]) if len(sys.argv) > 3 else 200) / 1000
+
+    upstream = ThreadingHTTPServer(('127.0.0.1', 0), StubUpstream)
+    upstream.daemon_threads = True
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+    upstream_url = f"http://127.0.0.1:{upstream.server_address[1]}/search"
+
+    print(f"{WORKERS} workers, {THREADS} threads (gthread), {concurrency} clientes, "
+          f"upstream com {StubUpstream.delay * 1000:.0f} ms")
+    for worker_class in ('sync', 'gthread', 'gevent'):
+        if worker_class == 'gevent':
+            try:
+                import gevent  # noqa: F401
+            except ImportError:
+                print(f"{worker_class:<8} ignorado (pip install gevent)")
+                continue
+        summarize(worker_class, measure(worker_class, upstream_url, requests_total, concurrency))
+
+    upstream.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+Testes do cache de resultados de busca
+"""
+
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import cache as cache_module
+from common.cache import SearchCache, make_cache_key
+from common.cache_backends import SQLiteBackend, create_backend
+
+
+class Clock:
+    """Relógio controlável para simular a passagem do tempo"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def _patch_clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, 'time', clock.time)
+    return clock
+
+
+def test_cache_key_normalizes_fields():
+    first = make_cache_key('courses', {'query': '  Data   Science ', 'platform': 'all'})
+    second = make_cache_key('courses', {'platform': 'all', 'query': 'data science'})
+
+    assert first == second
+    assert first != make_cache_key('jobs', {'query': 'data science', 'platform': 'all'})
+
+
+def test_fresh_entry_is_served_without_loading(monkeypatch):
+    _patch_clock(monkeypatch)
+    cache = SearchCache('test', max_entries=10, stale_ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {'total': len(calls)}
+
+    assert cache.get_or_load('k', loader, ttl=lambda value: 30) == {'total': 1}
+    assert cache.get_or_load('k', loader, ttl=lambda value: 30) == {'total': 1}
+    assert len(calls) == 1
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(monkeypatch):
+    clock = _patch_clock(monkeypatch)
+    cache = SearchCache('test', max_entries=10, stale_ttl=60)
+    cache.set('k', 'antigo', ttl=30)
+    refreshed = threading.Event()
+
+    def loader():
+        refreshed.set()
+        return 'novo'
+
+    clock.now += 45
+    assert cache.get_or_load('k', loader, ttl=lambda value: 30) == 'antigo'
+    assert refreshed.wait(2)
+
+    for _ in range(100):
+        if cache.get('k').value == 'novo':
+            break
+        threading.Event().wait(0.01)
+    assert cache.get('k').value == 'novo'
+
+
+def test_expired_entry_is_loaded_synchronously(monkeypatch):
+    clock = _patch_clock(monkeypatch)
+    cache = SearchCache('test', max_entries=10, stale_ttl=60)
+    cache.set('k', 'antigo', ttl=30)
+
+    clock.now += 100
+    assert cache.get_or_load('k', lambda: 'novo', ttl=lambda value: 30) == 'novo'
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchCache('test', max_entries=2, stale_ttl=60)
+    cache.set('a', 1, ttl=30)
+    cache.set('b', 2, ttl=30)
+    cache.get('a')
+
+    cache.set('c', 3, ttl=30)
+
+    assert cache.get('b') is None
+    assert cache.get('a').value == 1
+    assert len(cache) == 2
+
+
+def test_sqlite_backend_set_get_add(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / 'cache.db'), prefix='t:')
+
+    backend.set('a', 'valor', ttl=30)
+    assert backend.get('a') == 'valor'
+    assert backend.get('b') is None
+
+    assert backend.add('lock', '1', ttl=30)
+    assert not backend.add('lock', '2', ttl=30)
+    backend.delete('lock')
+    assert backend.add('lock', '3', ttl=30)
+
+    backend.set('expirado', 'x', ttl=-1)
+    assert backend.get('expirado') is None
+    assert backend.add('expirado', 'y', ttl=30)
+
+
+def test_results_are_shared_between_workers(tmp_path):
+    """Um cache (worker) grava; outro cache com memória vazia lê do backend"""
+    backend = SQLiteBackend(str(tmp_path / 'cache.db'), prefix='t:')
+    worker_a = SearchCache('courses', max_entries=10, stale_ttl=60, backend=lambda: backend)
+    worker_b = SearchCache('courses', max_entries=10, stale_ttl=60, backend=lambda: backend)
+
+    worker_a.get_or_load('k', lambda: {'total': 1}, ttl=lambda value: 30)
+
+    def fail():
+        raise AssertionError('não deveria consultar a origem')
+
+    assert worker_b.get_or_load('k', fail, ttl=lambda value: 30) == {'total': 1}
+
+
+def test_create_backend_from_url(tmp_path):
+    assert create_backend('') is None
+    assert isinstance(create_backend(f"sqlite:///{tmp_path}/cache.db"), SQLiteBackend)
+
+
+def test_partial_results_get_a_short_ttl(monkeypatch):
+    from config.settings import get_config
+    from courses import services as course_services
+    from courses.models import CourseSearchRequest
+    from courses.services import CourseService
+    from jobs.models import JobSearchRequest
+    from jobs.services import JobService
+    from scrapers.course_scraper import CourseScraper
+    from scrapers.linkedin_http import JobListing
+
+    config = get_config()
+    monkeypatch.setattr(config, 'CACHE_ENABLED', False)
+    monkeypatch.setattr(course_services, 'get_course_catalog', lambda: None)
+
+    def failing(self, *args, **kwargs):
+        raise ConnectionError('plataforma fora do ar')
+
+    monkeypatch.setattr(CourseScraper, '_search_udemy', failing)
+    monkeypatch.setattr(CourseScraper, '_search_coursera',
+                        lambda self, *args, **kwargs: [{'id': 'coursera_1', 'title': 'Python', 'source': 'coursera'}])
+    monkeypatch.setattr(CourseScraper, '_search_edx', lambda self, *args, **kwargs: [])
+
+    courses = CourseService()
+    request = CourseSearchRequest(query='python', language='')
+    result = courses._search_courses_uncached(request)
+    assert result['total'] == 1
+    assert courses._cache_ttl(request, result) == config.CACHE_PARTIAL_TTL
+
+    interrupted = JobListing([{'id': 'linkedin_1', 'title': 'Vaga', 'source': 'linkedin', '_position': 0}])
+    interrupted.complete = False
+    jobs = JobService()
+    monkeypatch.setattr(jobs.scraper, 'search_jobs', lambda **kwargs: interrupted)
+    assert jobs._cache_ttl(jobs._search_jobs_upstream(JobSearchRequest(query='python'))) == config.CACHE_PARTIAL_TTL
+
+    monkeypatch.setattr(jobs.scraper, 'search_jobs', lambda **kwargs: list(interrupted))
+    assert jobs._cache_ttl(jobs._search_jobs_upstream(JobSearchRequest(query='python'))) == config.CACHE_TTLS['linkedin']
@@ -0,0 +1,74 @@
+"""
+Testes das respostas condicionais (ETag / If-None-Match) e do Cache-Control
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cache import content_etag
+from config.settings import get_config
+from courses import services
+from scrapers.course_scraper import CourseScraper
+from scrapers.job_scraper import JobScraper
+
+API_KEY = 'api-key-1-change-in-production'
+
+
+def test_content_etag_ignores_generation_time():
+    first = {'courses': [{'id': 'udemy_1'}], 'timestamp': '2024-01-01T10:00:00'}
+    refreshed = {'courses': [{'id': 'udemy_1'}], 'timestamp': '2024-01-01T11:00:00'}
+    changed = {'courses': [{'id': 'udemy_2'}], 'timestamp': '2024-01-01T10:00:00'}
+
+    assert content_etag(first) == content_etag(refreshed)
+    assert content_etag(first) != content_etag(changed)
+
+
+def test_course_search_revalidates_with_etag(monkeypatch):
+    from main import create_app
+
+    calls = []
+
+    def search(self, query, limit, language, start=0):
+        calls.append(query)
+        return [{'id': 'udemy_1', 'title': 'Python', 'language': 'en', 'source': 'udemy'}]
+
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', True)
+    monkeypatch.setattr(services, 'get_course_catalog', lambda: None)
+    monkeypatch.setattr(CourseScraper, '_search_udemy', search)
+    client = create_app().test_client()
+    body = {'query': 'etag python', 'platform': 'udemy'}
+
+    first = client.post('/api/v1/courses/', headers={'X-API-Key': API_KEY}, json=body)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert first.cache_control.private
+    assert 0 < first.cache_control.max_age <= get_config().CACHE_TTLS['udemy']
+
+    second = client.post('/api/v1/courses/', headers={'X-API-Key': API_KEY, 'If-None-Match': etag}, json=body)
+    assert second.status_code == 304
+    assert second.data == b''
+    assert second.headers['ETag'] == etag
+
+    # Mesmo resultado em cache, mas a query ecoada no corpo é outra
+    other = client.post('/api/v1/courses/', headers={'X-API-Key': API_KEY, 'If-None-Match': etag},
+                        json={'query': 'Etag Python', 'platform': 'udemy'})
+    assert other.status_code == 200
+    assert calls == ['etag python']
+
+
+def test_job_details_revalidate_with_etag(monkeypatch):
+    from main import create_app
+
+    monkeypatch.setattr(JobScraper, 'get_job_details', lambda self, job_id: {
+        'id': job_id, 'title': 'Dev Python', 'company': 'ACME', 'source': 'linkedin'
+    })
+    client = create_app().test_client()
+
+    first = client.get('/api/v1/jobs/linkedin_123', headers={'X-API-Key': API_KEY})
+    assert first.status_code == 200
+
+    second = client.get('/api/v1/jobs/linkedin_123', headers={'X-API-Key': API_KEY, 'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 304
+    assert second.cache_control.max_age == first.cache_control.max_age
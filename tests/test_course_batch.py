@@ -0,0 +1,94 @@
+"""
+Testes da busca de cursos em lote
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import get_config
+from scrapers.course_scraper import CourseScraper
+from scrapers.rate_limiter import Throttled
+
+API_KEY = 'api-key-1-change-in-production'
+
+
+def _client(monkeypatch, search):
+    from main import create_app
+
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', False)
+    monkeypatch.setattr(CourseScraper, '_search_udemy', search)
+    return create_app().test_client()
+
+
+def test_batch_dedupes_and_keeps_order(monkeypatch):
+    queries = []
+
+    def search(self, query, limit, language, start=0):
+        queries.append(query)
+        return [{'id': f'udemy_{query}', 'title': query, 'language': 'en', 'source': 'udemy'}]
+
+    client = _client(monkeypatch, search)
+    response = client.post('/api/v1/courses/batch', headers={'X-API-Key': API_KEY}, json={'searches': [
+        {'query': 'python', 'platform': 'udemy'},
+        {'query': 'Python ', 'platform': 'udemy'},
+        {'query': '', 'platform': 'udemy'},
+        {'query': 'react', 'platform': 'udemy'}
+    ]})
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [item['success'] for item in results] == [True, True, False, True]
+    assert results[0]['courses'] == results[1]['courses']
+    assert results[2]['error'] == 'validation_error'
+    assert results[3]['courses'][0]['id'] == 'udemy_react'
+    assert sorted(queries) == ['python', 'react']
+
+
+def test_batch_reports_errors_per_item(monkeypatch):
+    def search(self, query, limit, language, start=0):
+        if query == 'busy':
+            raise Throttled('www.udemy.com', 1.5)
+        return [{'id': 'udemy_1', 'title': query, 'language': 'en', 'source': 'udemy'}]
+
+    client = _client(monkeypatch, search)
+    response = client.post('/api/v1/courses/batch', headers={'X-API-Key': API_KEY}, json=[
+        {'query': 'busy', 'platform': 'udemy'},
+        {'query': 'python', 'platform': 'udemy'}
+    ])
+
+    results = response.get_json()['results']
+    assert results[0]['error'] == 'rate_limit_exceeded'
+    assert results[0]['details'] == {'host': 'www.udemy.com', 'retry_after': 2}
+    assert results[1]['total'] == 1
+
+
+def test_batch_rejects_oversized_requests(monkeypatch):
+    client = _client(monkeypatch, lambda self, query, limit, language: [])
+    searches = [{'query': f'q{index}'} for index in range(get_config().COURSE_BATCH_MAX_ITEMS + 1)]
+
+    response = client.post('/api/v1/courses/batch', headers={'X-API-Key': API_KEY}, json={'searches': searches})
+
+    assert response.status_code == 400
+
+
+def test_details_by_ids(monkeypatch):
+    from main import create_app
+
+    def details(self, course_ids):
+        return {course_id: None if course_id == 'udemy_2' else {'id': course_id, 'title': course_id}
+                for course_id in course_ids}
+
+    monkeypatch.setattr(CourseScraper, 'get_courses_details', details)
+    client = create_app().test_client()
+
+    response = client.get('/api/v1/courses/?ids=udemy_1,udemy_2,coursera_Gtv4Xb1-EeS', headers={'X-API-Key': API_KEY})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [course['id'] for course in body['courses']] == ['udemy_1', 'coursera_Gtv4Xb1-EeS']
+    assert body['not_found'] == ['udemy_2']
+
+    response = client.get('/api/v1/courses/?ids=udemy_1,invalid', headers={'X-API-Key': API_KEY})
+    assert response.status_code == 400
+    assert response.get_json()['details'] == {'field': 'ids', 'value': 'invalid'}
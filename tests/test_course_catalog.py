@@ -0,0 +1,117 @@
+"""
+Testes do catálogo local de cursos (SQLite + FTS5)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import get_config
+from courses import services
+from courses.catalog import CourseCatalog
+from courses.models import CourseSearchRequest
+from courses.services import CourseService
+from scrapers.course_scraper import CourseScraper
+
+
+def _course(course_id, title, language='English', **fields):
+    return {'id': course_id, 'title': title, 'language': language, 'source': 'udemy', **fields}
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = CourseCatalog(str(tmp_path / 'catalog.db'))
+    yield catalog
+    catalog.close()
+
+
+def test_search_uses_fts_ranking_and_language(catalog):
+    catalog.upsert('udemy', 'Python', 'en', 10, [
+        _course('udemy_1', 'Java completo', description='Inclui um capítulo de python'),
+        _course('udemy_2', 'Python para Análise de Dados'),
+        _course('udemy_3', 'Python em português', language='Português')
+    ])
+
+    courses = catalog.search('python', 'udemy', 'en', 10, max_age=60)
+
+    assert [course['id'] for course in courses] == ['udemy_2', 'udemy_1']
+    assert catalog.search('python', 'coursera', 'en', 10, max_age=60) is None
+
+
+def test_search_requires_fresh_and_sufficient_coverage(catalog):
+    catalog.upsert('udemy', 'python', 'en', 2, [_course('udemy_1', 'Python'), _course('udemy_2', 'Python 2')])
+
+    assert catalog.search('python', 'udemy', 'en', 2, max_age=0) is None
+    # A busca registrada pediu 2 cursos e a plataforma tinha pelo menos isso: não cobre um pedido de 5
+    assert catalog.search('python', 'udemy', 'en', 5, max_age=60) is None
+    assert catalog.search('django', 'udemy', 'en', 2, max_age=60) is None
+
+
+def test_upsert_updates_existing_course(catalog):
+    catalog.upsert('udemy', 'python', 'en', 10, [_course('udemy_1', 'Python', rating=4.0)])
+    catalog.upsert('udemy', 'python', 'en', 10, [_course('udemy_1', 'Python avançado', rating=4.8)])
+
+    courses = catalog.search('avançado', 'udemy', 'en', 10, max_age=60)
+    assert courses is None  # termo nunca buscado na plataforma
+    courses = catalog.search('python', 'udemy', 'en', 10, max_age=60)
+    assert [(course['title'], course['rating']) for course in courses] == [('Python avançado', 4.8)]
+
+
+def test_upsert_accepts_list_valued_fields(catalog):
+    # Coursera (instructorIds) e edX (staff) devolvem listas de instrutores
+    catalog.upsert('coursera', 'python', 'en', 10, [
+        _course('coursera_abc', 'Python for Everybody', source='coursera', instructor=['Charles Severance', 42])
+    ])
+
+    courses = catalog.search('severance', 'coursera', 'en', 10, max_age=60)
+    assert courses is None  # termo nunca buscado, mas a gravação não falhou
+    [course] = catalog.search('python', 'coursera', 'en', 10, max_age=60)
+    assert course['instructor'] == ['Charles Severance', 42]
+    # Os nomes entram no índice FTS
+    rows = catalog._connection().execute("SELECT rowid FROM courses_fts WHERE courses_fts MATCH 'severance'").fetchall()
+    assert len(rows) == 1
+
+
+def test_service_answers_covered_platforms_from_catalog(monkeypatch, catalog):
+    calls = []
+
+    def fake_search(platform):
+        def search(self, *args, **kwargs):
+            calls.append(platform)
+            return [_course(f'{platform}_1', f'Python {platform}', source=platform)]
+        return search
+
+    for platform in ('udemy', 'coursera', 'edx'):
+        monkeypatch.setattr(CourseScraper, f'_search_{platform}', fake_search(platform))
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', True)
+    monkeypatch.setattr(services, 'get_course_catalog', lambda: catalog)
+
+    service = CourseService()
+    request = CourseSearchRequest(query='python', limit=5)
+    first = service._search_courses_uncached(request)
+    second = service._search_courses_uncached(request)
+
+    assert sorted(calls) == ['coursera', 'edx', 'udemy']
+    assert first['total'] == second['total'] == 3
+    assert {course['id'] for course in second['courses']} == {'udemy_1', 'coursera_1', 'edx_1'}
+
+
+def test_catalog_answers_are_cached_only_for_remaining_coverage(monkeypatch, catalog):
+    monkeypatch.setattr(CourseScraper, '_search_udemy', lambda self, *args, **kwargs: [_course('udemy_1', 'Python')])
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', True)
+    monkeypatch.setattr(services, 'get_course_catalog', lambda: catalog)
+
+    service = CourseService()
+    request = CourseSearchRequest(query='python', platform='udemy', limit=5)
+    first = service._search_courses_uncached(request)
+    assert service._cache_ttl(request, first) == pytest.approx(get_config().CACHE_TTLS['udemy'], abs=5)
+
+    # Cobertura gravada há 59 minutos: o resultado vale só o que resta dela
+    catalog._connection().execute('UPDATE searches SET fetched_at = fetched_at - ?', (59 * 60,))
+    second = service._search_courses_uncached(request)
+
+    assert second['courses'] == first['courses']
+    assert service._cache_ttl(request, second) == pytest.approx(get_config().CACHE_TTLS['udemy'] - 59 * 60, abs=5)
@@ -0,0 +1,280 @@
+"""
+Testes do CourseScraper sem acesso à rede
+As buscas por plataforma são substituídas por funções locais
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from scrapers import course_scraper
+from scrapers.course_scraper import CourseScraper
+from scrapers.ranking import ScoreCeilings
+
+
+@pytest.fixture(autouse=True)
+def fresh_score_ceilings(monkeypatch):
+    """Isola os escores observados entre os testes"""
+    ceilings = ScoreCeilings(window=50, min_samples=2, ttl=3600)
+    monkeypatch.setattr(course_scraper, '_score_ceilings', ceilings)
+    return ceilings
+
+
+def _fake_search(platform, delay=0.0, count=2):
+    """Cria uma busca falsa que demora `delay` segundos"""
+    def search(*args, **kwargs):
+        time.sleep(delay)
+        return [{'id': f'{platform}_{i}', 'title': f'{platform} {i}', 'source': platform} for i in range(count)]
+    return search
+
+
+def _make_scraper(monkeypatch, delays, timeouts=None):
+    scraper = CourseScraper()
+    monkeypatch.setattr(scraper, '_search_udemy', _fake_search('udemy', delays.get('udemy', 0)))
+    monkeypatch.setattr(scraper, '_search_coursera', _fake_search('coursera', delays.get('coursera', 0)))
+    monkeypatch.setattr(scraper, '_search_edx', _fake_search('edx', delays.get('edx', 0)))
+    if timeouts:
+        monkeypatch.setattr(scraper.config, 'COURSE_PLATFORM_TIMEOUTS', timeouts)
+    return scraper
+
+
+def test_search_all_platforms_runs_concurrently(monkeypatch):
+    """A latência deve ser a da plataforma mais lenta, não a soma"""
+    scraper = _make_scraper(monkeypatch, {'udemy': 0.3, 'coursera': 0.3, 'edx': 0.3})
+
+    started = time.monotonic()
+    courses = scraper.search_courses('python', platform='all', limit=10)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.8
+    # Sem avaliações o escore empata: intercalado pela posição em cada plataforma
+    assert [c['source'] for c in courses] == ['udemy', 'coursera', 'edx', 'udemy', 'coursera', 'edx']
+
+
+def test_platform_past_deadline_is_dropped(monkeypatch):
+    """Plataforma que estoura o prazo é descartada sem segurar a requisição"""
+    scraper = _make_scraper(
+        monkeypatch,
+        {'udemy': 0.0, 'coursera': 2.0, 'edx': 0.0},
+        timeouts={'udemy': 1.0, 'coursera': 0.2, 'edx': 1.0}
+    )
+
+    started = time.monotonic()
+    courses = scraper.search_courses('python', platform='all', limit=10)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert {c['source'] for c in courses} == {'udemy', 'edx'}
+
+
+def test_single_platform(monkeypatch):
+    scraper = _make_scraper(monkeypatch, {})
+
+    courses = scraper.search_courses('python', platform='edx', limit=1)
+
+    assert [c['id'] for c in courses] == ['edx_0']
+
+
+def test_scrapers_share_pooled_sessions():
+    """Instâncias diferentes reutilizam as mesmas sessões HTTP do processo"""
+    first, second = CourseScraper(), CourseScraper()
+
+    assert first.session is second.session
+    assert first.udemy_scraper is second.udemy_scraper
+    assert first.udemy_scraper.size == 4
+    with first.udemy_scraper.checkout() as session:
+        assert session.get_adapter('https://www.udemy.com').poolmanager.connection_pool_kw['maxsize'] == 1
+
+
+def test_udemy_sessions_are_lent_to_one_thread_at_a_time():
+    """O cloudscraper não é seguro entre threads: cada sessão atende uma requisição por vez"""
+    import threading
+
+    from scrapers.http_pool import SessionPool
+
+    pool = SessionPool(object, size=3)
+    in_use = set()
+    lock = threading.Lock()
+    errors = []
+
+    def request():
+        with pool.checkout(timeout=5) as session:
+            with lock:
+                if id(session) in in_use:
+                    errors.append('sessão compartilhada')
+                in_use.add(id(session))
+            time.sleep(0.01)
+            with lock:
+                in_use.discard(id(session))
+
+    # Threads de vida curta (uma por requisição) não acumulam sessões
+    threads = [threading.Thread(target=request) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(pool._created) == 3
+    with pool.checkout():
+        with pool.checkout():
+            with pool.checkout():
+                with pytest.raises(TimeoutError):
+                    with pool.checkout(timeout=0.01):
+                        pass
+
+
+def _rated(platform, ratings, delay=0.0):
+    def search(*args, **kwargs):
+        time.sleep(delay)
+        return [
+            {'id': f'{platform}_{i}', 'rating': rating, 'num_reviews': 10000, 'source': platform}
+            for i, rating in enumerate(ratings)
+        ]
+    return search
+
+
+def test_results_are_merged_by_normalized_score(monkeypatch):
+    scraper = CourseScraper()
+    monkeypatch.setattr(scraper, '_search_udemy', _rated('udemy', [3.9, 3.8]))
+    monkeypatch.setattr(scraper, '_search_coursera', _rated('coursera', [4.9, 4.1]))
+    monkeypatch.setattr(scraper, '_search_edx', _rated('edx', [4.5]))
+
+    courses = scraper.search_courses('python', platform='all', limit=3)
+
+    assert [c['id'] for c in courses] == ['coursera_0', 'edx_0', 'udemy_0']
+
+
+def test_platform_that_cannot_reach_top_k_is_skipped(monkeypatch, fresh_score_ceilings):
+    scraper = CourseScraper()
+    monkeypatch.setattr(scraper.config, 'COURSE_RANK_EARLY_STOP', True)
+    monkeypatch.setattr(scraper, '_search_udemy', _rated('udemy', [4.8, 4.7, 4.6]))
+    monkeypatch.setattr(scraper, '_search_coursera', _rated('coursera', [4.9], delay=0.1))
+    monkeypatch.setattr(scraper, '_search_edx', _rated('edx', [4.9], delay=2.0))
+
+    # Histórico: os melhores cursos da edX ficam bem abaixo dos da Udemy
+    low = [(0.4, 0, {})]
+    fresh_score_ceilings.record('edx', low)
+    fresh_score_ceilings.record('edx', low)
+
+    started = time.monotonic()
+    courses = scraper.search_courses('python', platform='all', limit=3)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert [c['id'] for c in courses] == ['coursera_0', 'udemy_0', 'udemy_1']
+
+
+def test_early_stop_is_off_by_default(monkeypatch, fresh_score_ceilings):
+    scraper = CourseScraper()
+    monkeypatch.setattr(scraper, '_search_udemy', _rated('udemy', [4.8, 4.7, 4.6]))
+    monkeypatch.setattr(scraper, '_search_coursera', _rated('coursera', [4.9], delay=0.1))
+    monkeypatch.setattr(scraper, '_search_edx', _rated('edx', [5.0], delay=0.3))
+
+    # Mesmo com histórico baixo, a edX é esperada: o histórico não limita o escore da busca
+    low = [(0.4, 0, {})]
+    fresh_score_ceilings.record('edx', low)
+    fresh_score_ceilings.record('edx', low)
+
+    courses = scraper.search_courses('python', platform='all', limit=3)
+
+    assert not scraper.config.COURSE_RANK_EARLY_STOP
+    assert 'edx_0' in [c['id'] for c in courses]
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def test_coursera_details_use_one_bulk_request(monkeypatch):
+    scraper = CourseScraper()
+    calls = []
+
+    class Session:
+        def get(self, url, params=None, timeout=None):
+            calls.append((url, params))
+            return _FakeResponse({'elements': [
+                {'id': 'abc', 'slug': 'python', 'name': 'Python', 'primaryLanguages': ['en']},
+                {'id': 'def', 'slug': 'sql', 'name': 'SQL', 'primaryLanguages': ['pt-BR']}
+            ]})
+
+    class Limiter:
+        def __init__(self, host):
+            self.host = host
+
+        def permit(self, timeout=None):
+            hosts.append(self.host)
+
+    hosts = []
+    monkeypatch.setattr(scraper, 'session', Session())
+    monkeypatch.setattr(course_scraper, 'get_host_limiter', Limiter)
+    details = scraper.get_courses_details(['coursera_abc', 'coursera_def', 'coursera_missing', 'coursera_abc'])
+
+    assert len(calls) == 1
+    # A API de catálogo tem orçamento próprio, separado do site www.coursera.org
+    assert hosts == ['api.coursera.org']
+    assert calls[0][0].startswith('https://api.coursera.org/')
+    assert calls[0][1]['ids'] == 'abc,def,missing'
+    assert list(details) == ['coursera_abc', 'coursera_def', 'coursera_missing']
+    assert details['coursera_abc']['url'] == 'https://www.coursera.org/learn/python'
+    assert details['coursera_def']['language'] == 'pt-BR'
+    assert details['coursera_missing'] is None
+
+
+def test_course_details_groups_run_concurrently(monkeypatch):
+    scraper = CourseScraper()
+
+    def udemy(course_id):
+        time.sleep(0.3)
+        return {'id': course_id, 'source': 'udemy'}
+
+    def coursera(course_ids):
+        time.sleep(0.3)
+        return {course_id: {'id': course_id, 'source': 'coursera'} for course_id in course_ids}
+
+    monkeypatch.setattr(scraper, '_get_udemy_course_details', udemy)
+    monkeypatch.setattr(scraper, '_get_coursera_courses_details', coursera)
+
+    started = time.monotonic()
+    details = scraper.get_courses_details(['udemy_1', 'coursera_a', 'udemy_2', 'edx_x'])
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.8
+    assert list(details) == ['udemy_1', 'coursera_a', 'udemy_2', 'edx_x']
+    assert details['coursera_a']['source'] == 'coursera'
+    assert details['edx_x'] is None
+
+
+def test_udemy_requests_project_mapped_fields(monkeypatch):
+    calls = []
+
+    class Session:
+        def get(self, url, params=None, headers=None, timeout=None):
+            calls.append(params)
+            return _FakeResponse({'courses': [{
+                'id': 1, 'title': 'Python', 'url': '/course/python/', 'num_subscribers': 10, 'lang_s': 'en',
+                'visible_instructors': [{'display_name': 'Ana'}]
+            }]})
+
+    monkeypatch.setattr(course_scraper, 'get_session', lambda name='default': Session())
+    scraper = CourseScraper()
+
+    [course] = scraper._fetch_udemy_page('python', 'en', 1)
+    assert calls[0]['q'] == 'python'
+    assert 'lang_s' in calls[0]['fields[course]'].split(',')
+    assert calls[0]['fields[user]'] == 'display_name'
+    assert (course['students_count'], course['instructor'], course['language']) == (10, 'Ana', 'en')
+
+    scraper.get_course_details('udemy_1')
+    assert 'curriculum' in calls[1]['fields[course]'].split(',')
@@ -0,0 +1,80 @@
+"""
+Testes da busca de cursos em streaming (NDJSON/SSE), sem acesso à rede
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import get_config
+from courses.models import CourseSearchRequest
+from courses.services import CourseService
+from scrapers.course_scraper import CourseScraper
+
+API_KEY = 'api-key-1-change-in-production'
+
+
+def _fake_search(platform, delay):
+    def search(self, *args, **kwargs):
+        time.sleep(delay)
+        return [
+            {'id': f'{platform}_{i}', 'title': f'{platform} {i}', 'language': 'en', 'source': platform}
+            for i in range(2)
+        ]
+    return search
+
+
+def _patch_platforms(monkeypatch, delays, timeouts=None):
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', False)
+    for platform, delay in delays.items():
+        monkeypatch.setattr(CourseScraper, f'_search_{platform}', _fake_search(platform, delay))
+    if timeouts:
+        monkeypatch.setattr(get_config(), 'COURSE_PLATFORM_TIMEOUTS', timeouts)
+
+
+def test_platforms_are_streamed_as_they_finish(monkeypatch):
+    _patch_platforms(
+        monkeypatch,
+        {'udemy': 0.3, 'coursera': 0.0, 'edx': 2.0},
+        timeouts={'udemy': 1.0, 'coursera': 1.0, 'edx': 0.5}
+    )
+    service = CourseService()
+
+    started = time.monotonic()
+    records = service.stream_search_courses(CourseSearchRequest(query='python', limit=10))
+    first = next(records)
+    first_latency = time.monotonic() - started
+    rest = list(records)
+
+    assert first['platform'] == 'coursera'
+    assert first_latency < 0.25
+    assert [record['type'] for record in rest] == ['courses', 'summary']
+    assert rest[0]['platform'] == 'udemy'
+
+    summary = rest[-1]
+    assert summary['total'] == 4
+    assert summary['platforms'] == {'coursera': 'ok', 'udemy': 'ok', 'edx': 'timeout'}
+
+
+def test_stream_endpoint_formats(monkeypatch):
+    from main import create_app
+
+    _patch_platforms(monkeypatch, {'udemy': 0.0, 'coursera': 0.0, 'edx': 0.0})
+    client = create_app().test_client()
+    body = {'query': 'python', 'limit': 3}
+
+    response = client.post('/api/v1/courses/', json=body,
+                           headers={'X-API-Key': API_KEY, 'Accept': 'application/x-ndjson'})
+    assert response.mimetype == 'application/x-ndjson'
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert records[-1]['type'] == 'summary'
+    assert sum(record.get('count', 0) for record in records) == records[-1]['total'] == 3
+
+    response = client.post('/api/v1/courses/', json=body,
+                           headers={'X-API-Key': API_KEY, 'Accept': 'text/event-stream'})
+    assert response.mimetype == 'text/event-stream'
+    events = response.get_data(as_text=True).strip().split('\n\n')
+    assert events[-1].startswith('event: summary\ndata: ')
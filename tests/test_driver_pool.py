@@ -0,0 +1,102 @@
+"""
+Testes do pool de WebDrivers com drivers falsos (sem Chrome)
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.driver_pool import DriverPoolTimeout, WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+        self.healthy = True
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError('browser morto')
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _make_pool(max_size=1, max_uses=10, checkout_timeout=0.1):
+    created = []
+
+    def factory():
+        driver = FakeDriver()
+        created.append(driver)
+        return driver
+
+    return WebDriverPool(factory, max_size, max_uses, checkout_timeout), created
+
+
+def test_driver_is_reused_between_checkouts():
+    pool, created = _make_pool()
+
+    with pool.driver() as first:
+        pass
+    with pool.driver() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    assert pool.stats()['checkouts'] == 2
+
+
+def test_driver_recycled_after_max_uses():
+    pool, created = _make_pool(max_uses=2)
+
+    for _ in range(3):
+        with pool.driver():
+            pass
+
+    assert len(created) == 2
+    assert created[0].quit_called
+
+
+def test_driver_recycled_on_error():
+    pool, created = _make_pool()
+
+    with pytest.raises(ValueError):
+        with pool.driver():
+            raise ValueError('falha no scraping')
+
+    assert created[0].quit_called
+    assert pool.stats()['size'] == 0
+
+
+def test_unhealthy_idle_driver_is_replaced():
+    pool, created = _make_pool()
+    with pool.driver():
+        pass
+    created[0].healthy = False
+
+    with pool.driver() as item:
+        assert item.driver is created[1]
+
+    assert pool.stats()['failed_health_checks'] == 1
+
+
+def test_checkout_waits_and_times_out_when_exhausted():
+    pool, _ = _make_pool(max_size=1, checkout_timeout=0.05)
+    item = pool.checkout()
+
+    with pytest.raises(DriverPoolTimeout):
+        pool.checkout()
+
+    releaser = threading.Timer(0.05, pool.checkin, args=(item,))
+    releaser.start()
+    assert pool.checkout(timeout=1) is item
+
+    stats = pool.stats()
+    assert stats['timeouts'] == 1
+    assert stats['waits'] == 1
+    assert stats['max_wait_time'] > 0
@@ -0,0 +1,72 @@
+"""
+Testes do ciclo de vida dos serviços da aplicação
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.lifecycle import ServiceRegistry
+
+API_KEY = 'api-key-1-change-in-production'
+
+
+class FakeService:
+    def __init__(self, events):
+        self.events = events
+        events.append('created')
+
+    def close(self):
+        self.events.append('closed')
+
+
+def test_service_is_created_once_and_closed_on_shutdown():
+    events = []
+    registry = ServiceRegistry()
+    registry.register('fake', lambda: FakeService(events))
+    registry.on_shutdown(lambda: events.append('first hook'))
+    registry.on_shutdown(lambda: events.append('second hook'))
+
+    assert registry.get('fake') is registry.get('fake')
+    registry.shutdown()
+
+    assert events == ['created', 'closed', 'second hook', 'first hook']
+
+
+def test_services_are_recreated_after_fork(monkeypatch):
+    events = []
+    registry = ServiceRegistry()
+    registry.register('fake', lambda: FakeService(events))
+    parent = registry.get('fake')
+
+    monkeypatch.setattr(os, 'getpid', lambda: -1)
+
+    assert registry.get('fake') is not parent
+    # O serviço herdado pertence ao processo pai e não é encerrado pelo filho
+    assert events == ['created', 'created']
+
+
+def test_requests_reuse_the_app_services(monkeypatch):
+    from main import create_app, shutdown_app
+    from courses.services import CourseService
+    from scrapers.course_scraper import CourseScraper
+
+    monkeypatch.setattr(CourseScraper, 'get_course_details', lambda self, course_id: None)
+    created = []
+    original_init = CourseService.__init__
+
+    def init(self):
+        created.append(self)
+        original_init(self)
+
+    monkeypatch.setattr(CourseService, '__init__', init)
+    app = create_app()
+    client = app.test_client()
+
+    for _ in range(2):
+        response = client.get('/api/v1/courses/udemy_1', headers={'X-API-Key': API_KEY})
+        assert response.status_code == 404
+
+    assert len(created) == 1
+    shutdown_app(app)
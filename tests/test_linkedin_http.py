@@ -0,0 +1,206 @@
+"""
+Testes da busca de vagas do LinkedIn via HTTP (sem navegador)
+"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers import linkedin_http
+from scrapers.linkedin_http import parse_job_cards, parse_job_detail, search_jobs_http
+
+
+class _NoLimit:
+    def permit(self, timeout=None):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    # O token bucket real do LinkedIn (1 req/s) só deixaria os testes lentos
+    monkeypatch.setattr(linkedin_http, 'get_host_limiter', lambda host: _NoLimit())
+
+CARD = """
+<li>
+  <div class="base-card relative w-full base-search-card job-search-card"
+       data-entity-urn="urn:li:jobPosting:{job_id}">
+    <a class="base-card__full-link absolute" href="https://br.linkedin.com/jobs/view/dev-{job_id}?refId=abc&amp;trackingId=xyz">
+      <span class="sr-only">Python Developer</span>
+    </a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+        Python Developer {job_id}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+        <a class="hidden-nested-link" href="#">Impulse AI</a>
+      </h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">São Paulo, SP</span>
+        <time class="job-search-card__listdate--new" datetime="2024-01-10">1 dia atrás</time>
+      </div>
+    </div>
+  </div>
+</li>
+"""
+
+
+def _page(*job_ids):
+    return ''.join(CARD.format(job_id=job_id) for job_id in job_ids)
+
+
+def test_parse_job_cards():
+    jobs = parse_job_cards(_page(3771234567))
+
+    assert jobs == [{
+        'id': 'linkedin_3771234567',
+        'title': 'Python Developer 3771234567',
+        'company': 'Impulse AI',
+        'location': 'São Paulo, SP',
+        'description': '',
+        'posted_date': '2024-01-10',
+        'applicants': '',
+        'url': 'https://br.linkedin.com/jobs/view/dev-3771234567',
+        'source': 'linkedin'
+    }]
+
+
+def test_parse_empty_page():
+    assert parse_job_cards('') == []
+    assert parse_job_cards('<html><body></body></html>') == []
+
+
+class FakeResponse:
+    def __init__(self, text, status=200):
+        self.text = text
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise requests.HTTPError(f"{self.status} Error")
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.starts = []
+
+    def get(self, url, params=None, timeout=None):
+        self.starts.append(params['start'])
+        page = self.pages.get(params['start'], '')
+        return page if isinstance(page, FakeResponse) else FakeResponse(page)
+
+
+def test_search_paginates_until_limit():
+    session = FakeSession({0: _page(1, 2), 2: _page(3, 4)})
+
+    jobs = search_jobs_http(session, 'python', 'Brasil', limit=3, timeout=1)
+
+    assert [job['id'] for job in jobs] == ['linkedin_1', 'linkedin_2', 'linkedin_3']
+    assert session.starts == [0, 2]
+
+
+def test_search_stops_when_listing_ends():
+    session = FakeSession({0: _page(1)})
+
+    jobs = search_jobs_http(session, 'python', None, limit=10, timeout=1)
+
+    assert len(jobs) == 1
+    assert session.starts == [0, 1]
+    assert jobs.complete
+
+
+def test_search_returns_partial_results_on_later_error():
+    session = FakeSession({0: _page(1, 2), 2: FakeResponse('', status=429)})
+
+    jobs = search_jobs_http(session, 'python', None, limit=10, timeout=1)
+
+    assert [job['id'] for job in jobs] == ['linkedin_1', 'linkedin_2']
+    assert session.starts == [0, 2]
+    assert not jobs.complete
+
+
+def test_search_error_on_first_page_is_raised():
+    session = FakeSession({0: FakeResponse('', status=500)})
+
+    with pytest.raises(requests.HTTPError):
+        search_jobs_http(session, 'python', None, limit=10, timeout=1)
+
+
+def test_search_stops_when_page_repeats_known_jobs():
+    # Além do fim da listagem o LinkedIn devolve de novo as últimas vagas
+    session = FakeSession({0: _page(1, 2), 2: _page(1, 2), 4: _page(3)})
+
+    jobs = search_jobs_http(session, 'python', None, limit=10, timeout=1)
+
+    assert [job['id'] for job in jobs] == ['linkedin_1', 'linkedin_2']
+    assert session.starts == [0, 2]
+
+
+DETAIL_PAGE = """
+<section class="top-card-layout">
+  <h2 class="top-card-layout__title">Senior Python Engineer</h2>
+  <a class="topcard__link" href="https://www.linkedin.com/jobs/view/senior-python-engineer-42?trk=guest">x</a>
+  <a class="topcard__org-name-link topcard__flavor--black-link" href="#">Impulse AI</a>
+  <span class="topcard__flavor topcard__flavor--bullet">São Paulo, SP</span>
+  <figcaption class="num-applicants__caption">Over 200 applicants</figcaption>
+  <div class="salary compensation__salary">$120,000.00/yr - $150,000.00/yr</div>
+</section>
+<div class="show-more-less-html__markup">
+  <p>We build APIs with <strong>Python</strong> and Flask.</p>
+  <ul><li>Docker and AWS experience</li></ul>
+</div>
+<ul class="description__job-criteria-list">
+  <li class="description__job-criteria-item">
+    <h3 class="description__job-criteria-subheader">Seniority level</h3>
+    <span class="description__job-criteria-text">Mid-Senior level</span>
+  </li>
+  <li class="description__job-criteria-item">
+    <h3 class="description__job-criteria-subheader">Employment type</h3>
+    <span class="description__job-criteria-text">Full-time</span>
+  </li>
+</ul>
+"""
+
+
+def test_parse_job_detail():
+    detail = parse_job_detail(DETAIL_PAGE, '42')
+
+    assert detail['id'] == 'linkedin_42'
+    assert detail['title'] == 'Senior Python Engineer'
+    assert detail['company'] == 'Impulse AI'
+    assert detail['location'] == 'São Paulo, SP'
+    assert detail['url'] == 'https://www.linkedin.com/jobs/view/senior-python-engineer-42'
+    assert detail['full_description'] == 'We build APIs with Python and Flask.\nDocker and AWS experience'
+    assert detail['skills'] == ['Python', 'Flask', 'Docker', 'AWS']
+    assert detail['salary_range']['min'] == 120000.0
+    assert detail['salary_range']['max'] == 150000.0
+    assert detail['salary_range']['period'] == 'year'
+    assert detail['application_count'] == 200
+    assert detail['experience_level'] == 'mid-senior'
+    assert detail['job_type'] == 'full-time'
+
+
+def test_parse_job_detail_without_posting():
+    assert parse_job_detail('<html><body>Página não encontrada</body></html>', '42') is None
+
+
+def test_browser_is_used_only_when_http_search_fails(monkeypatch):
+    from scrapers.job_scraper import JobScraper
+
+    scraper = JobScraper()
+    browser = []
+    monkeypatch.setattr(scraper.config, 'LINKEDIN_HTTP_FAST_PATH', True)
+    monkeypatch.setattr(scraper, '_search_jobs_browser', lambda *args: browser.append(args) or [])
+
+    # Busca sem resultados: resposta válida, o Chrome não é iniciado
+    scraper.session = FakeSession({})
+    assert scraper.search_jobs('cobol quântico') == []
+    assert browser == []
+
+    scraper.session = FakeSession({0: FakeResponse('', status=503)})
+    scraper.search_jobs('python')
+    assert len(browser) == 1
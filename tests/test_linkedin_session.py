@@ -0,0 +1,99 @@
+"""
+Testes da persistência criptografada da sessão do LinkedIn
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.linkedin_session import LinkedInSessionStore
+
+COOKIES = [
+    {'name': 'li_at', 'value': 'token-secreto', 'domain': '.linkedin.com', 'path': '/', 'expiry': int(time.time()) + 3600},
+    {'name': 'JSESSIONID', 'value': 'ajax:123', 'domain': '.www.linkedin.com', 'path': '/', 'size': 20}
+]
+
+
+def test_cookies_roundtrip_encrypted(tmp_path):
+    path = str(tmp_path / 'cookies.enc')
+    store = LinkedInSessionStore(path, 'segredo', ttl=3600)
+
+    store.save(COOKIES)
+
+    with open(path, 'rb') as f:
+        assert b'token-secreto' not in f.read()
+    loaded = store.load()
+    assert [c['name'] for c in loaded] == ['li_at', 'JSESSIONID']
+    assert 'size' not in loaded[1]
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_wrong_secret_is_rejected(tmp_path):
+    path = str(tmp_path / 'cookies.enc')
+    LinkedInSessionStore(path, 'segredo', ttl=3600).save(COOKIES)
+
+    assert LinkedInSessionStore(path, 'outro', ttl=3600).load() is None
+    assert not os.path.exists(path)
+
+
+def test_expired_auth_cookie_is_discarded(tmp_path):
+    store = LinkedInSessionStore(str(tmp_path / 'cookies.enc'), 'segredo', ttl=3600)
+    expired = [dict(COOKIES[0], expiry=int(time.time()) - 1)]
+
+    store.save(expired)
+
+    assert store.load() is None
+
+
+def test_session_without_auth_cookie_is_not_saved(tmp_path):
+    path = str(tmp_path / 'cookies.enc')
+    LinkedInSessionStore(path, 'segredo', ttl=3600).save(COOKIES[1:])
+
+    assert not os.path.exists(path)
+
+
+def test_placeholder_secret_disables_persistence(tmp_path):
+    path = str(tmp_path / 'cookies.enc')
+    LinkedInSessionStore(path, 'segredo', ttl=3600).save(COOKIES)
+
+    for secret in ('', 'your-super-secret-key-change-this-in-production', 'troque-esta-chave'):
+        store = LinkedInSessionStore(path, secret, ttl=3600)
+        store.save(COOKIES)
+        assert store.load() is None
+
+    # O arquivo gravado com um segredo real não é tocado
+    assert LinkedInSessionStore(path, 'segredo', ttl=3600).load() is not None
+
+    other = str(tmp_path / 'outro.enc')
+    LinkedInSessionStore(other, '', ttl=3600).save(COOKIES)
+    assert not os.path.exists(other)
+
+
+def test_concurrent_logins_are_serialized(monkeypatch):
+    import threading
+    from scrapers.job_scraper import JobScraper
+
+    saved = threading.Event()
+    logins = []
+
+    def login_with_credentials(self, pooled):
+        logins.append(pooled)
+        time.sleep(0.05)
+        saved.set()
+        return True
+
+    monkeypatch.setattr(JobScraper, '_restore_session', lambda self, pooled: saved.is_set())
+    monkeypatch.setattr(JobScraper, '_login_with_credentials', login_with_credentials)
+    scraper = JobScraper()
+    scraper.email, scraper.password = 'user@example.com', 'secret'
+
+    threads = [threading.Thread(target=scraper._login, args=(object(),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # As demais requisições reutilizam os cookies salvos pelo primeiro login
+    assert len(logins) == 1
@@ -0,0 +1,254 @@
+"""
+Testes da paginação por cursor das buscas de cursos e vagas, sem acesso à rede
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from common.cursors import InvalidCursor, decode_cursor, encode_cursor, pack_positions, unpack_positions
+from config.settings import get_config
+from courses.models import CourseSearchRequest
+from courses.services import CourseService
+from jobs.models import JobSearchRequest
+from jobs.services import JobService
+
+API_KEY = 'api-key-1-change-in-production'
+
+
+@pytest.fixture(autouse=True)
+def cursor_secret(monkeypatch):
+    monkeypatch.setattr(get_config(), 'CURSOR_SECRET', 'segredo-dos-testes')
+
+
+def test_cursor_roundtrip_and_tampering():
+    state = {'platforms': {'udemy': {'next': 12, 'rest': [3]}}, 'payload': None}
+    cursor = encode_cursor('courses:abc', state)
+    assert decode_cursor(cursor, 'courses:abc') == state
+
+    body, signature = cursor.split('.')
+    forged = encode_cursor('courses:abc', {'platforms': {'udemy': {'next': 0, 'rest': []}}, 'payload': None}).split('.')[0]
+    for invalid in (f"{forged}.{signature}", body, 'não é cursor', ''):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(invalid, 'courses:abc')
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, 'courses:outra-busca')
+
+
+def test_packed_positions_roundtrip():
+    assert pack_positions([]) == ''
+    assert unpack_positions(pack_positions([40, 3, 7, 12])) == [3, 7, 12, 40]
+    with pytest.raises(InvalidCursor):
+        unpack_positions('x:1')
+
+
+def test_placeholder_secret_disables_pagination(monkeypatch):
+    cursor = encode_cursor('courses:abc', {'platforms': {'udemy': {'next': 12, 'rest': []}}, 'payload': None})
+
+    for secret in ('', 'your-super-secret-key-change-this-in-production'):
+        monkeypatch.setattr(get_config(), 'CURSOR_SECRET', secret)
+        assert encode_cursor('courses:abc', {'platforms': {}, 'payload': None}) is None
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor, 'courses:abc')
+
+
+def _listing(platform, size):
+    """Listagem falsa da plataforma; o rating não segue a ordem, como no ranqueamento real"""
+    return [
+        {'id': f'{platform}_{i}', 'title': f'{platform} {i}', 'rating': 3 + (i * 7 % 10) / 5,
+         'num_reviews': 1000, 'language': 'en', 'source': platform, '_position': i}
+        for i in range(size)
+    ]
+
+
+def _paginate(service, limit=5):
+    """Percorre todas as páginas da busca; retorna os IDs de cada página e os cursores"""
+    pages, cursors = [], []
+    cursor = None
+    for _ in range(20):
+        result = service.search_courses(CourseSearchRequest(query='python', limit=limit, language='en', cursor=cursor))
+        pages.append([course['id'] for course in result['courses']])
+        cursor = result['next_cursor']
+        if cursor is None:
+            break
+        cursors.append(cursor)
+    assert cursor is None
+    return pages, cursors
+
+
+def test_course_pages_cover_listing_once(monkeypatch):
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', False)
+    monkeypatch.setattr(get_config(), 'COURSE_RANK_EARLY_STOP', False)
+    listings = {'udemy': _listing('udemy', 23), 'coursera': _listing('coursera', 7), 'edx': []}
+    fetched = {name: [] for name in listings}
+
+    def fake(name):
+        def search(query, limit, *args, start=0):
+            fetched[name].extend(range(start, min(start + limit, len(listings[name]))))
+            return [dict(course) for course in listings[name][start:start + limit]]
+        return search
+
+    service = CourseService()
+    for name in listings:
+        monkeypatch.setattr(service.scraper, f'_search_{name}', fake(name))
+
+    pages, cursors = _paginate(service)
+    delivered = [course_id for page in pages for course_id in page]
+
+    assert len(delivered) == len(set(delivered)) == 30
+    # Páginas cheias até as listagens acabarem, sem buscar nenhuma posição duas vezes
+    assert all(len(page) == 5 for page in pages[:6])
+    for name in listings:
+        assert sorted(fetched[name]) == sorted(set(fetched[name])) == list(range(len(listings[name])))
+    # Cursor de tamanho estável: posições pendentes compactadas, cursos fora do token
+    assert max(len(cursor) for cursor in cursors) < 300
+
+
+def test_udemy_pages_are_fetched_once(monkeypatch):
+    from scrapers.course_scraper import UDEMY_PAGE_SIZE
+
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', False)
+    listing = _listing('udemy', 40)
+    pages = []
+
+    def fetch_page(query, language, page):
+        pages.append(page)
+        return [dict(course) for course in listing[(page - 1) * UDEMY_PAGE_SIZE:page * UDEMY_PAGE_SIZE]]
+
+    service = CourseService()
+    monkeypatch.setattr(service.scraper, '_fetch_udemy_page', fetch_page)
+    for name in ('coursera', 'edx'):
+        monkeypatch.setattr(service.scraper, f'_search_{name}', lambda *args, **kwargs: [])
+
+    delivered = [course_id for page in _paginate(service, limit=10)[0] for course_id in page]
+
+    assert sorted(pages) == [1, 2, 3, 4]
+    assert len(delivered) == len(set(delivered)) == 40
+
+
+def test_expired_cursor_payload_refetches_pending_courses(monkeypatch):
+    from courses import services
+
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', False)
+    monkeypatch.setattr(get_config(), 'COURSE_RANK_EARLY_STOP', False)
+    monkeypatch.setattr(services, 'load_cursor_payload', lambda payload_id: None)
+    listings = {'udemy': _listing('udemy', 17), 'coursera': _listing('coursera', 9), 'edx': []}
+
+    def fake(name):
+        def search(query, limit, *args, start=0):
+            return [dict(course) for course in listings[name][start:start + limit]]
+        return search
+
+    service = CourseService()
+    for name in listings:
+        monkeypatch.setattr(service.scraper, f'_search_{name}', fake(name))
+
+    delivered = [course_id for page in _paginate(service)[0] for course_id in page]
+
+    # Sem os cursos pendentes, as páginas que os continham são refeitas, sem repetir os entregues
+    assert len(delivered) == len(set(delivered)) == 26
+
+
+def test_failed_platform_keeps_its_cursor_position(monkeypatch):
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', False)
+    monkeypatch.setattr(get_config(), 'COURSE_RANK_EARLY_STOP', False)
+    listings = {'udemy': _listing('udemy', 6), 'coursera': _listing('coursera', 12), 'edx': []}
+    calls = {name: 0 for name in listings}
+
+    def fake(name):
+        def search(query, limit, *args, start=0):
+            calls[name] += 1
+            if name == 'coursera' and calls[name] == 2:
+                raise ConnectionError('falha na página 2')
+            return [dict(course) for course in listings[name][start:start + limit]]
+        return search
+
+    service = CourseService()
+    for name in listings:
+        monkeypatch.setattr(service.scraper, f'_search_{name}', fake(name))
+
+    delivered = []
+    cursor = None
+    for _ in range(20):
+        result = service.search_courses(CourseSearchRequest(query='python', limit=5, language='en', cursor=cursor))
+        delivered.extend(course['id'] for course in result['courses'])
+        cursor = result['next_cursor']
+        if cursor is None:
+            break
+
+    # A falha na segunda página não tira a Coursera da paginação: nada se perde
+    assert cursor is None
+    assert calls['coursera'] > 2
+    assert len(delivered) == len(set(delivered)) == 18
+
+
+def test_scraper_errors_are_not_empty_listings(monkeypatch):
+    from scrapers import course_scraper
+    from scrapers.course_scraper import CourseScraper
+
+    class _Failing:
+        def get(self, *args, **kwargs):
+            raise ConnectionError('rede indisponível')
+
+    class _NoLimit:
+        def permit(self, timeout=None):
+            pass
+
+    monkeypatch.setattr(course_scraper, 'get_session', lambda name='default': _Failing())
+    monkeypatch.setattr(course_scraper, 'get_host_limiter', lambda host: _NoLimit())
+    scraper = CourseScraper()
+    scraper.session = _Failing()
+
+    for search in (lambda: scraper._search_udemy('python', 5, 'en'),
+                   lambda: scraper._search_coursera('python', 5),
+                   lambda: scraper._search_edx('python', 5)):
+        with pytest.raises(ConnectionError):
+            search()
+
+
+def test_job_pages_continue_after_last_position(monkeypatch):
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', False)
+    calls = []
+
+    def search_jobs(query, location, limit, start=0):
+        calls.append(start)
+        return [
+            {'id': f'linkedin_{i}', 'title': f'Vaga {i}', 'source': 'linkedin', '_position': i}
+            for i in range(start, min(start + limit, 15))
+        ]
+
+    service = JobService()
+    monkeypatch.setattr(service.scraper, 'search_jobs', search_jobs)
+
+    first = service.search_jobs(JobSearchRequest(query='python', limit=10))
+    second = service.search_jobs(JobSearchRequest(query='python', limit=10, cursor=first['next_cursor']))
+
+    assert calls == [0, 10]
+    assert [job['id'] for job in second['jobs']] == [f'linkedin_{i}' for i in range(10, 15)]
+    assert second['next_cursor'] is None
+
+    with pytest.raises(InvalidCursor):
+        service.search_jobs(JobSearchRequest(query='react', limit=10, cursor=first['next_cursor']))
+
+
+def test_old_course_cursor_format_is_invalid():
+    service = CourseService()
+    request = CourseSearchRequest(query='python', limit=5, language='en')
+    request.cursor = encode_cursor(service._cache_key(request), {'udemy': {'start': 12, 'seen': []}})
+
+    with pytest.raises(InvalidCursor):
+        service.search_courses(request)
+
+
+def test_invalid_cursor_is_a_validation_error():
+    from main import create_app
+
+    client = create_app().test_client()
+    response = client.post('/api/v1/courses/', headers={'X-API-Key': API_KEY},
+                           json={'query': 'python', 'cursor': 'adulterado'})
+
+    assert response.status_code == 400
+    assert response.get_json()['details'] == {'field': 'cursor', 'constraint': 'invalid'}
@@ -0,0 +1,108 @@
+"""
+Testes do registro de buscas e do pré-aquecimento do cache
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cache import SearchCache
+from common.prewarm import PrewarmCrawler, PrewarmSource
+from common.query_log import QueryLog
+
+
+def test_query_log_ranks_by_recent_frequency(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('common.query_log.time.time', lambda: now[0])
+    log = QueryLog('test', max_queries=3, half_life=60)
+
+    for _ in range(4):
+        log.record('old', {'query': 'old'})
+    now[0] += 180  # três meias-vidas: 4 -> 0.5
+    log.record('new', {'query': 'new'})
+    log.record('new', {'query': 'new'})
+    log.record('rare', {'query': 'rare'})
+
+    assert [key for key, _, _ in log.top(3)] == ['new', 'rare', 'old']
+
+    log.record('another', {'query': 'another'})
+    # Acima de 125% do limite o registro mantém só as mais frequentes
+    assert len(log) == 3
+    assert 'old' not in [key for key, _, _ in log.top(3)]
+
+
+def _source(cache, log, loads):
+    def load(params):
+        loads.append(params['query'])
+        return {'query': params['query']}
+    return PrewarmSource('test', log, cache, load, lambda params, value: 100)
+
+
+def test_crawler_refreshes_hot_queries_close_to_expiry():
+    cache = SearchCache('prewarm-test', max_entries=10, stale_ttl=60)
+    log = QueryLog('test', max_queries=10, half_life=3600)
+    loads = []
+    cache.set('expiring', {'query': 'expiring'}, ttl=5)
+    cache.set('fresh', {'query': 'fresh'}, ttl=1000)
+    for key in ('expiring', 'fresh', 'missing'):
+        log.record(key, {'query': key})
+    log.record('cold', {'query': 'cold'})
+    for key in ('expiring', 'fresh', 'missing'):
+        log.record(key, {'query': key})
+
+    crawler = PrewarmCrawler([_source(cache, log, loads)], top_n=3, interval=60, lead_time=30, budget=lambda: True)
+
+    assert crawler.run_once() == 2
+    assert sorted(loads) == ['expiring', 'missing']
+    assert cache.remaining_ttl('expiring') > 90
+    assert cache.remaining_ttl('cold') is None
+
+
+def test_crawler_stops_when_budget_is_exhausted():
+    cache = SearchCache('prewarm-budget-test', max_entries=10, stale_ttl=60)
+    log = QueryLog('test', max_queries=10, half_life=3600)
+    loads = []
+    for index in range(5):
+        log.record(f'query-{index}', {'query': f'query-{index}'})
+    tokens = [2]
+
+    def budget():
+        tokens[0] -= 1
+        return tokens[0] >= 0
+
+    crawler = PrewarmCrawler([_source(cache, log, loads)], top_n=5, interval=60, lead_time=30, budget=budget)
+
+    assert crawler.run_once() == 2
+    assert len(loads) == 2
+
+
+def test_course_prewarm_scrapes_platforms_instead_of_catalog(monkeypatch, tmp_path):
+    from config.settings import get_config
+    from courses import services
+    from courses.catalog import CourseCatalog
+    from courses.models import CourseSearchRequest
+    from courses.services import CourseService
+    from scrapers.course_scraper import CourseScraper
+
+    calls = []
+
+    def search(self, *args, **kwargs):
+        calls.append(args[0])
+        return [{'id': 'udemy_1', 'title': 'Python', 'language': 'English', 'source': 'udemy'}]
+
+    catalog = CourseCatalog(str(tmp_path / 'catalog.db'))
+    monkeypatch.setattr(CourseScraper, '_search_udemy', search)
+    monkeypatch.setattr(get_config(), 'CACHE_ENABLED', True)
+    monkeypatch.setattr(services, 'get_course_catalog', lambda: catalog)
+    try:
+        service = CourseService()
+        params = {'query': 'python', 'platform': 'udemy', 'limit': 5}
+        service._search_courses_uncached(CourseSearchRequest(**params))
+        # A cobertura do catálogo ainda está no prazo, mas o pré-aquecimento vai às plataformas
+        result = service.prewarm_source().loader(params)
+    finally:
+        catalog.close()
+
+    assert calls == ['python', 'python']
+    assert result['total'] == 1
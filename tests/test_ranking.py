@@ -0,0 +1,71 @@
+"""
+Testes do ranqueamento top-k dos cursos da Udemy
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.ranking import TopKRanker, course_score, udemy_rank_key
+
+
+def _course(course_id, rating, num_reviews):
+    return {'id': course_id, 'rating': rating, 'num_reviews': num_reviews}
+
+
+def _rank(pages, k):
+    ranker = TopKRanker(k, key=udemy_rank_key)
+    for page, courses in enumerate(pages, 1):
+        ranker.extend(courses, group=page)
+    return [course['id'] for course in ranker.results()]
+
+
+def test_orders_by_rating_then_reviews():
+    pages = [[_course('a', 4.5, 10), _course('b', 4.7, 5)], [_course('c', 4.5, 300)]]
+
+    assert _rank(pages, 3) == ['b', 'c', 'a']
+    assert _rank(pages, 2) == ['b', 'c']
+
+
+def test_missing_values_come_last_and_ties_keep_page_order():
+    pages = [
+        [_course('sem-rating', None, 900), _course('a', 4.0, None), _course('b', 4.0, 7)],
+        [_course('c', 4.0, 7), _course('sem-nada', None, None)]
+    ]
+
+    assert _rank(pages, 10) == ['b', 'c', 'a', 'sem-rating', 'sem-nada']
+
+
+def test_matches_pandas_sort():
+    pd = pytest.importorskip('pandas')
+    rng = random.Random(42)
+    pages = [
+        [
+            _course(
+                f"{page}-{index}",
+                rng.choice([None, 3.5, 4.0, 4.5, round(rng.uniform(3, 5), 1)]),
+                rng.choice([None, 10, 100, rng.randint(0, 500)])
+            )
+            for index in range(12)
+        ]
+        for page in range(3)
+    ]
+
+    rows = [course for page in pages for course in page]
+    df = pd.DataFrame(rows).sort_values(['rating', 'num_reviews'], ascending=[False, False])
+
+    for k in (1, 5, 12, 36):
+        assert _rank(pages, k) == list(df.head(k)['id'])
+
+
+def test_course_score_is_normalized_and_weights_reviews():
+    popular = course_score(_course('a', 4.7, 50000), 0, 10)
+    few_reviews = course_score(_course('b', 5.0, 3), 0, 10)
+    unrated = course_score(_course('c', None, None), 0, 10)
+
+    assert 0 <= unrated < few_reviews < popular <= 1
+    assert course_score(_course('d', 4.7, 50000), 9, 10) < popular
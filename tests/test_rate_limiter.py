@@ -0,0 +1,125 @@
+"""
+Testes do rate limiting de saída dos scrapers
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cache_backends import SQLiteBackend
+from config.settings import get_config
+from scrapers.rate_limiter import HostRateLimiter, Throttled, TokenBucket, get_host_limiter
+
+
+def test_burst_is_available_immediately():
+    bucket = TokenBucket(rate=1, capacity=3)
+
+    assert all(bucket.try_acquire() == 0 for _ in range(3))
+    assert bucket.try_acquire() > 0
+
+
+def test_acquire_waits_for_refill():
+    bucket = TokenBucket(rate=20, capacity=1)
+    assert bucket.acquire()
+
+    started = time.monotonic()
+    assert bucket.acquire(timeout=1)
+
+    assert 0.02 < time.monotonic() - started < 0.5
+
+
+def test_acquire_gives_up_after_timeout():
+    bucket = TokenBucket(rate=0.1, capacity=1)
+    assert bucket.acquire()
+
+    assert not bucket.acquire(timeout=0.05)
+
+
+def test_host_limiter_is_shared():
+    assert get_host_limiter('www.udemy.com') is get_host_limiter('www.udemy.com')
+    assert get_host_limiter('www.udemy.com') is not get_host_limiter('www.edx.org')
+
+
+def test_permit_without_wait_raises_throttled():
+    limiter = HostRateLimiter('example.com', rate=0.5, capacity=1, max_waiters=4)
+    limiter.permit()
+
+    with pytest.raises(Throttled) as excinfo:
+        limiter.permit(timeout=0)
+    assert excinfo.value.host == 'example.com'
+    assert 1 < excinfo.value.retry_after <= 2
+
+
+def test_permit_rejects_when_wait_queue_is_full():
+    limiter = HostRateLimiter('example.com', rate=2, capacity=1, max_waiters=1)
+    limiter.permit()
+
+    waiter = threading.Thread(target=limiter.permit, kwargs={'timeout': 2})
+    waiter.start()
+    while limiter.waiters() == 0:
+        time.sleep(0.005)
+
+    started = time.monotonic()
+    with pytest.raises(Throttled):
+        limiter.permit(timeout=2)
+    assert time.monotonic() - started < 0.1
+    waiter.join()
+
+
+def test_limiters_share_tokens_through_backend(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / 'cache.db'), 'test')
+    first = HostRateLimiter('example.com', rate=0.1, capacity=2, max_waiters=1, backend=lambda: backend)
+    second = HostRateLimiter('example.com', rate=0.1, capacity=2, max_waiters=1, backend=lambda: backend)
+
+    assert first.try_acquire() == 0
+    assert second.try_acquire() == 0
+    # Os dois "workers" consumiram a mesma capacidade
+    assert first.try_acquire() > 0
+    assert second.try_acquire() > 0
+
+
+def test_limiters_share_tokens_without_cache_backend(monkeypatch, tmp_path):
+    from common import cache_backends
+
+    monkeypatch.setattr(get_config(), 'CACHE_BACKEND_URL', '')
+    monkeypatch.setattr(get_config(), 'COORDINATION_DB_PATH', str(tmp_path / 'coordination.db'))
+    cache_backends.close_shared_backend()
+    cache_backends.close_coordination_backend()
+    try:
+        backend = cache_backends.get_coordination_backend()
+        assert isinstance(backend, SQLiteBackend)
+
+        # Cada worker abre o próprio SQLite no mesmo arquivo: a capacidade é do nó
+        other_worker = SQLiteBackend(str(tmp_path / 'coordination.db'), get_config().CACHE_KEY_PREFIX)
+        first = HostRateLimiter('example.com', rate=0.1, capacity=2, max_waiters=1,
+                                backend=cache_backends.get_coordination_backend)
+        second = HostRateLimiter('example.com', rate=0.1, capacity=2, max_waiters=1, backend=lambda: other_worker)
+
+        assert first.try_acquire() == 0
+        assert second.try_acquire() == 0
+        assert first.try_acquire() > 0
+        other_worker.close()
+    finally:
+        cache_backends.close_coordination_backend()
+
+
+def test_throttled_request_returns_429(monkeypatch):
+    from main import create_app
+    from scrapers.course_scraper import CourseScraper
+
+    def details(self, course_id):
+        raise Throttled('www.udemy.com', 2.3)
+
+    monkeypatch.setattr(CourseScraper, 'get_course_details', details)
+    client = create_app().test_client()
+
+    response = client.get('/api/v1/courses/udemy_1', headers={'X-API-Key': 'api-key-1-change-in-production'})
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '3'
+    assert response.get_json()['details'] == {'host': 'www.udemy.com', 'retry_after': 3}
@@ -0,0 +1,121 @@
+"""
+Testes da coalescência de buscas idênticas (single-flight)
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cache import SearchCache
+from common.cache_backends import SQLiteBackend
+from common.singleflight import SingleFlight
+
+
+def _run_concurrently(count, target):
+    results = [None] * count
+    errors = [None] * count
+
+    def worker(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight('test')
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(2)
+        return {'total': 3}
+
+    threading.Timer(0.2, release.set).start()
+    results, errors = _run_concurrently(8, lambda: flight.do('k', fetch))
+
+    assert calls == [1]
+    assert results == [{'total': 3}] * 8
+    assert errors == [None] * 8
+    assert flight.in_flight() == 0
+
+
+def test_error_is_propagated_to_waiters():
+    flight = SingleFlight('test')
+    release = threading.Event()
+
+    def fetch():
+        release.wait(2)
+        raise RuntimeError('origem indisponível')
+
+    threading.Timer(0.2, release.set).start()
+    results, errors = _run_concurrently(4, lambda: flight.do('k', fetch))
+
+    assert all(isinstance(error, RuntimeError) for error in errors)
+
+    # A chave é liberada: a próxima chamada executa de novo
+    assert flight.do('k', lambda: 'ok') == 'ok'
+
+
+def test_cache_miss_is_loaded_once_for_concurrent_requests():
+    cache = SearchCache('test', max_entries=10, stale_ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.2)
+        return 'valor'
+
+    results, _ = _run_concurrently(6, lambda: cache.get_or_load('k', loader, ttl=lambda value: 30))
+
+    assert calls == [1]
+    assert results == ['valor'] * 6
+
+
+def test_waits_for_search_running_in_another_worker(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / 'cache.db'), prefix='t:')
+    worker_a = SearchCache('courses', max_entries=10, stale_ttl=60, backend=lambda: backend)
+    worker_b = SearchCache('courses', max_entries=10, stale_ttl=60, backend=lambda: backend)
+    worker_b.flight.poll_interval = 0.01
+    started = threading.Event()
+
+    def slow_loader():
+        started.set()
+        time.sleep(0.3)
+        return 'worker-a'
+
+    thread = threading.Thread(
+        target=lambda: worker_a.get_or_load('k', slow_loader, ttl=lambda value: 30)
+    )
+    thread.start()
+    assert started.wait(2)
+
+    def fail():
+        raise AssertionError('não deveria consultar a origem')
+
+    assert worker_b.get_or_load('k', fail, ttl=lambda value: 30) == 'worker-a'
+    thread.join(2)
+
+
+def test_takes_over_when_other_worker_fails(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / 'cache.db'), prefix='t:')
+    flight = SingleFlight('test', backend=lambda: backend)
+    flight.poll_interval = 0.01
+
+    # Lock órfão de outro worker que falhou e liberou sem publicar resultado
+    backend.add('flight:k', 'outro-worker', 30)
+    threading.Timer(0.1, lambda: backend.delete('flight:k')).start()
+
+    assert flight.do('k', lambda: 'local', lookup=lambda: None) == 'local'
+    assert backend.get('flight:k') is None
@@ -0,0 +1,22 @@
+"""
+Testes de inicialização: dependências pesadas de scraping só são carregadas no primeiro uso
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_create_app_does_not_load_scraping_dependencies():
+    code = (
+        "import json, sys, warnings; warnings.simplefilter('ignore'); "
+        "import main; main.create_app(); "
+        "print(json.dumps([m for m in ('selenium', 'linkedin_scraper', 'cloudscraper', 'pandas', 'bs4') "
+        "if m in sys.modules]))"
+    )
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert json.loads(output.stdout.strip().splitlines()[-1]) == []
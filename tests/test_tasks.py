@@ -0,0 +1,124 @@
+"""
+Testes das buscas de vagas assíncronas (tarefas em segundo plano)
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cache_backends import SQLiteBackend
+from common.tasks import TaskManager, TaskQueueFull
+
+API_KEY = 'api-key-1-change-in-production'
+
+
+def _manager(**kwargs):
+    options = {'max_workers': 2, 'max_pending': 5, 'result_ttl': 60, 'poll_interval': 0.01}
+    options.update(kwargs)
+    return TaskManager('test', **options)
+
+
+def test_task_result_is_available_after_completion():
+    manager = _manager()
+
+    task = manager.submit(lambda: {'total': 1})
+    assert task['status'] == 'pending'
+
+    done = manager.wait(task['task_id'], timeout=2)
+    assert done['status'] == 'succeeded'
+    assert done['result'] == {'total': 1}
+    manager.shutdown()
+
+
+def test_failed_task_records_error():
+    manager = _manager()
+
+    def fail():
+        raise RuntimeError('LinkedIn indisponível')
+
+    task = manager.wait(manager.submit(fail)['task_id'], timeout=2)
+    assert task['status'] == 'failed'
+    assert task['error'] == 'LinkedIn indisponível'
+    manager.shutdown()
+
+
+def test_rejects_tasks_above_limit():
+    manager = _manager(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    manager.submit(lambda: release.wait(2))
+    with pytest.raises(TaskQueueFull):
+        manager.submit(lambda: None)
+
+    release.set()
+    manager.shutdown(wait=True)
+
+
+def test_task_is_visible_from_another_worker(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / 'cache.db'), prefix='t:')
+    worker_a = _manager(backend=lambda: backend)
+    worker_b = _manager(backend=lambda: backend)
+    release = threading.Event()
+
+    task_id = worker_a.submit(lambda: release.wait(2) and 'ok')['task_id']
+    assert worker_b.get(task_id)['status'] in ('pending', 'running')
+    assert worker_b.get('0' * 32) is None
+
+    threading.Timer(0.1, release.set).start()
+    task = worker_b.wait(task_id, timeout=2)
+    assert task['status'] == 'succeeded'
+    assert task['result'] == 'ok'
+    worker_a.shutdown()
+
+
+def test_async_search_endpoint(monkeypatch):
+    from main import create_app
+    from jobs.services import JobService
+
+    def fake_search(self, request):
+        return {'success': True, 'jobs': [], 'total': 0, 'query': request.query, 'timestamp': 'agora'}
+
+    monkeypatch.setattr(JobService, 'search_jobs', fake_search)
+    client = create_app().test_client()
+    headers = {'X-API-Key': API_KEY, 'Prefer': 'respond-async'}
+
+    response = client.post('/api/v1/jobs/', json={'query': 'python'}, headers=headers)
+    assert response.status_code == 202
+    assert response.headers['Location'] == response.get_json()['status_url']
+
+    response = client.get(response.headers['Location'] + '?wait=2', headers=headers)
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body['status'] == 'succeeded'
+    assert body['result']['query'] == 'python'
+
+    response = client.get('/api/v1/jobs/tasks/' + '0' * 32, headers=headers)
+    assert response.status_code == 404
+    assert response.get_json()['error'] == 'task_not_found'
+    response = client.get('/api/v1/jobs/tasks/x', headers=headers)
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'validation_error'
+
+
+def test_async_search_runs_synchronously_without_shared_state(monkeypatch):
+    from main import create_app
+    from jobs import services
+    from jobs.services import JobService
+
+    def fake_search(self, request):
+        return {'success': True, 'jobs': [], 'total': 0, 'query': request.query, 'timestamp': '2024-01-01T00:00:00'}
+
+    monkeypatch.setattr(JobService, 'search_jobs', fake_search)
+    monkeypatch.setattr(services._search_tasks, 'backend', lambda: None)
+    client = create_app().test_client()
+    headers = {'X-API-Key': API_KEY, 'Prefer': 'respond-async'}
+
+    response = client.post('/api/v1/jobs/', json={'query': 'python'}, headers=headers)
+
+    assert response.status_code == 200
+    assert 'Preference-Applied' not in response.headers
+    assert response.get_json()['query'] == 'python'